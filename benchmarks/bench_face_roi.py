@@ -0,0 +1,95 @@
+# benchmarks/bench_face_roi.py
+"""
+얼굴 ROI crop vs 전체 프레임 FaceMesh 비교 측정
+
+  - --source 있음 : 녹화 영상/이미지 폴더를 GazeTracker 로 처리 (ROI 추적 on/off)
+                    → 실제 추적 비율과 프레임당 시간
+  - --source 없음 : 가짜 프레임에서 입력 크기만 바꿔 FaceMesh 1회 비용 비교
+                    (얼굴이 없어 추적은 안 걸림 → 입력 크기에 따른 비용만)
+
+실행: python -m benchmarks.bench_face_roi --source interview.mp4 --frames 300
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from modules.face_roi import FaceROITracker
+from modules.gaze.gaze_module import GazeTracker
+
+RESOLUTIONS = ((640, 480), (1280, 720), (1920, 1080))
+
+
+def _ms(fn, frames):
+    times = []
+    for frame in frames:
+        started = time.perf_counter()
+        fn(frame)
+        times.append((time.perf_counter() - started) * 1000.0)
+    return statistics.fmean(times)
+
+
+def run_synthetic(count, crop):
+    rng = np.random.default_rng(0)
+    for w, h in RESOLUTIONS:
+        frames = [rng.integers(0, 256, (h, w, 3), dtype=np.uint8) for _ in range(count)]
+        x1, y1 = (w - crop) // 2, (h - crop) // 2
+
+        # 그래프는 입력 크기별로 따로 (내부 상태가 섞이지 않도록)
+        full = GazeTracker().face_mesh
+        cropped = GazeTracker().face_mesh
+        full.process(frames[0])
+        cropped.process(np.ascontiguousarray(frames[0][y1:y1 + crop, x1:x1 + crop]))
+
+        full_ms = _ms(full.process, frames)
+        crop_ms = _ms(lambda f: cropped.process(np.ascontiguousarray(f[y1:y1 + crop, x1:x1 + crop])), frames)
+        print(f"{w}x{h:<5} | full {full_ms:7.2f} ms | crop {crop}px {crop_ms:7.2f} ms | x{crop_ms / full_ms:.2f}")
+
+
+def run_source(source, count):
+    from modules.camera.frame_source import open_source
+
+    src = open_source(source)
+    if not src.open():
+        raise SystemExit(f"cannot open source: {source}")
+    frames = []
+    while len(frames) < count:
+        ok, frame, _ = src.read()
+        if not ok:
+            if src.exhausted:
+                break
+            continue
+        frames.append(frame)
+    src.release()
+    if not frames:
+        raise SystemExit(f"no frames in source: {source}")
+
+    h, w = frames[0].shape[:2]
+    for label, use_roi in (("full", False), ("roi", True)):
+        tracker = GazeTracker()
+        roi = FaceROITracker() if use_roi else None
+        ms = _ms(lambda f: tracker.process_frame(f, draw=False, roi=roi), frames)
+        extra = ""
+        if roi is not None:
+            s = roi.stats()
+            extra = f" | tracked {s['tracked_ratio'] * 100:.0f}% (re-detect {s['lost']})"
+        print(f"{w}x{h} {label:4} | {ms:7.2f} ms/frame{extra}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=None, help="동영상 파일 / 이미지 폴더 (없으면 가짜 프레임)")
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--crop", type=int, default=320, help="가짜 프레임 모드의 crop 한 변(px)")
+    args = parser.parse_args()
+
+    if args.source:
+        run_source(args.source, args.frames)
+    else:
+        run_synthetic(args.frames, args.crop)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_frame_wait.py
+"""
+busy-spin(poll) vs 블로킹 대기(wait) 비교 측정
+
+카메라 없이 FrameBus 에 15fps 로 가짜 프레임을 올리고,
+분석 스레드 4개를 흉내 내는 소비자가 프레임을 받아 처리하는 동안
+  - 프로세스 CPU 사용률 (idle: 처리 없음 / busy: 프레임당 work_ms 처리)
+  - 프레임 1장당 지연 (publish → 처리 완료)
+를 잰다.
+
+실행: python -m benchmarks.bench_frame_wait --seconds 5 --work-ms 20
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+from modules.camera.frame_bus import FrameBus
+
+
+def _burn(ms):
+    """GIL 을 잡고 도는 파이썬 코드 흉내 (랜드마크 후처리 등)"""
+    end = time.perf_counter() + ms / 1000.0
+    while time.perf_counter() < end:
+        pass
+
+
+def run(mode, consumers=4, fps=15, seconds=5.0, work_ms=0.0):
+    bus = FrameBus(capacity=8)
+    running = True
+    latencies = []
+    lat_lock = threading.Lock()
+
+    def consumer(name):
+        frames = bus.subscribe(name)
+        while running:
+            item = frames.poll() if mode == "spin" else frames.wait(timeout=0.1)
+            if item is None:
+                continue
+            _, published_at = item
+            if work_ms:
+                _burn(work_ms)
+            done = time.perf_counter()
+            with lat_lock:
+                latencies.append((done - published_at) * 1000.0)
+
+    threads = [threading.Thread(target=consumer, args=(f"c{i}",), daemon=True)
+               for i in range(consumers)]
+    for t in threads:
+        t.start()
+
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+    interval = 1.0 / fps
+    next_ts = wall0
+    while time.perf_counter() - wall0 < seconds:
+        bus.publish(time.perf_counter())
+        next_ts += interval
+        time.sleep(max(0.0, next_ts - time.perf_counter()))
+
+    cpu = time.process_time() - cpu0
+    wall = time.perf_counter() - wall0
+    running = False
+    for t in threads:
+        t.join(timeout=1.0)
+
+    lat = sorted(latencies)
+    return {
+        "mode": mode,
+        "cpu_percent": cpu / wall * 100.0,
+        "frames": len(lat),
+        "latency_mean_ms": statistics.fmean(lat) if lat else 0.0,
+        "latency_p95_ms": lat[int(len(lat) * 0.95) - 1] if lat else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--fps", type=int, default=15)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--work-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    for label, work in (("idle", 0.0), ("busy", args.work_ms)):
+        for mode in ("spin", "wait"):
+            r = run(mode, args.consumers, args.fps, args.seconds, work)
+            print(f"[{label:4}] {mode:4} | CPU {r['cpu_percent']:6.1f}% | "
+                  f"frames {r['frames']:4d} | "
+                  f"latency mean {r['latency_mean_ms']:6.2f}ms "
+                  f"p95 {r['latency_p95_ms']:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# benchmarks/bench_holistic.py
+"""
+분석기별 MediaPipe 그래프 4개(separate) vs Holistic 1개(holistic) 비교 측정
+
+같은 프레임들에 대해
+  - separate : Pose + FaceMesh(gaze) + Hands + FaceDetection(expression) 를 매 프레임 모두 실행
+  - holistic : Holistic 1회 추론 → 같은 후처리(process_landmarks 등)로 분배
+의 프레임당 처리 시간(ms/frame)과 메모리(RSS)를 잰다.
+메모리는 그래프끼리 섞이지 않도록 설정마다 별도 프로세스에서 측정한다.
+
+입력이 없으면 가짜 프레임(노이즈)을 쓴다 → 사람이 없어 검출만 반복되는 경우.
+실제 비교는 녹화 영상/이미지 폴더로:
+
+실행: python -m benchmarks.bench_holistic --source interview.mp4 --frames 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import load_frames, rss_mb
+
+ENGINES = ("separate", "holistic")
+
+
+def _build(engine):
+    """프레임 1장을 처리하는 함수 (대시보드 없이 결과만, draw=False)"""
+    from modules.pose.pose_module import PoseAnalyzer
+    from modules.gaze.gaze_module import GazeTracker
+    from modules.hands.hands_module import HandsAnalyzer
+    from modules.expression.expression_analyzer import ExpressionAnalyzer
+    from modules.camera.frame_views import FrameViews
+    from modules.landmarks import landmark_array
+
+    pose = PoseAnalyzer()
+    tracker = GazeTracker()
+    hands = HandsAnalyzer()
+    expression = ExpressionAnalyzer(tmp_path="bench_holistic_tmp.jpg")
+
+    if engine == "separate":
+        def step(frame):
+            views = FrameViews(frame)
+            pose.process_frame(frame, views.rgb, draw=False)
+            tracker.process_frame(frame, views.rgb, draw=False)
+            hands.process_frame(frame, views.rgb, draw=False)
+            expression.process_frame(frame, views.rgb)
+        return step
+
+    from modules.holistic.holistic_engine import HolisticEngine
+
+    holistic = HolisticEngine()
+
+    def step(frame):
+        views = FrameViews(frame)
+        h, w = views.height, views.width
+        result = holistic.process(frame, views.rgb)
+        if result.face_landmarks:
+            face = landmark_array(result.face_landmarks)
+            tracker.update_from_landmarks(face, w, h)
+            box = ExpressionAnalyzer.box_from_landmarks(face, w, h)
+            expression.process_box(frame, box)
+        pose.process_landmarks(frame, result.pose_landmarks, draw=False)
+        hands.process_landmarks(frame, [result.left_hand_landmarks, result.right_hand_landmarks], draw=False)
+    return step
+
+
+def run_worker(engine, source, count, width, height, warmup):
+    """자식 프로세스: 한 설정만 측정해서 JSON 한 줄 출력"""
+    frames = load_frames(source, count, width, height)
+    _, base_peak = rss_mb()
+
+    step = _build(engine)
+    for frame in frames[:warmup]:
+        step(frame)  # 그래프 생성 + 첫 추론 비용 제외
+
+    times = []
+    for frame in frames:
+        started = time.perf_counter()
+        step(frame)
+        times.append((time.perf_counter() - started) * 1000.0)
+
+    current, peak = rss_mb()
+    if os.path.exists("bench_holistic_tmp.jpg"):
+        os.remove("bench_holistic_tmp.jpg")
+    times.sort()
+    print(json.dumps({
+        "engine": engine,
+        "frames": len(times),
+        "ms_mean": statistics.fmean(times),
+        "ms_p50": times[len(times) // 2],
+        "ms_p95": times[max(0, int(len(times) * 0.95) - 1)],
+        "rss_mb": current,
+        "rss_peak_mb": peak,
+        "rss_models_mb": peak - base_peak,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=None, help="동영상 파일 / 이미지 폴더 (없으면 가짜 프레임)")
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--engine", choices=ENGINES, action="append", default=None)
+    parser.add_argument("--worker", choices=ENGINES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.source, args.frames, args.width, args.height, args.warmup)
+        return
+
+    results = []
+    for engine in args.engine or ENGINES:
+        cmd = [sys.executable, "-m", "benchmarks.bench_holistic", "--worker", engine,
+               "--frames", str(args.frames), "--width", str(args.width),
+               "--height", str(args.height), "--warmup", str(args.warmup)]
+        if args.source:
+            cmd += ["--source", args.source]
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        r = json.loads(out.strip().splitlines()[-1])
+        results.append(r)
+
+        rss = f"{r['rss_mb']:7.1f}MB" if r["rss_mb"] is not None else "    n/a"
+        print(f"{engine:9} | {r['ms_mean']:7.2f} ms/frame (p50 {r['ms_p50']:6.2f} p95 {r['ms_p95']:6.2f}) | "
+              f"RSS {rss} peak {r['rss_peak_mb']:7.1f}MB (models +{r['rss_models_mb']:.1f}MB) | "
+              f"frames {r['frames']}")
+
+    if len(results) == 2:
+        sep, hol = results
+        print(f"holistic / separate: time x{hol['ms_mean'] / sep['ms_mean']:.2f}, "
+              f"peak RSS {hol['rss_peak_mb'] - sep['rss_peak_mb']:+.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
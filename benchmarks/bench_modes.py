@@ -0,0 +1,100 @@
+# benchmarks/bench_modes.py
+"""
+실행 모드별 처리량 — thread (분석 스레드 4개) vs async (이벤트 루프 + 추론 executor)
+
+같은 입력을 main.py --headless --lockstep (드롭 없음) 으로 모드마다 별도 프로세스에서 돌려
+  - fps      : 처리한 프레임 수 / (종료 시각 - 분석기 준비 시각)   ← warm-up / import 제외
+  - results  : sink 에 나온 분석 결과 수 (모드끼리 같아야 함)
+  - p95      : 분석기별 캡처 → 결과 지연 p95 (sink 의 latency_ms)
+를 비교한다. 입력이 없으면 고정 시드 가짜 프레임을 이미지 폴더로 만들어 쓴다.
+
+실행: python -m benchmarks.bench_modes --source interview.mp4 --frames 300 --every-frame
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import cv2
+
+from benchmarks.common import load_frames, percentile
+
+MODES = ("thread", "async")
+
+
+def write_frames(directory, count, width, height):
+    for i, frame in enumerate(load_frames(None, count, width, height)):
+        cv2.imwrite(os.path.join(directory, f"{i:05d}.png"), frame)
+
+
+def run_mode(mode, source, every_frame, workers, sink):
+    cmd = [sys.executable, "main.py", "--headless", "--no-voice", "--lockstep", "--gaze-frames",
+           "--mode", mode, "--source", source, "--sink", sink]
+    if every_frame:
+        cmd += [arg for name in ("pose", "gaze", "hands", "expression") for arg in ("--rate", f"{name}=0")]
+    if workers and mode == "async":
+        cmd += ["--workers", str(workers)]
+
+    started = time.perf_counter()
+    subprocess.run(cmd, check=True, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+
+    results, latency, ready, frames = 0, {}, None, set()
+    with open(sink, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if record["type"] == "result":
+                results += 1
+                frames.add(record["seq"])
+                latency.setdefault(record["analyzer"], []).append(record["latency_ms"])
+            elif record["analyzer"] == "startup":
+                ready = record["marks"]["ready"]
+
+    busy = elapsed - (ready or 0.0)
+    return {
+        "mode": mode,
+        "frames": len(frames),
+        "results": results,
+        "seconds": busy,
+        "fps": len(frames) / busy if busy > 0 else None,
+        "p95_ms": {name: percentile(sorted(v), 95) for name, v in sorted(latency.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=None, help="동영상 파일 / 이미지 폴더 (없으면 가짜 프레임)")
+    parser.add_argument("--frames", type=int, default=120, help="가짜 프레임 수")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--every-frame", action="store_true", help="모든 분석기를 매 프레임 실행 (--rate NAME=0)")
+    parser.add_argument("--workers", type=int, default=None, help="async 추론 executor 크기")
+    parser.add_argument("--mode", choices=MODES, action="append", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.source
+        if source is None:
+            source = os.path.join(tmp, "frames")
+            os.makedirs(source)
+            write_frames(source, args.frames, args.width, args.height)
+
+        results = []
+        for mode in args.mode or MODES:
+            r = run_mode(mode, source, args.every_frame, args.workers, os.path.join(tmp, f"{mode}.jsonl"))
+            results.append(r)
+            p95 = " ".join(f"{name} {ms:.0f}" for name, ms in r["p95_ms"].items())
+            print(f"{mode:7} | {r['fps']:7.1f} fps | {r['frames']} frames / {r['results']} results "
+                  f"in {r['seconds']:.2f}s | p95 ms: {p95}")
+
+    if len(results) == 2:
+        thread, asynchronous = results
+        print(f"async / thread: x{asynchronous['fps'] / thread['fps']:.2f} fps")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_rescore.py
+"""
+오프라인 재채점 속도 — 1시간 분량 기록을 몇 ms 에 다시 채점하나
+
+가짜 원시값(시선 metric / EAR / 얼굴 검출 / 자세 좌표)으로 --minutes 분 × --fps 기록을 만들어
+modules.recorder 로 저장한 뒤, 기록 읽기(memmap → 배열) / 시선 재채점 / 자세 재채점 / sweep 시간을 잰다.
+
+실행: python -m benchmarks.bench_rescore --minutes 60 --fps 30
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from modules.recorder import RecorderSink
+from modules.rescore import load_gaze, load_pose, rescore_gaze, rescore_pose, sweep
+
+
+def synthesize(directory, frames, fps, pose_stride=3, seed=0):
+    """대부분 정면 + 가끔 좌우 / 위아래 이탈, 5% 깜빡임, 3% 얼굴 놓침, 1분마다 재보정"""
+    rng = np.random.default_rng(seed)
+    ts = np.arange(frames) / fps
+    away_x = np.repeat(rng.choice([0.0, -0.06, 0.06], size=frames // 45 + 1, p=[0.8, 0.1, 0.1]), 45)[:frames]
+    away_y = np.repeat(rng.choice([0.0, -0.03, 0.03], size=frames // 60 + 1, p=[0.85, 0.1, 0.05]), 60)[:frames]
+    metric_x = away_x + rng.normal(0, 0.01, frames)
+    metric_y = away_y + rng.normal(0, 0.005, frames)
+    ear = np.where(rng.random(frames) < 0.05, 0.08, 0.3 + rng.normal(0, 0.02, frames))
+    face = rng.random(frames) > 0.03
+    resets = (ts // 60).astype(int) + 1
+
+    sink = RecorderSink(directory, chunk_rows=4096)
+    for i in range(frames):
+        sink.write({
+            "type": "result", "analyzer": "gaze", "seq": i, "ts": ts[i],
+            "face": face[i], "ear": ear[i], "metric_x": metric_x[i], "metric_y": metric_y[i],
+            "calib_x": 0.0, "calib_y": 0.0, "blink_threshold": 0.18, "measuring": True, "resets": resets[i],
+        })
+        if i % pose_stride == 0:
+            coords = 0.5 + rng.normal(0, 0.01, (33, 3))
+            sink.write({"type": "result", "analyzer": "pose", "seq": i, "ts": ts[i], "motion": 0.0, "coords": coords})
+    sink.close()
+
+
+def timed(fn, *args, repeat=5, **kwargs):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=60.0, help="기록 길이(분)")
+    parser.add_argument("--fps", type=float, default=30.0, help="시선 기록 fps (자세는 1/3)")
+    parser.add_argument("--record", default=None, help="기록 디렉터리 (기본: 임시 디렉터리)")
+    args = parser.parse_args()
+
+    frames = int(args.minutes * 60 * args.fps)
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.record or os.path.join(tmp, "rec")
+        started = time.perf_counter()
+        synthesize(directory, frames, args.fps)
+        print(f"기록 {frames} 프레임 ({args.minutes:.0f}분 @ {args.fps:.0f}fps) 생성 {time.perf_counter() - started:.1f}s")
+
+        load_ms, gaze = timed(load_gaze, directory)
+        _, pose = timed(load_pose, directory, repeat=1)
+        gaze_ms, report = timed(rescore_gaze, gaze)
+        pose_ms, pose_report = timed(rescore_pose, pose)
+        values = np.round(np.arange(0.01, 0.0601, 0.0025), 4)
+        sweep_ms, results = timed(sweep, directory, "threshold_x", values, repeat=1)
+
+        print(f"   읽기 (memmap → 배열)  {load_ms:8.1f} ms")
+        print(f"   시선 재채점          {gaze_ms:8.1f} ms  → {report['final_gaze_score']}점, "
+              f"이탈 {report['deviation_count']}회")
+        print(f"   자세 재채점          {pose_ms:8.1f} ms  → 움직임 {pose_report['moving_ratio']:.1f}%")
+        print(f"   sweep ({len(values)}개)        {sweep_ms:8.1f} ms  "
+              f"({sweep_ms / len(values):.1f} ms / 값, 점수 {results[0][1]['final_gaze_score']}"
+              f" ~ {results[-1][1]['final_gaze_score']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_sessions.py
+"""
+멀티 세션 부하 테스트 — 목표 fps 를 지키며 코어당 몇 세션까지 돌릴 수 있나
+
+세션 수를 1개씩 늘려 가며 SessionHost 로 duration 초 동안 돌리고,
+모든 세션의 시선(gaze, 매 프레임 분석) 달성 fps 가 목표의 --tolerance 이상이면 통과.
+마지막으로 통과한 세션 수 / CPU 코어 수 = 코어당 최대 세션 수.
+
+  - --source 있음 : 녹화 영상을 세션마다 반복 재생 (실시간 스트림처럼 --fps 속도로)
+  - --source 없음 : 가짜 프레임 (얼굴이 없어 추적/감정 단계가 빠짐 → 실제보다 낙관적)
+
+실행: python -m benchmarks.bench_sessions --source interview.mp4 --fps 15 --duration 10
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from modules.camera.frame_source import FrameSource
+from modules.session import DEFAULT_CALIBRATE_AFTER, Session, SessionHost, print_host_report
+
+
+class NoiseSource(FrameSource):
+    """고정된 가짜 프레임 몇 장을 돌려 가며 (디코딩 비용 없음)"""
+
+    def __init__(self, width=640, height=480, count=8):
+        super().__init__()
+        rng = np.random.default_rng(0)
+        self.frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+        self.index = 0
+        self.name = f"noise:{width}x{height}"
+
+    def read(self):
+        frame = self.frames[self.index % len(self.frames)]
+        self.index += 1
+        return True, frame, None
+
+
+def run_level(count, args):
+    host = SessionHost(workers=args.workers)
+    for i in range(count):
+        source = args.source if args.source else NoiseSource()
+        # 실제 면접처럼 보정 후 시선 측정까지 (보정이 없으면 시선 누적 / 점수 계산이 빠짐)
+        host.add(Session(f"s{i}", source, fps=args.fps, loop=True, calibrate_after=DEFAULT_CALIBRATE_AFTER))
+    report = host.run(args.duration)
+
+    gaze_fps = [s["analyzers"]["gaze"]["achieved_fps"] for s in report["sessions"].values()]
+    p95 = [s["analyzers"]["gaze"]["total_p95_ms"] or 0.0 for s in report["sessions"].values()]
+    ok = min(gaze_fps) >= args.fps * args.tolerance
+    return ok, min(gaze_fps), max(p95), report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=None, help="동영상 파일 (없으면 가짜 프레임)")
+    parser.add_argument("--fps", type=float, default=15.0, help="세션별 목표 fps")
+    parser.add_argument("--duration", type=float, default=8.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--workers", type=int, default=None, help="분석 워커 수 (기본: CPU 코어 수)")
+    parser.add_argument("--max-sessions", type=int, default=None, help="최대 시도 세션 수 (기본: 코어 수 × 4)")
+    parser.add_argument("--tolerance", type=float, default=0.9, help="목표 fps 대비 통과 비율")
+    parser.add_argument("--verbose", action="store_true", help="단계별 세션 리포트 출력")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    limit = args.max_sessions or cores * 4
+    best = 0
+
+    print(f"cores {cores} | target {args.fps:.0f} fps (gaze ≥ {args.fps * args.tolerance:.1f}) "
+          f"| {args.duration:.0f}s per level")
+    for count in range(1, limit + 1):
+        ok, worst_fps, worst_p95, report = run_level(count, args)
+        print(f"{count:3d} sessions | worst gaze {worst_fps:5.1f} fps | worst p95 {worst_p95:7.0f} ms "
+              f"| {'ok' if ok else 'FAIL'}")
+        if args.verbose:
+            print_host_report(report)
+        if not ok:
+            break
+        best = count
+
+    print(f"max sessions at {args.fps:.0f} fps: {best} ({best / cores:.2f} per core)")
+
+
+if __name__ == "__main__":
+    main()
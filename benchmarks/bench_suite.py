@@ -0,0 +1,234 @@
+# benchmarks/bench_suite.py
+"""
+분석기별 / 전체 파이프라인 벤치마크 + 기준선(JSON) 비교
+
+카메라 없이 고정 시드 가짜 프레임(또는 --source 녹화 영상)으로
+  - pose       : PoseAnalyzer.process_frame
+  - gaze       : GazeTracker.process_frame + GazeSession (얼굴 ROI 추적 포함)
+  - hands      : HandsAnalyzer.process_frame (hands 워커와 같은 호출)
+  - expression : 얼굴 탐지 → crop → 감정 분석 (감정 모델이 없으면 탐지까지)
+  - pipeline   : 위 4개를 같은 FrameViews 로 연달아 (세션 1개의 프레임당 비용)
+  - stabilizer : EmotionStabilizer (감정 확률 이동평균, 해상도 무관)
+를 해상도별로 돌려 fps / 지연 p50·p95·p99 / 최대 RSS 를 잰다.
+RSS 가 섞이지 않도록 (분석기, 해상도) 마다 별도 프로세스에서 측정한다.
+
+  --save baseline.json    : 결과를 기준선으로 저장
+  --compare baseline.json : 기준선 대비 fps 하락 / p95 증가 / RSS 증가가 허용치를 넘으면 REGRESSION (종료 코드 1)
+
+가짜 프레임에는 얼굴 / 사람이 없어 검출 단계만 반복된다 → 실제 비용은 --source 로.
+
+실행: python -m benchmarks.bench_suite --save baseline.json
+      python -m benchmarks.bench_suite --compare baseline.json --tolerance 0.15
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.common import load_frames, percentile, rss_mb
+
+TARGETS = ("pose", "gaze", "hands", "expression", "pipeline", "stabilizer")
+RESOLUTIONS = ("640x480", "1280x720", "1920x1080")
+RESOLUTION_FREE = ("stabilizer",)
+
+# 비교 항목: (키, 클수록 좋은가)
+CHECKS = (("fps", True), ("ms_p95", False), ("rss_peak_mb", False))
+
+
+def _build(target):
+    """프레임 1장을 처리하는 함수 (대시보드 없이 결과만)"""
+    from modules.analyzer_steps import ANALYZERS, STEPS
+    from modules.camera.frame_views import FrameViews
+
+    tmp_path = f"bench_suite_{os.getpid()}.jpg"
+
+    if target == "stabilizer":
+        from modules.expression.emotion_stabilizer import EmotionStabilizer
+        from modules.recorder import EMOTIONS
+        stabilizer = EmotionStabilizer()
+
+        def step(item):
+            stabilizer({"emotions": dict(zip(EMOTIONS, item))})
+        return step, tmp_path
+
+    if target == "pipeline":
+        from modules.face_roi import FaceROITracker
+        roi = FaceROITracker()  # 세션처럼 gaze / expression 이 얼굴 박스 공유
+        steps = [
+            STEPS[name](roi=roi) if name == "gaze"
+            else STEPS[name](roi=roi, tmp_path=tmp_path) if name == "expression"
+            else STEPS[name]()
+            for name in ANALYZERS
+        ]
+    else:
+        steps = [STEPS[target](tmp_path=tmp_path) if target == "expression" else STEPS[target]()]
+
+    def step(frame):
+        views = FrameViews(frame)
+        for run in steps:
+            run(views)
+    return step, tmp_path
+
+
+def _inputs(target, source, count, width, height):
+    if target == "stabilizer":
+        rng = np.random.default_rng(0)
+        return list(rng.dirichlet(np.ones(7), size=count))
+    return load_frames(source, count, width, height, resize=True)
+
+
+def run_worker(target, source, count, width, height, warmup):
+    """자식 프로세스: (분석기, 해상도) 하나만 측정해서 JSON 한 줄 출력"""
+    inputs = _inputs(target, source, count, width, height)
+    _, base_peak = rss_mb()
+
+    step, tmp_path = _build(target)
+    for item in inputs[:warmup]:
+        step(item)  # 그래프 생성 + 첫 추론 비용 제외
+
+    times = []
+    started_all = time.perf_counter()
+    for item in inputs:
+        started = time.perf_counter()
+        step(item)
+        times.append((time.perf_counter() - started) * 1000.0)
+    elapsed = time.perf_counter() - started_all
+
+    current, peak = rss_mb()
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    times.sort()
+    print(json.dumps({
+        "target": target,
+        "resolution": None if target in RESOLUTION_FREE else f"{width}x{height}",
+        "frames": len(times),
+        "fps": len(times) / elapsed if elapsed > 0 else None,
+        "ms_mean": statistics.fmean(times),
+        "ms_p50": percentile(times, 50),
+        "ms_p95": percentile(times, 95),
+        "ms_p99": percentile(times, 99),
+        "rss_mb": current,
+        "rss_peak_mb": peak,
+        "rss_models_mb": peak - base_peak,
+    }))
+
+
+def run_suite(args):
+    results = {}
+    for target in args.target or TARGETS:
+        resolutions = [None] if target in RESOLUTION_FREE else (args.resolution or RESOLUTIONS)
+        for resolution in resolutions:
+            width, height = (640, 480) if resolution is None else map(int, resolution.split("x"))
+            count = args.frames * 20 if target in RESOLUTION_FREE else args.frames
+            cmd = [sys.executable, "-m", "benchmarks.bench_suite", "--worker", target,
+                   "--frames", str(count), "--width", str(width), "--height", str(height),
+                   "--warmup", str(args.warmup)]
+            if args.source:
+                cmd += ["--source", args.source]
+            out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+
+            key = target if resolution is None else f"{target}@{resolution}"
+            results[key] = r
+            print(f"{key:<22} | {r['fps']:8.1f} fps | p50 {r['ms_p50']:7.2f} p95 {r['ms_p95']:7.2f} "
+                  f"p99 {r['ms_p99']:7.2f} ms | peak RSS {r['rss_peak_mb']:7.1f}MB "
+                  f"(models +{r['rss_models_mb']:.1f}MB)")
+    return results
+
+
+def _meta(args):
+    return {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "source": args.source,
+        "frames": args.frames,
+        "warmup": args.warmup,
+    }
+
+
+def compare(baseline, meta, results, tolerance, rss_tolerance):
+    """기준선 대비 변화율 출력 → 회귀 항목 [(키, 항목, 기준, 현재), ...]"""
+    regressions = []
+    print(f"\n📏 기준선 비교 ({baseline['meta']['created']}, 허용 {tolerance:.0%} / RSS {rss_tolerance:.0%})")
+    for meta_key in ("source", "frames", "machine", "cpu_count"):
+        if baseline["meta"].get(meta_key) != meta.get(meta_key):
+            print(f"   ⚠️ {meta_key} 다름: 기준 {baseline['meta'].get(meta_key)} / 현재 {meta.get(meta_key)}")
+
+    for key, r in results.items():
+        base = baseline["results"].get(key)
+        if base is None:
+            print(f"   {key:<22} (기준선에 없음)")
+            continue
+        parts = []
+        for name, higher_is_better in CHECKS:
+            old, new = base.get(name), r.get(name)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            limit = rss_tolerance if name.startswith("rss") else tolerance
+            worse = -change if higher_is_better else change
+            flag = ""
+            if worse > limit:
+                flag = " ❌"
+                regressions.append((key, name, old, new))
+            parts.append(f"{name} {change:+6.1%}{flag}")
+        print(f"   {key:<22} " + " | ".join(parts))
+
+    if regressions:
+        print(f"❌ REGRESSION {len(regressions)}건")
+        for key, name, old, new in regressions:
+            print(f"   {key} {name}: {old:.2f} → {new:.2f}")
+    else:
+        print("✅ 회귀 없음")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default=None, help="동영상 파일 / 이미지 폴더 (없으면 가짜 프레임)")
+    parser.add_argument("--frames", type=int, default=60, help="측정 프레임 수 (stabilizer 는 ×20)")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--target", choices=TARGETS, action="append", default=None,
+                        help="측정 대상 (여러 번 지정 가능, 기본: 전부)")
+    parser.add_argument("--resolution", action="append", default=None, metavar="WxH",
+                        help=f"해상도 (여러 번 지정 가능, 기본: {' '.join(RESOLUTIONS)})")
+    parser.add_argument("--save", default=None, metavar="PATH", help="결과를 기준선 JSON 으로 저장")
+    parser.add_argument("--compare", default=None, metavar="PATH", help="기준선 JSON 과 비교")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="fps / p95 허용 악화 비율")
+    parser.add_argument("--rss-tolerance", type=float, default=0.10, help="최대 RSS 허용 증가 비율")
+    parser.add_argument("--worker", choices=TARGETS, help=argparse.SUPPRESS)
+    parser.add_argument("--width", type=int, default=640, help=argparse.SUPPRESS)
+    parser.add_argument("--height", type=int, default=480, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.source, args.frames, args.width, args.height, args.warmup)
+        return
+
+    meta = _meta(args)
+    results = run_suite(args)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준선 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(baseline, meta, results, args.tolerance, args.rss_tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/common.py
+"""벤치마크 공용: 입력 프레임 / 메모리 측정 / 백분위"""
+
+import math
+import resource
+import sys
+
+import numpy as np
+
+
+def rss_mb():
+    """(현재 RSS, 최대 RSS) MB — psutil 이 없으면 최대값만"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0  # Linux: KB
+    if sys.platform == "darwin":
+        peak /= 1024.0  # macOS: bytes
+    try:
+        import psutil
+        current = psutil.Process().memory_info().rss / (1024.0 * 1024.0)
+    except ImportError:
+        current = None
+    return current, peak
+
+
+def load_frames(source, count, width, height, resize=False):
+    """
+    source 없음 : 고정 시드 노이즈 프레임 (매번 같은 입력)
+    source 있음 : 동영상 / 이미지 폴더 앞쪽 count 장 (resize=True 면 width × height 로 맞춤)
+    """
+    if source is None:
+        rng = np.random.default_rng(0)
+        return [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+    import cv2
+    from modules.camera.frame_source import open_source
+
+    src = open_source(source)
+    if not src.open():
+        raise SystemExit(f"cannot open source: {source}")
+    frames = []
+    while len(frames) < count:
+        ok, frame, _ = src.read()
+        if not ok:
+            if src.exhausted:
+                break
+            continue
+        if resize and frame.shape[:2] != (height, width):
+            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+        frames.append(frame)
+    src.release()
+    if not frames:
+        raise SystemExit(f"no frames in source: {source}")
+    return frames
+
+
+def percentile(sorted_values, q):
+    """정렬된 값의 q (0~100) 번째 (nearest-rank)"""
+    if not sorted_values:
+        return None
+    rank = max(1, int(math.ceil(len(sorted_values) * q / 100.0)))
+    return sorted_values[rank - 1]
@@ -1,174 +1,523 @@
 # main.py
+import argparse
 import time
+
+# 시작 시각 기준 (다른 무거운 import 보다 먼저) — mediapipe 는 분석 스레드가 각자 로드
+from modules.startup import startup, print_startup_report
 import cv2
-import numpy as np
 import os
 
 # ===============================
-# 🔥 공유 RUNNING 플래그
+# 🔥 공유 종료 토큰 / 수명 관리
 # ===============================
-from modules.shared_flags import RUNNING
+import modules.shared_flags as flags
+from modules.lifecycle import print_shutdown_report
+import modules.result_sink as result_sink
+from modules.recorder import RecorderSink
 
 # ===============================
 # 🔥 단일 카메라 스레드
 # ===============================
-from modules.camera.camera_manager import start_camera_thread
+from modules.camera.camera_manager import start_camera_thread, frame_bus
+from modules.analyzer_steps import ANALYZERS
+from modules.scheduler import analyzer_scheduler, print_schedule_report
+from modules.latency import latency_tracker, print_latency_report
+from modules.face_roi import face_roi
+from modules.dashboard import DashboardRenderer
 
 # ===============================
 # 🔥 모듈별 스레드 & 큐
 # ===============================
-from modules.pose.pose_thread_example import start_pose_thread, result_queue as pose_result_queue
-from modules.gaze.gaze_thread_example import start_gaze_thread, gaze_result_queue
-from modules.expression.expression_thread_example import start_expression_thread, expression_result_queue
-from modules.hands.hand_thread_example import start_hands_thread, hands_result_queue
-from modules.voice.voice_thread_example import start_voice_thread, voice_result_queue
+from modules.pose.pose_thread_example import start_pose_thread, pose_result_slot
+from modules.gaze.gaze_events import event_record, gaze_events, print_event_summary
+from modules.gaze.gaze_thread_example import (
+    start_gaze_thread, gaze_result_slot, set_auto_calibration, set_gaze_frames,
+)
+from modules.expression.expression_thread_example import start_expression_thread, expression_result_slot
+from modules.hands.hand_thread_example import start_hands_thread, hands_result_slot
 
+startup.mark("imports")
 
 # 표정 모듈은 emotion_detector 필요 없음 → None 사용
 # GazeTracker를 표정에 넘기면 detect_faces 없어 오류남 (사용 금지)
 
 
 # ===============================
-# 최신 값만 가져오기
+# 실행 옵션
 # ===============================
-def drain_queue(q):
-    latest = None
-    while not q.empty():
-        latest = q.get()
-    return latest
+# --rate / --stride 로 조절할 수 있는 이름 (holistic = --engine holistic 의 공유 추론)
+SCHEDULED = ANALYZERS + ("holistic",)
+
+
+def schedule_option(value_type):
+    """--rate / --stride 의 NAME=VALUE → (NAME, VALUE) (argparse type=, 잘못되면 parser.error)"""
+    def parse(text):
+        name, sep, value = text.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"NAME=VALUE 형식이어야 함: {text!r}")
+        if name not in SCHEDULED:
+            raise argparse.ArgumentTypeError(f"알 수 없는 분석기 {name!r} (가능: {', '.join(SCHEDULED)})")
+        try:
+            parsed = value_type(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"{name} 값이 {value_type.__name__} 이 아님: {value!r}") from None
+        if parsed < 0:
+            raise argparse.ArgumentTypeError(f"{name} 값은 0 이상: {value!r}")
+        return name, parsed
+    return parse
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AI Mock Interview")
+    parser.add_argument(
+        "--mode", choices=("thread", "process", "async"), default="thread",
+        help="thread: 분석기를 스레드로 실행 / process: 분석기마다 별도 프로세스 (공유 메모리 프레임) / "
+             "async: asyncio 이벤트 루프 1개가 캡처 / 분석 / 음성 / 화면을 task 로 (추론은 고정 크기 executor)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, metavar="N",
+        help="--mode async 추론 executor 스레드 수 (기본: min(분석기 수, 코어 수))",
+    )
+    parser.add_argument(
+        "--source", default="0",
+        help="카메라 번호(기본 0) / 녹화 영상 파일 / 이미지 폴더",
+    )
+    parser.add_argument(
+        "--engine", choices=("separate", "holistic"), default="separate",
+        help="separate: 분석기마다 MediaPipe 그래프 / holistic: Holistic 1회 추론 결과를 분석기들이 공유",
+    )
+    parser.add_argument(
+        "--no-face-roi", action="store_true",
+        help="얼굴 ROI 추적 끄기 (FaceMesh / 표정 분석을 매 프레임 전체 화면에서 실행)",
+    )
+    parser.add_argument(
+        "--headless", action="store_true",
+        help="창 / 오버레이 없이 분석만 (디스플레이 없는 서버). 결과는 --sink 로",
+    )
+    parser.add_argument(
+        "--sink", default=None, metavar="PATH",
+        help="프레임별 분석 결과 + 시선 구간 이벤트 + 종료 리포트를 JSONL 로 저장",
+    )
+    parser.add_argument(
+        "--record", default=None, metavar="DIR",
+        help="프레임별 분석 결과를 열 단위 바이너리로 기록 (modules.recorder.SessionRecording 으로 읽기)",
+    )
+    parser.add_argument(
+        "--record-precision", choices=("float32", "float16"), default="float32",
+        help="--record 측정값 저장 형식",
+    )
+    parser.add_argument(
+        "--gaze-frames", action="store_true",
+        help="--sink 에 프레임별 시선 전체 결과도 기록 (기본: 시선은 구간 이벤트 + 리포트만, --record 에는 항상 기록)",
+    )
+    parser.add_argument(
+        "--calibrate-after", type=float, default=None, metavar="SEC",
+        help="첫 프레임 후 SEC 초 뒤 시선 자동 보정 ('c' 키 대신, 헤드리스 / 녹화 영상용)",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=None, metavar="SEC",
+        help="헤드리스 실행 시간 제한 (없으면 소스가 끝나거나 Ctrl+C 까지)",
+    )
+    parser.add_argument(
+        "--no-voice", action="store_true",
+        help="음성 인식 스레드 끄기 (마이크 없는 환경)",
+    )
+    parser.add_argument(
+        "--display-fps", type=float, default=15.0,
+        help="대시보드 화면 갱신 상한 (fps, 0 = 제한 없음)",
+    )
+    parser.add_argument(
+        "--metrics-port", type=int, default=None, metavar="PORT",
+        help="Prometheus 형식 메트릭을 http://127.0.0.1:PORT/metrics 로 제공 (기본: 끔)",
+    )
+    parser.add_argument(
+        "--profile", default=os.environ.get("INTERVIEW_PROFILE") or None, metavar="DIR",
+        help="스레드별 CPU 샘플링 + tracemalloc → 종료 시 DIR 에 핫스팟 / 메모리 증가 리포트 "
+             "(환경변수 INTERVIEW_PROFILE=DIR 도 가능, 기본: 끔)",
+    )
+    parser.add_argument(
+        "--profile-interval", type=float, default=10.0, metavar="MS",
+        help="--profile 샘플 간격 (ms)",
+    )
+    parser.add_argument(
+        "--profile-snapshot", type=float, default=10.0, metavar="SEC",
+        help="--profile tracemalloc 스냅샷 간격 (초)",
+    )
+    parser.add_argument(
+        "--profile-top", type=int, default=20, metavar="N",
+        help="--profile 리포트 항목 수 (스레드별 / 메모리)",
+    )
+    parser.add_argument(
+        "--no-warmup", action="store_true",
+        help="분석기 warm-up(더미 프레임으로 그래프 미리 생성) 끄기 → 첫 카메라 프레임이 그래프를 만듦",
+    )
+    parser.add_argument(
+        "--warmup-timeout", type=float, default=30.0, metavar="SEC",
+        help="분석기 warm-up 대기 상한 (넘으면 기다리지 않고 시작)",
+    )
+    parser.add_argument(
+        "--lockstep", action="store_true",
+        help="모든 분석기가 프레임을 가져간 뒤 다음 프레임 발행 (오프라인 분석: 드롭 없음, 최대 속도)",
+    )
+    parser.add_argument(
+        "--rate", action="append", default=[], metavar="NAME=FPS", type=schedule_option(float),
+        help="분석기별 목표 fps (예: --rate pose=5 --rate gaze=0, 0 = 매 프레임)",
+    )
+    parser.add_argument(
+        "--stride", action="append", default=[], metavar="NAME=N", type=schedule_option(int),
+        help="분석기별 프레임 간격 (예: --stride expression=8)",
+    )
+    parser.add_argument(
+        "--cpu-budget", type=float, default=None, metavar="CORES",
+        help="분석기 전체 처리 시간 예산 (초당 코어 수, 예: 2.0). 넘으면 gaze 외 분석기부터 건너뜀",
+    )
+    args = parser.parse_args(argv)
+
+    if args.duration is not None and not args.headless:
+        parser.error("--duration 은 --headless 에서만 사용")
+    if args.engine == "holistic" and args.mode != "thread":
+        parser.error("--engine holistic 은 thread 모드에서만 지원")
+    if args.workers is not None and args.mode != "async":
+        parser.error("--workers 는 --mode async 에서만 사용")
+    if args.engine != "holistic" and any(name == "holistic" for name, _ in args.rate + args.stride):
+        parser.error("--rate / --stride holistic=... 은 --engine holistic 에서만 사용")
+    return args
+
+
+def apply_schedule(args):
+    """--rate / --stride / --cpu-budget 을 분석기 스케줄러에 반영"""
+    analyzer_scheduler.cpu_budget = args.cpu_budget
+
+    rates = dict(args.rate)
+    strides = dict(args.stride)
+    if "holistic" in rates or "holistic" in strides:
+        # holistic 은 보통 워커가 시작할 때 gaze 설정으로 등록 → 여기서 먼저 등록해 두면 그대로 씀
+        if "holistic" not in analyzer_scheduler.tasks:
+            analyzer_scheduler.register("holistic", **analyzer_scheduler.config("gaze"))
+    for name in set(rates) | set(strides):
+        current = analyzer_scheduler.config(name)
+        fps = rates[name] if name in rates else current["fps"]
+        stride = strides[name] if name in strides else current["stride"]
+        analyzer_scheduler.configure(name, fps=fps or None, stride=stride or None)
+
+
+def result_slots(voice_result_slot=None):
+    """분석기 이름 → 결과 슬롯 (음성은 켜져 있을 때만)"""
+    slots = {
+        "pose": pose_result_slot,
+        "gaze": gaze_result_slot,
+        "hands": hands_result_slot,
+        "expression": expression_result_slot,
+    }
+    if voice_result_slot is not None:
+        slots["voice"] = voice_result_slot
+    return slots
+
+
+def start_metrics_server(port, voice_result_slot=None):
+    """기존 카운터를 읽기만 하는 로컬 메트릭 엔드포인트 (스크레이프할 때만 계산)"""
+    from modules.metrics_server import (
+        MetricsServer, bus_metrics, latency_metrics, scheduler_metrics, slot_metrics, thread_cpu_metrics,
+    )
+
+    server = MetricsServer(port)
+    server.add_collector(scheduler_metrics(analyzer_scheduler))
+    server.add_collector(bus_metrics(frame_bus))
+    server.add_collector(slot_metrics(result_slots(voice_result_slot)))
+    server.add_collector(latency_metrics(latency_tracker))
+    server.add_collector(thread_cpu_metrics(flags.lifecycle))
+    server.start()
+    flags.lifecycle.add_resource("metrics", server.stop)
+    return server
 
 
 # ===============================
 # 메인 실행부
 # ===============================
-def main():
+def main(args=None):
+    if args is None:
+        args = parse_args()
+
     # 🔥 표정모듈은 감정모델이 없으므로 None 전달
     emotion_detector = None
 
-    # 🔥 반드시 이 순서로 시작
-    start_camera_thread()  # 1개 카메라만 공유
-    start_pose_thread()
-    gaze_thread = start_gaze_thread()
-    start_expression_thread(emotion_detector)  # ← 수정됨
-    start_hands_thread()
-    start_voice_thread()
+    gaze_thread = None
+    analyzer_threads = []
+    process_pool = None
+    orchestrator = None
+
+    # --profile: 분석 스레드보다 먼저 시작 (꺼져 있으면 모듈 import 도 안 함)
+    profiler = None
+    if args.profile:
+        from modules.profiler import SamplingProfiler
+        profiler = SamplingProfiler(
+            names=flags.lifecycle.threads,
+            main_name="main" if args.headless else "dashboard",
+            interval=args.profile_interval / 1000.0,
+            top=args.profile_top,
+            snapshot_interval=args.profile_snapshot,
+        ).start()
+
+    # 헤드리스: 창 없이 결과는 sink 로만 (분석기는 원래 그리지 않음 → 오버레이는 대시보드가)
+    # --record: 기록기 writer 스레드가 변환 / 파일 쓰기 (분석 스레드는 deque 에 넣기만)
+    recorder = RecorderSink(args.record, precision=args.record_precision) if args.record else None
+    # 프레임별 시선 결과: 기록기(재채점용)에는 항상, JSONL 에는 --gaze-frames 일 때만
+    gaze_frames = args.gaze_frames or recorder is not None
+    sink = args.sink
+    if sink and gaze_frames and not args.gaze_frames:
+        sink = result_sink.FilterSink(result_sink.JsonlSink(sink), lambda r: not result_sink.is_frame(r, "gaze"))
+    if sink or recorder is not None:
+        result_sink.set_sink([sink, recorder])
+        # 시선 구간 이벤트 (정면 / 이탈 / 깜빡임 시작·끝) 도 같은 sink 로
+        gaze_events.subscribe(lambda event: result_sink.emit_event("gaze", event_record(event)))
+    set_auto_calibration(args.calibrate_after)
+    set_gaze_frames(gaze_frames)
+
+    # 🔥 lockstep: 구독자는 모든 프레임을 순서대로 받음 (분석기 구독 전에 설정)
+    frame_bus.lockstep = args.lockstep
+
+    # 분석기별 실행 빈도 (gaze 매 프레임, 나머지는 낮은 fps)
+    apply_schedule(args)
+
+    # 얼굴 ROI 추적 (gaze 가 찾은 얼굴 주변만 FaceMesh / 표정 분석)
+    face_roi.enabled = not args.no_face_roi
+
+    # 분석 스레드(프로세스)가 구독 전에 각자 그래프 생성 + 더미 프레임 1장 (동시에 진행)
+    startup.enabled = not args.no_warmup
+
+    if args.mode == "process":
+        from modules.process_mode import ProcessAnalyzerPool
+
+        # 분석기 4개는 각자 프로세스에서, 결과만 기존 슬롯으로 전달됨
+        # (카메라는 자식들의 warm-up 이 끝난 뒤 시작 → 동영상 파일을 자식 준비 전에 읽어 버리지 않음)
+        process_pool = ProcessAnalyzerPool(
+            frame_bus,
+            result_slots(),
+            step_kwargs={
+                "expression": {"emotion_detector": emotion_detector},
+                "gaze": {"face_roi": face_roi.enabled, "calibrate_after": args.calibrate_after,
+                         "frames": gaze_frames},
+            },
+            schedules={name: analyzer_scheduler.config(name) for name in analyzer_scheduler.tasks},
+            warmup=startup.enabled,
+            lockstep=args.lockstep,
+        )
+        process_pool.start()
+        warming = process_pool.names
+    elif args.mode == "async":
+        from modules.orchestrator import AsyncOrchestrator
+
+        # 캡처 / 분석 / 음성 / 화면을 이벤트 루프 task 로 (warm-up 은 run 안에서, 결과는 기존 슬롯으로)
+        orchestrator = AsyncOrchestrator(
+            args.source,
+            result_slots(),
+            step_kwargs={
+                "expression": {"emotion_detector": emotion_detector, "roi": face_roi},
+                "gaze": {"face_roi": face_roi.enabled, "calibrate_after": args.calibrate_after, "roi": face_roi,
+                         "frames": gaze_frames},
+            },
+            lockstep=args.lockstep,
+            workers=args.workers,
+        )
+        warming = ()
+    elif args.engine == "holistic":
+        from modules.holistic.holistic_thread_example import start_holistic_thread
+
+        # 그래프 1개 → pose / gaze / hands / expression 결과를 기존 슬롯으로 분배
+        gaze_thread = start_holistic_thread(emotion_detector)
+        analyzer_threads = [gaze_thread]
+        start_camera_thread(args.source, subscribers=1)
+        warming = ("holistic",)
+    else:
+        gaze_thread = start_gaze_thread()
+        analyzer_threads = [
+            start_pose_thread(),
+            gaze_thread,
+            start_expression_thread(emotion_detector),  # ← 수정됨
+            start_hands_thread(),
+        ]
+
+        # 1개 카메라만 공유 (lockstep이면 분석 스레드 4개가 구독한 뒤 첫 프레임 발행)
+        # 카메라 열기는 warm-up 과 겹침 → 구독 전 프레임은 버려짐 (lockstep 은 구독까지 대기)
+        start_camera_thread(args.source, subscribers=4)
+        warming = ("pose", "gaze", "expression", "hands")
+
+    # 음성은 마이크(PyAudio)가 있을 때만 → --no-voice 면 import 도 하지 않음
+    voice_result_slot = None
+    if not args.no_voice:
+        from modules.voice.voice_thread_example import start_voice_thread, voice_result_slot
+        if orchestrator is not None:
+            orchestrator.voice_slot = voice_result_slot  # 녹음 / STT 도 루프의 task 로
+        else:
+            start_voice_thread()
+
+    if args.metrics_port is not None:
+        start_metrics_server(args.metrics_port, voice_result_slot)
+
+    # (async 는 오케스트레이터가 warm-up 을 마친 뒤 캡처를 시작)
+    if warming:
+        if startup.wait_ready(warming, timeout=args.warmup_timeout):
+            startup.mark("ready")
+            print(f"🔥 Analyzers ready in {startup.marks['ready']:.2f}s (warm-up {'on' if startup.enabled else 'off'})")
+        else:
+            print(f"⚠️ Analyzers not ready after {args.warmup_timeout:.0f}s — starting anyway")
+    if process_pool is not None:
+        start_camera_thread(args.source, subscribers=1)  # 1개 카메라만 공유 (구독자 = 공유 메모리 발행 스레드)
+
+    gaze_report = None
+    if orchestrator is not None:
+        gaze_report = run_async(args, orchestrator, voice_result_slot)
+    elif args.headless:
+        run_headless(args, analyzer_threads, process_pool)
+    else:
+        run_dashboard(args, process_pool, voice_result_slot)
 
-    print("\n🚀 AI Mock Interview — Main Started (q 또는 X로 종료)\n")
+    # ============================
+    # 🔥 전체 스레드 종료
+    # ============================
+    # stop_token → 대기 중인 스레드 깨움 → 타임아웃 join → 카메라 등 자원 해제
+    finals = None
+    if process_pool is not None:
+        flags.stop_token.set()
+        finals = flags.lifecycle.step("process_pool", process_pool.stop)
+    report = flags.lifecycle.shutdown(timeout=3.0)
+    if profiler is not None:
+        from modules.profiler import print_profile_summary
+        profiler.stop()
+        print_profile_summary(profiler, profiler.write_reports(args.profile))
+
+    if finals is not None:
+        gaze_report = (finals.get("gaze") or {}).get("report")
+    if gaze_report:
+        from modules.gaze.gaze_session import print_gaze_report
+        print_gaze_report(gaze_report)
+        result_sink.emit_report("gaze", gaze_report)
+        print_event_summary(gaze_events.summary())
+    if finals is not None:
+        print_schedule_report({name: f["schedule"] for name, f in finals.items()})
+    else:
+        print_schedule_report(analyzer_scheduler.report())
+    print_latency_report(latency_tracker.percentiles())
+    startup_report = startup.report(result_slots(voice_result_slot))
+    print_startup_report(startup_report)
+    result_sink.emit_report("startup", startup_report)
+    print_shutdown_report(report)
+    result_sink.close_sink()
+    if not args.headless:
+        cv2.destroyAllWindows()
+    print("🧹 Threads stopped." if report["all_stopped"] else "⚠️ Some threads did not stop in time.")
 
-    latest_pose = None
-    latest_gaze = None
-    latest_expr = None
-    latest_hands = None
-    latest_voice = None
+    return
 
-    window_name = "AI Mock Interview - Dashboard"
 
-    while True:
+# ===============================
+# 헤드리스 실행 (창 없음)
+# ===============================
+def run_headless(args, analyzer_threads, process_pool=None):
+    print("\n🚀 AI Mock Interview — Headless Started (Ctrl+C 로 종료)\n")
+    started = time.monotonic()
+
+    try:
+        while not frame_bus.closed:
+            if args.duration is not None and time.monotonic() - started >= args.duration:
+                print("⏱ Duration reached.")
+                return
+            # 0.1s 마다 깨어나 소스 종료 / 시간 제한 확인
+            flags.stop_token.wait(0.1)
+    except KeyboardInterrupt:
+        print("🔚 Interrupted.")
+        return
+
+    # 동영상/이미지 소스 끝 → 분석기가 남은 프레임을 다 처리할 때까지 대기
+    print("📼 Source finished.")
+    for t in analyzer_threads:
+        t.join(timeout=10.0)
+    if process_pool is not None:
+        process_pool.wait_drained(timeout=10.0)
 
-        # ===== 최신 데이터 수신 =====
-        pose_data = drain_queue(pose_result_queue)
-        gaze_data = drain_queue(gaze_result_queue)
-        expr_data = drain_queue(expression_result_queue)
-        hands_data = drain_queue(hands_result_queue)
-        voice_data = drain_queue(voice_result_queue)
-
-        if pose_data is not None:
-            latest_pose = pose_data
-        if gaze_data is not None:
-            latest_gaze = gaze_data
-        if expr_data is not None:
-            latest_expr = expr_data
-        if hands_data is not None:
-            latest_hands = hands_data
-        if voice_data is not None:
-            latest_voice = voice_data
 
-        # ============================
-        # 대시보드 화면
-        # ============================
-        dashboard = np.zeros((800, 1200, 3), dtype=np.uint8)
-
-        cv2.putText(
-            dashboard,
-            "AI Mock Interview Dashboard",
-            (20, 40),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1.0,
-            (0, 255, 0),
-            2,
-        )
+# ===============================
+# asyncio 오케스트레이터 실행 (--mode async)
+# ===============================
+def run_async(args, orchestrator, voice_result_slot=None):
+    """이벤트 루프가 메인 스레드를 차지 → 대시보드도 루프의 task. 시선 최종 리포트 반환"""
+    if args.headless:
+        print("\n🚀 AI Mock Interview — Headless Started (async, Ctrl+C 로 종료)\n")
+        dashboard = None
+    else:
+        print("\n🚀 AI Mock Interview — Main Started (async, q 또는 X로 종료)\n")
+        dashboard = make_dashboard(args, voice_result_slot)
+
+    try:
+        report = orchestrator.run(dashboard, args.duration)
+    except KeyboardInterrupt:
+        print("🔚 Interrupted.")
+        return orchestrator.report
+    if orchestrator.source_finished:
+        print("📼 Source finished.")
+    return report
+
 
-        # ========== 자세 =============
-        if latest_pose is not None:
-            frame, motion, _ = latest_pose
-            f = cv2.resize(frame, (350, 250))
-            dashboard[80:330, 20:370] = f
-            cv2.putText(dashboard, f"Movement: {motion:.2f}",
-                        (20, 75), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-
-        # ========== 시선 =============
-        if latest_gaze is not None:
-            frame, g = latest_gaze
-            f = cv2.resize(frame, (350, 250))
-            dashboard[80:330, 400:750] = f
-            cv2.putText(dashboard, f"Gaze: {g['left_right']} / {g['up_down']}",
-                        (400, 75), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-
-        # ========== 손 =============
-        if isinstance(latest_hands, np.ndarray):
-            f = cv2.resize(latest_hands, (350, 250))
-            dashboard[350:600, 400:750] = f
-
-        # ========== 표정 =============
-        if latest_expr is not None and isinstance(latest_expr[1], dict):
-            emo = latest_expr[1]
-            cv2.putText(dashboard, f"Expression: {emo['dominant']}",
-                        (20, 380), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-
-        # ========== 음성 =============
-        if latest_voice is not None:
-            text = latest_voice["text"]
-            safe_text = text[:50] if text else "(음성 인식 실패)"
-
-            cv2.putText(dashboard, f"Voice: {safe_text}",
-                        (20, 430), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+# ===============================
+# 대시보드 실행 (OpenCV 창)
+# ===============================
+def make_dashboard(args, voice_result_slot=None):
+    # 캔버스 1개를 재사용, 새 결과가 온 패널만 다시 그림 (화면 갱신은 display_fps 로 제한)
+    dashboard = DashboardRenderer(display_fps=args.display_fps)
+
+    # 패널 ↔ 결과 슬롯 (새 version 이 있을 때만 해당 패널을 다시 그림)
+    dashboard.bind("pose", pose_result_slot)
+    dashboard.bind("gaze", gaze_result_slot)
+    dashboard.bind("expression", expression_result_slot)
+    dashboard.bind("hands", hands_result_slot)
+    if voice_result_slot is not None:
+        dashboard.bind("voice", voice_result_slot)
+    dashboard.bind_events(gaze_events)  # 이탈 횟수 / 현재 방향은 프레임 결과 대신 이벤트로
+    return dashboard
+
+
+def run_dashboard(args, process_pool, voice_result_slot=None):
+    print("\n🚀 AI Mock Interview — Main Started (q 또는 X로 종료)\n")
+    dashboard = make_dashboard(args, voice_result_slot)
+
+    window_name = "AI Mock Interview - Dashboard"
+
+    while True:
 
         # ============================
-        # 창 표시
+        # 대시보드 화면 (슬롯에 새 결과가 있을 때만 창 갱신)
         # ============================
-        try:
-            cv2.imshow(window_name, dashboard)
-        except cv2.error:
-            print("🔥 imshow error — window closed")
-            break
+        if dashboard.render():
+            try:
+                cv2.imshow(window_name, dashboard.canvas)
+            except cv2.error:
+                print("🔥 imshow error — window closed")
+                break
 
         # X 닫기 확인
         if cv2.getWindowProperty(window_name, cv2.WND_PROP_VISIBLE) < 1:
             print("🔥 Window closed by user.")
             break
 
-        # q 종료
-        key = cv2.waitKey(1) & 0xFF
+        # q 종료 (다음 화면 갱신 시각까지는 키 입력만 기다림 → UI 스레드가 헛돌지 않음)
+        key = cv2.waitKey(dashboard.wait_ms()) & 0xFF
 
         if key == ord('c'):
-            from modules.gaze.gaze_thread_example import request_gaze_calibration
-            request_gaze_calibration()
+            if process_pool is not None:
+                process_pool.calibrate_gaze()
+            else:
+                from modules.gaze.gaze_thread_example import request_gaze_calibration
+                request_gaze_calibration()
             print("✅ 'c' pressed → Gaze center calibration requested")
 
         if key == ord('q'):
             print("🔚 'q' pressed. Exiting.")
             break
 
-    # ============================
-    # 🔥 전체 스레드 종료
-    # ============================
-    import modules.shared_flags as flags
-    flags.RUNNING = False
-    gaze_thread.join()
-    cv2.destroyAllWindows()
-    print("🧹 Threads stopped.")
-
-    return
+        # 동영상/이미지 소스 끝
+        if frame_bus.closed:
+            print("📼 Source finished.")
+            break
 
 
 # ============================
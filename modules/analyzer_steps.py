@@ -0,0 +1,110 @@
+# modules/analyzer_steps.py
+"""
+분석기 1개 = 상태를 가진 호출 가능 객체 (FrameViews → 작은 결과 dict / 시선은 GazeState)
+
+프로세스 모드의 자식 프로세스와 멀티 세션 호스트(Session)가 같이 쓴다.
+객체마다 자기 MediaPipe 그래프 / 안정화 버퍼 / 세션 누적값을 가지므로
+세션끼리, 프로세스끼리 상태가 섞이지 않는다.
+(무거운 import 는 생성 시점에 → spawn 자식은 필요한 분석기만 로드)
+
+warm_up(frame) : 더미 프레임으로 그래프만 만들어 둠 (세션 누적값 / ROI 추적은 건드리지 않음)
+frame_record(step, result) : sink / 기록기로 보낼 프레임 결과 (시선은 frames=True 일 때만)
+"""
+
+ANALYZERS = ("pose", "gaze", "hands", "expression")
+
+
+class PoseStep:
+    def __init__(self):
+        from modules.pose.pose_module import PoseAnalyzer
+        self.analyzer = PoseAnalyzer()
+
+    def __call__(self, views):
+        _, motion, coords = self.analyzer.process_frame(views.bgr, views.rgb, draw=False)
+        return {"motion": motion, "coords": coords}
+
+    def warm_up(self, frame):
+        self.analyzer.process_frame(frame, draw=False)
+
+
+class GazeStep:
+    def __init__(self, face_roi=True, calibrate_after=None, roi=None, frames=False):
+        """
+        face_roi : 얼굴 주변 crop 에만 FaceMesh
+        roi      : 같이 쓸 FaceROITracker (세션 안에서 expression 과 공유). 없으면 새로 만듦
+        frames   : 프레임마다 전체 결과(build_result)도 만들어 record 에 (기본: GazeState 만)
+        """
+        from modules.gaze.gaze_module import GazeTracker
+        from modules.gaze.gaze_session import AutoCalibration, GazeSession
+        from modules.face_roi import FaceROITracker
+        self.tracker = GazeTracker()
+        self.session = GazeSession()
+        self.roi = roi if roi is not None else FaceROITracker()
+        self.roi.enabled = face_roi
+        self.auto_calibration = AutoCalibration(calibrate_after)
+        self.frames = frames
+        self.record = None
+
+    def calibrate(self):
+        try:
+            self.tracker.calibrate()
+        except Exception:
+            pass
+        self.session.reset()
+
+    def __call__(self, views):
+        self.tracker.process_frame(views.bgr, views.rgb, draw=False, roi=self.roi, ts=views.ts)
+        state = self.session.update(self.tracker, views.ts)
+        self.record = self.session.build_result(self.tracker) if self.frames else None
+        if self.auto_calibration.due(views.ts):
+            self.calibrate()
+        return state
+
+    def warm_up(self, frame):
+        self.tracker.process_frame(frame, draw=False)
+
+    def finish(self):
+        return self.session.finish()
+
+
+class HandsStep:
+    def __init__(self):
+        from modules.hands.hands_module import HandsAnalyzer
+        self.analyzer = HandsAnalyzer(max_num_hands=2)
+
+    def __call__(self, views):
+        _, hands = self.analyzer.process_frame(views.bgr, views.rgb, draw=False)
+        return {"hands": hands}
+
+    def warm_up(self, frame):
+        self.analyzer.process_frame(frame, draw=False)
+
+
+class ExpressionStep:
+    def __init__(self, emotion_detector=None, roi=None, tmp_path="exp_tmp.jpg"):
+        """
+        roi      : gaze 가 추적 중인 얼굴 박스가 있으면 얼굴 탐지 생략 (같은 세션의 FaceROITracker)
+        tmp_path : 감정 모델 입력 crop 파일 (세션마다 달라야 함)
+        """
+        from modules.expression.expression_analyzer import ExpressionAnalyzer
+        self.analyzer = ExpressionAnalyzer(emotion_detector, tmp_path=tmp_path)
+        self.roi = roi
+
+    def __call__(self, views):
+        return {"emotion": self.analyzer.process_frame(views.bgr, views.rgb, roi=self.roi, ts=views.ts)}
+
+    def warm_up(self, frame):
+        self.analyzer.process_frame(frame)
+
+
+def frame_record(step, result):
+    """sink / 기록기로 보낼 프레임 결과 (None = 보내지 않음 — 시선은 구간 이벤트만)"""
+    return step.record if isinstance(step, GazeStep) else result
+
+
+STEPS = {
+    "pose": PoseStep,
+    "gaze": GazeStep,
+    "hands": HandsStep,
+    "expression": ExpressionStep,
+}
@@ -1,49 +1,75 @@
 # modules/camera/camera_manager.py
 
-import cv2
 import threading
-import queue
-
-# 모든 모듈이 공유할 공통 프레임 큐
-shared_frame_queue = queue.Queue(maxsize=3)
-
-RUN_CAMERA = True
-
-def camera_worker():
-    global RUN_CAMERA
+import time
+
+from modules.camera.frame_bus import FrameBus
+from modules.camera.frame_source import open_source
+from modules.camera.frame_views import FrameViews
+import modules.shared_flags as flags
+
+# 모든 모듈이 공유할 공통 프레임 버스 (구독자마다 모든 프레임을 받음)
+frame_bus = FrameBus(capacity=8)
+
+def camera_worker(source=None, subscribers=0):
+    """
+    source      : FrameSource 또는 카메라 번호 / 동영상 경로 / 이미지 폴더 (기본: 카메라 0)
+    subscribers : lockstep 버스일 때 첫 프레임 전에 기다릴 구독자 수
+    """
+    source = open_source(0 if source is None else source)
+
+    if not source.open():
+        print(f"❌ Camera open failed ({source.name})")
+        frame_bus.close()
+        return
 
-    cap = cv2.VideoCapture(0)
+    print(f"📷 Unified Camera Thread Started ({source.name})")
 
-    cap.set(cv2.CAP_PROP_FPS, 15)
+    # lockstep: 분석 스레드가 모두 구독한 뒤에 첫 프레임 발행
+    if frame_bus.lockstep and subscribers:
+        while flags.running() and not frame_bus.wait_for_subscribers(subscribers):
+            pass
 
-    if not cap.isOpened():
-        print("❌ Camera open failed")
-        return
+    try:
+        _capture_loop(source)
+    finally:
+        # 종료 토큰 / 소스 끝 / 예외 어느 경우든 장치 해제 + 소비자 깨우기
+        source.release()
+        frame_bus.close()
+        print("📷 Unified Camera Thread Ended")
 
-    print("📷 Unified Camera Thread Started")
 
-    while RUN_CAMERA:
-        ret, frame = cap.read()
+def _capture_loop(source):
+    while flags.running():
+        ret, frame, ts = source.read()
+        captured = time.perf_counter()  # 지연 측정 기준 (단조 시계, 모든 결과에 전달됨)
         if not ret:
+            # 파일 소스는 끝, 카메라는 일시적 실패 → 재시도
+            if source.exhausted:
+                break
             continue
 
-        # ✅ 여기에서 한 번만 좌우 반전
-        frame = cv2.flip(frame, 1)
-
-        if shared_frame_queue.full():
-            try:
-                shared_frame_queue.get_nowait()
-            except:
+        # lockstep: 모든 분석기가 직전 프레임을 가져갈 때까지 대기 (드롭 없음)
+        if frame_bus.lockstep:
+            while flags.running() and not frame_bus.wait_consumed():
                 pass
 
-        shared_frame_queue.put(frame)
+        # 파생 이미지(RGB 등)는 분석기들이 처음 요청할 때 한 번만 계산
+        frame_bus.publish(FrameViews(frame, ts, captured))
 
-    cap.release()
-    print("📷 Unified Camera Thread Ended")
+    # lockstep: 마지막 프레임까지 모두 가져간 뒤 종료 알림
+    if frame_bus.lockstep:
+        while flags.running() and not frame_bus.wait_consumed():
+            pass
 
 
-
-def start_camera_thread():
-    t = threading.Thread(target=camera_worker, daemon=True)
+def start_camera_thread(source=None, subscribers=0):
+    source = open_source(0 if source is None else source)
+    t = threading.Thread(target=camera_worker, args=(source, subscribers), daemon=True)
     t.start()
+
+    # 종료 시: 소비자 깨우기 → 스레드 join → (못 멈췄으면) 장치 강제 해제
+    flags.lifecycle.on_stop(frame_bus.close)
+    flags.lifecycle.add_thread("camera", t)
+    flags.lifecycle.add_resource(source.name, source.release)
     return t
@@ -0,0 +1,156 @@
+# modules/camera/frame_bus.py
+
+import threading
+
+
+# =====================================================
+# 📦 단일 생산자 / 다중 소비자 프레임 버스
+# =====================================================
+class FrameBus:
+    """
+    카메라 스레드(생산자 1개)가 올린 프레임을 모든 분석 스레드(소비자 N개)가
+    각자 읽어가는 링 버퍼.
+
+    - 프레임마다 증가하는 시퀀스 번호(seq)를 붙여 보관
+    - 구독자마다 읽기 커서를 따로 가지므로 서로 프레임을 뺏지 않음
+    - 픽셀 데이터는 복사하지 않고 같은 ndarray 참조를 나눠 가짐
+      (→ 소비자는 받은 프레임 위에 직접 그리면 안 됨)
+    - 새 프레임이 올라오면 Condition 으로 대기 중인 소비자를 깨움
+      (busy-spin 없이 wait(timeout) 으로 블로킹)
+    - lockstep=True 면 모든 구독자가 직전 프레임을 가져간 뒤에야 다음 프레임을 올림
+      (오프라인 분석: 순서 보존 + 드롭 없음 + CPU가 허락하는 만큼 빠르게)
+    """
+
+    def __init__(self, capacity=8, lockstep=False):
+        self.capacity = capacity
+        self.lockstep = lockstep
+        self.closed = False              # 소스가 끝나면 True
+        self._slots = [None] * capacity  # (seq, frame)
+        self._head = -1                  # 마지막으로 올라간 seq
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._subscribers = {}
+
+    # -------------------------------
+    # 생산자 쪽
+    # -------------------------------
+    def publish(self, frame):
+        """프레임을 링에 올리고 seq 반환"""
+        with self._lock:
+            seq = self._head + 1
+            self._slots[seq % self.capacity] = (seq, frame)
+            self._head = seq
+            self._cond.notify_all()
+        return seq
+
+    @property
+    def latest_seq(self):
+        return self._head
+
+    def wait_consumed(self, timeout=0.1):
+        """(lockstep) 모든 구독자가 마지막 프레임까지 가져갔으면 True"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: all(s.cursor > self._head for s in self._subscribers.values()),
+                timeout,
+            )
+
+    def wait_for_subscribers(self, count, timeout=0.1):
+        """(lockstep) 구독자가 count 명 모일 때까지 대기 — 첫 프레임을 놓치지 않도록"""
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._subscribers) >= count, timeout)
+
+    def close(self):
+        """소스 종료 알림 → 대기 중인 소비자를 깨움"""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    # -------------------------------
+    # 소비자 쪽
+    # -------------------------------
+    def subscribe(self, name, mode=None):
+        """
+        mode="latest" : 항상 가장 최신 프레임만 (밀린 프레임은 drop 으로 집계)
+        mode="every"  : 링에 남아있는 한 모든 프레임을 순서대로
+        mode=None     : lockstep 버스면 "every", 아니면 "latest"
+        """
+        if mode is None:
+            mode = "every" if self.lockstep else "latest"
+        if mode not in ("latest", "every"):
+            raise ValueError(f"unknown subscribe mode: {mode}")
+
+        with self._lock:
+            sub = FrameSubscriber(self, name, mode, start_seq=self._head + 1)
+            self._subscribers[name] = sub
+            self._cond.notify_all()
+        return sub
+
+    def unsubscribe(self, name):
+        with self._cond:
+            self._subscribers.pop(name, None)
+            self._cond.notify_all()
+
+    def _next_for(self, sub, timeout=0.0):
+        with self._cond:
+            if self._head < sub.cursor and timeout and not self.closed:
+                # 새 프레임 알림 or 타임아웃까지 대기 (종료 플래그 확인용으로 주기적으로 깨어남)
+                self._cond.wait_for(lambda: self._head >= sub.cursor or self.closed, timeout)
+
+            head = self._head
+            if head < sub.cursor:
+                return None
+
+            if sub.mode == "latest":
+                seq = head
+            else:
+                # 링에서 이미 덮어써진 프레임은 건너뜀
+                oldest = max(0, head - self.capacity + 1)
+                seq = max(sub.cursor, oldest)
+
+            sub.dropped += seq - sub.cursor
+            sub.cursor = seq + 1
+            sub.received += 1
+
+            # lockstep 생산자는 모든 구독자가 가져갔는지 기다리는 중
+            if self.lockstep:
+                self._cond.notify_all()
+            return self._slots[seq % self.capacity]
+
+    def stats(self):
+        """구독자별 수신/드롭 프레임 수"""
+        with self._lock:
+            return {
+                name: {
+                    "mode": sub.mode,
+                    "received": sub.received,
+                    "dropped": sub.dropped,
+                    "backlog": max(0, self._head + 1 - sub.cursor),
+                }
+                for name, sub in self._subscribers.items()
+            }
+
+
+class FrameSubscriber:
+    """FrameBus 구독자 1명분의 읽기 커서"""
+
+    def __init__(self, bus, name, mode, start_seq=0):
+        self.bus = bus
+        self.name = name
+        self.mode = mode
+        self.cursor = start_seq  # 다음에 읽을 seq
+        self.received = 0
+        self.dropped = 0
+
+    @property
+    def finished(self):
+        """소스가 끝났고 남은 프레임도 모두 읽었으면 True"""
+        return self.bus.closed and self.cursor > self.bus.latest_seq
+
+    def poll(self):
+        """새 프레임이 있으면 (seq, frame), 없으면 None (대기 없음)"""
+        return self.bus._next_for(self)
+
+    def wait(self, timeout=0.1):
+        """새 프레임이 올 때까지 최대 timeout 초 대기. 타임아웃이면 None"""
+        return self.bus._next_for(self, timeout)
@@ -0,0 +1,162 @@
+# modules/camera/frame_source.py
+
+import os
+import time
+
+import cv2
+
+
+# =====================================================
+# 🎞 프레임 소스 (카메라 / 동영상 파일 / 이미지 폴더)
+# =====================================================
+class FrameSource:
+    """
+    camera_worker 가 프레임을 읽어오는 대상.
+
+    read() → (ok, frame, ts)
+      - ts : 소스 기준 시각(초). 카메라는 캡처 시각, 파일은 영상 내 시각
+    realtime  : 실시간 소스인지 (카메라 True / 파일 False)
+    exhausted : 더 읽을 프레임이 없는지 (파일 끝)
+    """
+
+    realtime = False
+    name = "source"
+
+    def __init__(self):
+        self.exhausted = False
+
+    def open(self):
+        return True
+
+    def read(self):
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+
+class CameraSource(FrameSource):
+    realtime = True
+
+    def __init__(self, index=0, fps=15, flip=True):
+        super().__init__()
+        self.index = index
+        self.fps = fps
+        self.flip = flip
+        self.name = f"camera:{index}"
+        self.cap = None
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.index)
+        self.cap.set(cv2.CAP_PROP_FPS, self.fps)
+        return self.cap.isOpened()
+
+    def read(self):
+        ret, frame = self.cap.read()
+        ts = time.perf_counter()
+        if not ret:
+            return False, None, ts
+
+        # ✅ 여기에서 한 번만 좌우 반전
+        if self.flip:
+            frame = cv2.flip(frame, 1)
+        return True, frame, ts
+
+    def release(self):
+        # 여러 번 불려도 안전 (워커 종료 시 + Lifecycle 자원 해제 시)
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class VideoFileSource(FrameSource):
+    """녹화된 면접 영상. 프레임 순서 그대로, 재생 속도와 무관하게 최대한 빨리 읽음"""
+
+    def __init__(self, path, flip=False):
+        super().__init__()
+        self.path = path
+        self.flip = flip
+        self.name = f"video:{os.path.basename(path)}"
+        self.cap = None
+        self.fps = 0.0
+        self.index = 0
+
+    def open(self):
+        self.cap = cv2.VideoCapture(self.path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 15.0
+        return self.cap.isOpened()
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret:
+            self.exhausted = True
+            return False, None, None
+
+        # 영상 내 시각 (POS_MSEC 가 0 이면 프레임 번호로 계산)
+        ts = self.cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0 or self.index / self.fps
+        self.index += 1
+
+        if self.flip:
+            frame = cv2.flip(frame, 1)
+        return True, frame, ts
+
+    def release(self):
+        # 여러 번 불려도 안전 (워커 종료 시 + Lifecycle 자원 해제 시)
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+
+class ImageDirSource(FrameSource):
+    """이미지 폴더 (파일 이름 순서). ts 는 fps 기준으로 부여"""
+
+    EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+    def __init__(self, path, fps=15, flip=False):
+        super().__init__()
+        self.path = path
+        self.fps = fps
+        self.flip = flip
+        self.name = f"images:{os.path.basename(os.path.normpath(path))}"
+        self.files = []
+        self.index = 0
+
+    def open(self):
+        self.files = sorted(
+            os.path.join(self.path, f) for f in os.listdir(self.path)
+            if f.lower().endswith(self.EXTENSIONS)
+        )
+        return bool(self.files)
+
+    def read(self):
+        while self.index < len(self.files):
+            path = self.files[self.index]
+            ts = self.index / self.fps
+            self.index += 1
+
+            frame = cv2.imread(path)
+            if frame is None:
+                print(f"⚠️ 이미지 읽기 실패: {path}")
+                continue
+
+            if self.flip:
+                frame = cv2.flip(frame, 1)
+            return True, frame, ts
+
+        self.exhausted = True
+        return False, None, None
+
+
+def open_source(spec=0, **kwargs):
+    """
+    '0', 1 같은 숫자 → 카메라
+    폴더 경로       → 이미지 폴더
+    그 외 파일 경로  → 동영상 파일
+    """
+    if isinstance(spec, FrameSource):
+        return spec
+    if isinstance(spec, int) or str(spec).isdigit():
+        return CameraSource(int(spec), **kwargs)
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, **kwargs)
+    return VideoFileSource(spec, **kwargs)
@@ -0,0 +1,70 @@
+# modules/camera/frame_views.py
+
+import threading
+import time
+
+import cv2
+
+
+# =====================================================
+# 🖼 프레임 1장 + 파생 이미지(RGB/Gray/축소본) 캐시
+# =====================================================
+class FrameViews:
+    """
+    카메라 프레임(BGR) 1장을 감싸고, 분석기들이 필요로 하는 파생 이미지를
+    처음 요청될 때 한 번만 만들어 공유한다.
+
+    - rgb     : MediaPipe 입력용 (pose / gaze / hands / expression 공통)
+    - gray    : 흑백
+    - half    : 1/2 축소 BGR
+    - quarter : 1/4 축소 BGR
+
+    여러 스레드가 동시에 같은 뷰를 요청해도 변환은 한 번만 일어난다.
+    만들어진 뷰는 공유되므로 읽기 전용으로 잠가 둔다.
+    """
+
+    _BUILDERS = {
+        "rgb": lambda f: cv2.cvtColor(f, cv2.COLOR_BGR2RGB),
+        "gray": lambda f: cv2.cvtColor(f, cv2.COLOR_BGR2GRAY),
+        "half": lambda f: cv2.resize(f, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA),
+        "quarter": lambda f: cv2.resize(f, None, fx=0.25, fy=0.25, interpolation=cv2.INTER_AREA),
+    }
+
+    def __init__(self, bgr, ts=None, captured=None):
+        self.bgr = bgr
+        self.ts = ts  # 소스 기준 시각(초). 카메라=캡처 시각, 파일=영상 내 시각
+        # 캡처 순간의 time.perf_counter() (지연 측정 기준, 파일 소스도 실제 읽은 시각)
+        self.captured = time.perf_counter() if captured is None else captured
+        self.height, self.width = bgr.shape[:2]
+        self._cache = {}
+        self._locks = {name: threading.Lock() for name in self._BUILDERS}
+
+    def _view(self, name):
+        view = self._cache.get(name)
+        if view is not None:
+            return view
+
+        # 같은 뷰를 동시에 요청한 스레드는 먼저 온 스레드의 결과를 기다렸다가 재사용
+        with self._locks[name]:
+            view = self._cache.get(name)
+            if view is None:
+                view = self._BUILDERS[name](self.bgr)
+                view.setflags(write=False)
+                self._cache[name] = view
+        return view
+
+    @property
+    def rgb(self):
+        return self._view("rgb")
+
+    @property
+    def gray(self):
+        return self._view("gray")
+
+    @property
+    def half(self):
+        return self._view("half")
+
+    @property
+    def quarter(self):
+        return self._view("quarter")
@@ -0,0 +1,119 @@
+# modules/camera/shm_frame_ring.py
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# =====================================================
+# 🧠 프로세스 간 공유 메모리 프레임 링
+# =====================================================
+class ShmFrameRing:
+    """
+    multiprocessing.shared_memory 위에 올린 고정 크기 프레임 링 버퍼.
+
+    메모리 배치: [헤더 int64 (1 + slots)] [ts float64 (slots)] [captured float64 (slots)]
+               [프레임 slot 0] ... [프레임 slot N-1]
+      - header[0]       : 마지막으로 올라간 seq (-1 = 아직 없음)
+      - header[1 + i]   : slot i 에 들어있는 프레임의 seq (-1 = 쓰는 중)
+      - ts[i]           : slot i 프레임의 소스 기준 시각(초)
+      - captured[i]     : slot i 프레임의 캡처 시각 (perf_counter, 지연 측정용 — 단조 시계라 프로세스 간 공유)
+
+    생산자(부모 프로세스)는 프레임을 한 번만 복사해 넣고,
+    소비자(분석 프로세스)는 복사 없이 슬롯을 ndarray 뷰로 읽는다.
+    처리 도중 슬롯이 덮어써졌는지는 is_valid(seq) 로 확인.
+    """
+
+    def __init__(self, shm, shape, slots, owner):
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.slots = slots
+        self._owner = owner
+
+        self._header = np.ndarray((1 + slots,), dtype=np.int64, buffer=shm.buf)
+        self._ts = np.ndarray(
+            (slots,), dtype=np.float64,
+            buffer=shm.buf, offset=self._header.nbytes,
+        )
+        self._captured = np.ndarray(
+            (slots,), dtype=np.float64,
+            buffer=shm.buf, offset=self._header.nbytes + self._ts.nbytes,
+        )
+        self._frames = np.ndarray(
+            (slots,) + self.shape, dtype=np.uint8,
+            buffer=shm.buf, offset=self._header.nbytes + self._ts.nbytes + self._captured.nbytes,
+        )
+
+    @classmethod
+    def create(cls, shape, slots=6, last_seq=-1):
+        """last_seq: 이전 링에서 이어받을 마지막 seq (해상도가 바뀌어 링을 새로 만들 때 — 소비자의 seq 가 이어짐)"""
+        header_bytes = (1 + slots) * np.dtype(np.int64).itemsize + 2 * slots * np.dtype(np.float64).itemsize
+        frame_bytes = int(np.prod(shape))
+        shm = shared_memory.SharedMemory(create=True, size=header_bytes + slots * frame_bytes)
+        ring = cls(shm, shape, slots, owner=True)
+        ring._header[:] = -1
+        ring._header[0] = last_seq
+        return ring
+
+    @classmethod
+    def attach(cls, name, shape, slots):
+        return cls(shared_memory.SharedMemory(name=name), shape, slots, owner=False)
+
+    @property
+    def spec(self):
+        """자식 프로세스에 넘길 (name, shape, slots)"""
+        return self.shm.name, self.shape, self.slots
+
+    # -------------------------------
+    # 생산자 쪽
+    # -------------------------------
+    def publish(self, frame, ts=0.0, captured=0.0):
+        seq = int(self._header[0]) + 1
+        i = seq % self.slots
+
+        self._header[1 + i] = -1          # 쓰는 중 표시
+        self._frames[i][...] = frame
+        self._ts[i] = ts
+        self._captured[i] = captured
+        self._header[1 + i] = seq
+        self._header[0] = seq
+        return seq
+
+    # -------------------------------
+    # 소비자 쪽
+    # -------------------------------
+    @property
+    def latest_seq(self):
+        return int(self._header[0])
+
+    def read_latest(self, after_seq=-1):
+        """after_seq 보다 새 프레임이 있으면 (seq, 읽기 전용 뷰, ts, captured), 없으면 None"""
+        seq = int(self._header[0])
+        if seq <= after_seq:
+            return None
+
+        i = seq % self.slots
+        if int(self._header[1 + i]) != seq:
+            return None
+
+        view = self._frames[i]
+        view.flags.writeable = False
+        return seq, view, float(self._ts[i]), float(self._captured[i])
+
+    def is_valid(self, seq):
+        """seq 프레임이 아직 덮어써지지 않았는지"""
+        return int(self._header[1 + seq % self.slots]) == seq
+
+    def close(self):
+        # numpy 뷰가 버퍼를 잡고 있으면 close 가 실패하므로 먼저 해제
+        self._header = None
+        self._ts = None
+        self._captured = None
+        self._frames = None
+        try:
+            self.shm.close()
+        except BufferError:
+            # 분석 쪽에 아직 뷰가 남아있으면 프로세스 종료 시 OS가 정리
+            pass
+        if self._owner:
+            self.shm.unlink()
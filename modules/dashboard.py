@@ -0,0 +1,255 @@
+# modules/dashboard.py
+
+import time
+
+import cv2
+import numpy as np
+
+from modules.overlay import draw_gaze, draw_hands, draw_pose
+from modules.latency import latency_tracker
+from modules.gaze.gaze_events import DEVIATION_END, DEVIATION_START, DEVIATION_TURN
+
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+WHITE = (255, 255, 255)
+
+
+# =====================================================
+# 🖥 대시보드 렌더러 (캔버스 1개 재사용 + 바뀐 패널만 다시 그림)
+# =====================================================
+class _Panel:
+    def __init__(self, name, rect, image_rect=None):
+        """
+        rect       : 패널이 차지하는 영역 (x1, y1, x2, y2) — 다시 그릴 때 배경으로 지움
+        image_rect : 카메라 프레임을 넣을 영역 (미리 할당한 resize 버퍼 크기)
+        """
+        self.name = name
+        self.rect = rect
+        self.image_rect = image_rect
+        self.buffer = None
+        if image_rect is not None:
+            x1, y1, x2, y2 = image_rect
+            self.buffer = np.empty((y2 - y1, x2 - x1, 3), dtype=np.uint8)
+
+        self.data = None
+        self.stamp = None     # 결과의 원본 프레임 FrameStamp (화면에 뜨기까지 지연 측정)
+        self.source = None    # 결과 슬롯 (LatestSlot) — bind() 한 패널은 render() 때 직접 읽음
+        self.version = 0      # set() 할 때마다 증가 / 슬롯의 version
+        self.drawn = -1       # 마지막으로 그린 version (-1: 첫 화면은 무조건 그림)
+        self.overlaps = []    # 영역이 겹치는 패널 (같이 다시 그려야 함)
+
+    @property
+    def dirty(self):
+        return self.version != self.drawn
+
+
+class DashboardRenderer:
+    """
+    기존 main 루프는 매 반복마다 (800, 1200) 캔버스를 새로 만들고
+    제목/모든 패널을 다시 그린 뒤 cv2.waitKey(1) 로 계속 돌았다.
+
+    여기서는
+      - 캔버스와 배경(제목 등 고정 레이어)을 한 번만 만들고
+      - 결과 슬롯의 version 이 바뀐(또는 set() 으로 새 결과가 들어온) 패널만 배경으로 지우고 다시 그리며
+      - 프레임은 미리 할당한 패널 버퍼로 resize 하고
+      - 스켈레톤 / 손 / 시선 안내 오버레이는 분석 결과 레코드로 패널 해상도에서 그리며 (modules/overlay.py)
+      - 화면 갱신은 display_fps 로 제한한다 (wait_ms() 만큼 waitKey 로 쉼)
+      - 새 결과가 없으면 IDLE_RECHECK 뒤에 다시 확인 (display_fps 0 이어도 1ms 마다 헛돌지 않음)
+      - 시선 이탈 패널은 프레임 결과가 아니라 gaze_events 로그의 새 이벤트(since)로만 갱신
+    """
+
+    IDLE_RECHECK = 0.02  # 초
+
+    def __init__(self, width=1200, height=800, display_fps=15):
+        self.width = width
+        self.height = height
+        self.interval = 1.0 / display_fps if display_fps else 0.0
+        self._next_due = 0.0
+
+        # 고정 레이어 (제목)
+        self.background = np.zeros((height, width, 3), dtype=np.uint8)
+        cv2.putText(self.background, "AI Mock Interview Dashboard",
+                    (20, 40), FONT, 1.0, (0, 255, 0), 2)
+        self.canvas = self.background.copy()
+
+        # 그리는 순서 = 겹칠 때 위에 올라가는 순서 (기존 main 과 동일)
+        self.panels = {}
+        for panel in (
+            _Panel("pose", (20, 50, 370, 330), image_rect=(20, 80, 370, 330)),
+            _Panel("gaze", (400, 50, 750, 330), image_rect=(400, 80, 750, 330)),
+            _Panel("hands", (400, 350, 750, 600), image_rect=(400, 350, 750, 600)),
+            _Panel("expression", (20, 352, 395, 392)),
+            _Panel("voice", (20, 402, width - 20, 440)),
+            _Panel("events", (20, 450, 395, 490)),
+        ):
+            self.panels[panel.name] = panel
+
+        for a in self.panels.values():
+            a.overlaps = [b for b in self.panels.values() if b is not a and _intersects(a.rect, b.rect)]
+
+        self.event_log = None     # bind_events() 한 GazeEventLog
+        self._event_seen = 0      # 마지막으로 읽은 이벤트 번호
+
+        self.renders = 0
+
+    # -------------------------------
+    # 결과 갱신 (그리지는 않음)
+    # -------------------------------
+    def bind(self, name, slot):
+        """패널을 결과 슬롯에 연결 → render() 가 슬롯 version 으로 새 결과 여부 판단"""
+        self.panels[name].source = slot
+
+    def bind_events(self, log):
+        """이탈 패널을 시선 이벤트 로그에 연결 → render() 때 새 이벤트만 읽어 누적"""
+        self.event_log = log
+        self._event_seen = 0
+
+    def _pull(self):
+        for panel in self.panels.values():
+            if panel.source is None:
+                continue
+            version, data, stamp = panel.source.get_stamped()
+            if version != panel.version and data is not None:
+                panel.version, panel.data, panel.stamp = version, data, stamp
+        if self.event_log is not None:
+            self._pull_events()
+
+    def _pull_events(self):
+        new = self.event_log.since(self._event_seen)
+        if not new:
+            return
+        self._event_seen = new[-1][0]
+
+        panel = self.panels["events"]
+        state = panel.data or {"count": 0, "now": None, "last": None}
+        for _, event in new:
+            if event.kind == DEVIATION_START:
+                state["count"] += 1
+                state["now"] = event.direction
+            elif event.kind == DEVIATION_TURN:
+                state["now"] = event.direction
+            elif event.kind == DEVIATION_END:
+                state["now"] = None
+                state["last"] = event.duration
+        panel.data = state
+        panel.version += 1
+
+    def set(self, name, data, stamp=None):
+        if data is None:
+            return
+        panel = self.panels[name]
+        panel.data = data
+        panel.stamp = stamp
+        panel.version += 1
+
+    # -------------------------------
+    # 그리기
+    # -------------------------------
+    def wait_ms(self, now=None):
+        """다음 화면 갱신까지 남은 시간 (cv2.waitKey 인자, 최소 1ms)"""
+        now = time.perf_counter() if now is None else now
+        return max(1, int((self._next_due - now) * 1000))
+
+    def render(self, now=None):
+        """
+        갱신할 때가 됐고 바뀐 패널이 있으면 캔버스를 고치고 True
+        (False 면 imshow 할 필요 없음)
+        """
+        now = time.perf_counter() if now is None else now
+        if now < self._next_due:
+            return False
+
+        self._pull()
+        dirty = self._dirty_closure()
+        if not dirty:
+            # 바뀐 게 없음 → 잠깐 뒤 다시 확인 (갱신 간격보다 길게 기다리지는 않음)
+            self._next_due = now + min(self.interval or self.IDLE_RECHECK, self.IDLE_RECHECK)
+            return False
+
+        # 겹치는 패널까지 배경으로 지운 뒤, 원래 순서대로 다시 그림
+        for panel in dirty:
+            x1, y1, x2, y2 = panel.rect
+            self.canvas[y1:y2, x1:x2] = self.background[y1:y2, x1:x2]
+        for panel in self.panels.values():
+            if panel in dirty:
+                if panel.data is not None:
+                    getattr(self, f"_draw_{panel.name}")(panel)
+                    self._record_display(panel)
+                panel.drawn = panel.version
+
+        self._next_due = now + self.interval
+        self.renders += 1
+        return True
+
+    def _record_display(self, panel):
+        """새 결과가 화면에 처음 그려질 때 캡처 → 표시 지연 기록 (겹쳐서 다시 그린 건 제외)"""
+        if panel.stamp is None or panel.version == panel.drawn:
+            return
+        latency_tracker.record(panel.name, "display", time.perf_counter() - panel.stamp.captured)
+
+    def _dirty_closure(self):
+        dirty = [p for p in self.panels.values() if p.dirty]
+        i = 0
+        while i < len(dirty):
+            for other in dirty[i].overlaps:
+                if other not in dirty:
+                    dirty.append(other)
+            i += 1
+        return dirty
+
+    def _blit(self, panel, frame, overlay=None):
+        """원본 프레임 → 패널 크기 버퍼로 축소 → (오버레이는 축소된 버퍼에) → 캔버스"""
+        x1, y1, x2, y2 = panel.image_rect
+        cv2.resize(frame, (x2 - x1, y2 - y1), dst=panel.buffer)
+        if overlay is not None:
+            overlay(panel.buffer)
+        self.canvas[y1:y2, x1:x2] = panel.buffer
+
+    # ========== 자세 =============
+    def _draw_pose(self, panel):
+        frame, motion, coords = panel.data
+        self._blit(panel, frame, lambda img: draw_pose(img, coords))
+        cv2.putText(self.canvas, f"Movement: {motion:.2f}",
+                    (20, 75), FONT, 0.7, WHITE, 2)
+
+    # ========== 시선 =============
+    def _draw_gaze(self, panel):
+        frame, g = panel.data
+        self._blit(panel, frame, lambda img: draw_gaze(img, g, source_width=frame.shape[1]))
+        cv2.putText(self.canvas, f"Gaze: {g.left_right} / {g.up_down}",
+                    (400, 75), FONT, 0.7, WHITE, 2)
+
+    # ========== 손 =============
+    def _draw_hands(self, panel):
+        frame, hands = panel.data
+        self._blit(panel, frame, lambda img: draw_hands(img, hands))
+
+    # ========== 표정 =============
+    def _draw_expression(self, panel):
+        emo = panel.data[1]
+        if isinstance(emo, dict):
+            cv2.putText(self.canvas, f"Expression: {emo['dominant']}",
+                        (20, 380), FONT, 0.8, WHITE, 2)
+
+    # ========== 시선 이탈 (이벤트) =============
+    def _draw_events(self, panel):
+        state = panel.data
+        if state["now"] is not None:
+            detail = f"now {state['now']}"
+        elif state["last"] is not None:
+            detail = f"last {state['last']:.1f}s"
+        else:
+            detail = "-"
+        cv2.putText(self.canvas, f"Look-away: {state['count']} ({detail})",
+                    (20, 478), FONT, 0.7, WHITE, 2)
+
+    # ========== 음성 =============
+    def _draw_voice(self, panel):
+        text = panel.data["text"]
+        safe_text = text[:50] if text else "(음성 인식 실패)"
+        cv2.putText(self.canvas, f"Voice: {safe_text}",
+                    (20, 430), FONT, 0.7, WHITE, 2)
+
+
+def _intersects(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
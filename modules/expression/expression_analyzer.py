@@ -0,0 +1,115 @@
+# modules/expression/expression_analyzer.py
+
+import cv2
+
+from modules import latency
+from modules.landmarks import landmark_array
+from modules.expression.emotion_recorg import emotion_detect
+from modules.expression.emotion_stabilizer import EmotionStabilizer
+
+
+class ExpressionAnalyzer:
+    """
+    얼굴 탐지(MediaPipe FaceDetection) → 얼굴 crop → 감정 분석 → 이동평균
+    감정 모델(emotion_detector)이 없으면 얼굴 탐지까지만 수행하고 None 반환
+    """
+
+    def __init__(self, emotion_detector=None, padding=20, tmp_path="exp_tmp.jpg"):
+        # MediaPipe Face Detection (그래프는 처음 쓸 때 생성 → Holistic 모드에서는 만들지 않음)
+        self._face_detection = None
+        self.emotion_detector = emotion_detector
+        self.padding = padding
+        self.tmp_path = tmp_path
+        self.stabilizer = EmotionStabilizer()  # 분석기마다 자기 이동평균 버퍼
+
+    @property
+    def face_detection(self):
+        if self._face_detection is None:
+            import mediapipe as mp
+            self._face_detection = mp.solutions.face_detection.FaceDetection(
+                model_selection=0,
+                min_detection_confidence=0.5
+            )
+        return self._face_detection
+
+    def process_frame(self, frame, rgb=None, roi=None, ts=None):
+        """
+        감정 결과 dict (raw / dominant / smooth) 또는 None
+        roi (FaceROITracker) 에 최근 얼굴 박스가 있으면 얼굴 탐지를 생략 (ts: 프레임 시각)
+        """
+        if roi is not None:
+            box = roi.face_box(ts)
+            if box is not None:
+                return self.process_box(frame, box)
+
+        h, w, _ = frame.shape
+
+        # 공유 프레임에서 이미 만든 RGB가 있으면 재사용
+        if rgb is None:
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        # 얼굴 탐지 (MediaPipe)
+        result = self.face_detection.process(rgb)
+        latency.mark("inference")
+
+        if not result.detections:
+            return None
+
+        det = result.detections[0]
+        bbox = det.location_data.relative_bounding_box
+
+        x1 = int(bbox.xmin * w)
+        y1 = int(bbox.ymin * h)
+        x2 = int((bbox.xmin + bbox.width) * w)
+        y2 = int((bbox.ymin + bbox.height) * h)
+
+        return self.process_box(frame, (x1, y1, x2, y2))
+
+    @staticmethod
+    def box_from_landmarks(landmarks, w, h):
+        """얼굴 랜드마크(FaceMesh / Holistic, 또는 (N, 3) 배열) 외곽으로 얼굴 박스 (x1, y1, x2, y2)"""
+        points = landmark_array(landmarks)[:, :2]
+        (x1, y1), (x2, y2) = points.min(axis=0).tolist(), points.max(axis=0).tolist()
+        return int(x1 * w), int(y1 * h), int(x2 * w), int(y2 * h)
+
+    def process_box(self, frame, box):
+        """이미 찾은 얼굴 박스로 crop → 감정 분석"""
+        padding = self.padding
+        h, w, _ = frame.shape
+        x1, y1, x2, y2 = box
+
+        # 패딩 적용 + 이미지 범위 체크
+        x1 = max(0, x1 - padding)
+        y1 = max(0, y1 - padding)
+        x2 = min(w, x2 + padding)
+        y2 = min(h, y2 + padding)
+
+        if x2 <= x1 or y2 <= y1:
+            return None
+
+        crop = frame[y1:y2, x1:x2]
+
+        # 감정 분석이 파일 기반이므로 이미지 저장
+        cv2.imwrite(self.tmp_path, crop)
+        latency.mark("convert")
+
+        emo_raw = None
+        if self.emotion_detector is not None:
+            # 🔥 감정 모델이 있을 때만 실행
+            try:
+                emo_raw = emotion_detect(self.tmp_path, self.emotion_detector)
+                latency.mark("inference")
+            except Exception as e:
+                print(f"❌ emotion_detect error: {e}")
+                emo_raw = None
+
+        if not emo_raw:
+            return None
+
+        emo_smooth = self.stabilizer(emo_raw)
+
+        return {
+            "raw": emo_raw["emotions"],
+            "dominant": emo_raw["dominant"],
+            "smooth": emo_smooth["smoothed"] if emo_smooth else emo_raw["emotions"],
+        }
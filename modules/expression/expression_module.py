@@ -1,9 +1,5 @@
 import cv2
 import numpy as np
-import matplotlib.pyplot as plt
-
-plt.rcParams["font.family"] = "Malgun Gothic" # 한글 폰트 호환성 설정
-plt.rcParams["axes.unicode_minus"] = False
 
 F_PADDING = 20
 
@@ -126,6 +122,10 @@ def emo_stabilize(data, window_size = 5):
 # 시각화 함수
 def visualize_emo_data(data=None):
     if data is not None:
+        # matplotlib 은 그래프를 그릴 때만 import (모듈 import 를 가볍게)
+        import matplotlib.pyplot as plt
+        plt.rcParams["font.family"] = "Malgun Gothic" # 한글 폰트 호환성 설정
+        plt.rcParams["axes.unicode_minus"] = False
 
         categories = list(data[0].keys())
         emotion_series = {cat: [] for cat in categories}
@@ -2,98 +2,70 @@
 
 import cv2
 import threading
-import queue
-import mediapipe as mp
+import time
 
-from modules.expression.emotion_recorg import emotion_detect
-from modules.expression.emotion_stabilizer import emo_stabilizer
-from modules.shared_flags import RUNNING
+from modules.expression.expression_analyzer import ExpressionAnalyzer
+import modules.shared_flags as flags
+import modules.result_sink as result_sink
+from modules.scheduler import analyzer_scheduler
+from modules.face_roi import face_roi
 
 # 🔥 공용 카메라 프레임
-from modules.camera.camera_manager import shared_frame_queue
+from modules.camera.camera_manager import frame_bus
+from modules.latest_slot import LatestSlot
+from modules.latency import FrameStamp, latency_tracker
+from modules.startup import DUMMY_FRAME, startup
 
 # 결과 → main.py
-expression_result_queue = queue.Queue(maxsize=5)
-
-# MediaPipe Face Detection
-mp_face_detection = mp.solutions.face_detection.FaceDetection(
-    model_selection=0,
-    min_detection_confidence=0.5
-)
+expression_result_slot = LatestSlot("expression")
 
 
 # =====================================================
 # 🙂 표정 분석 스레드 (카메라 공유 버전)
 # =====================================================
 def expression_worker(emotion_detector=None, padding=20):
+    # 구독 전에 얼굴 탐지 그래프 생성 + 더미 프레임 1장 (다른 분석 스레드와 동시에)
+    analyzer = startup.warm_up(
+        "expression", lambda: ExpressionAnalyzer(emotion_detector, padding=padding),
+        lambda a: a.process_frame(DUMMY_FRAME),
+    )
+    frames = frame_bus.subscribe("expression")
     print("🙂 Expression Thread Started")
 
-    while RUNNING:
+    while flags.running():
 
-        # 카메라 프레임이 아직 없으면 패스
-        if shared_frame_queue.empty():
+        # 새 프레임이 올 때까지 블로킹 대기 (타임아웃마다 종료 플래그 확인)
+        item = frames.wait(timeout=0.1)
+        if item is None:
+            # 동영상/이미지 소스가 끝났으면 종료
+            if frames.finished:
+                break
             continue
 
-        # 공용 프레임 사용
-        frame = shared_frame_queue.get()
-
-        h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-        # 얼굴 탐지 (MediaPipe)
-        result = mp_face_detection.process(rgb)
-
-        result_data = None
-
-        if result.detections:
-            det = result.detections[0]
-            bbox = det.location_data.relative_bounding_box
+        # 공용 프레임 사용 (RGB 변환은 공유 프레임 캐시)
+        seq, views = item
+        frame = views.bgr
 
-            x1 = int(bbox.xmin * w)
-            y1 = int(bbox.ymin * h)
-            x2 = int((bbox.xmin + bbox.width) * w)
-            y2 = int((bbox.ymin + bbox.height) * h)
-
-            # 패딩 적용 + 이미지 범위 체크
-            x1 = max(0, x1 - padding)
-            y1 = max(0, y1 - padding)
-            x2 = min(w, x2 + padding)
-            y2 = min(h, y2 + padding)
-
-            if x2 > x1 and y2 > y1:
-                crop = frame[y1:y2, x1:x2]
-
-                # 감정 분석이 파일 기반이므로 이미지 저장
-                cv2.imwrite("exp_tmp.jpg", crop)
-
-                emo_raw = None
-                if emotion_detector is not None:
-                    # 🔥 감정 모델이 있을 때만 실행
-                    try:
-                        emo_raw = emotion_detect("exp_tmp.jpg", emotion_detector)
-                    except Exception as e:
-                        print(f"❌ emotion_detect error: {e}")
-                        emo_raw = None
-
-                if emo_raw:
-                    emo_smooth = emo_stabilizer(emo_raw)
+        # 목표 fps / CPU 예산에 따라 이번 프레임은 건너뛰기
+        if not analyzer_scheduler.should_run("expression", seq, views.ts):
+            continue
+        started = time.perf_counter()
 
-                    result_data = {
-                        "raw": emo_raw["emotions"],
-                        "dominant": emo_raw["dominant"],
-                        "smooth": emo_smooth["smoothed"] if emo_smooth else emo_raw["emotions"],
-                    }
+        with latency_tracker.clock("expression", views.captured) as clock:
+            rgb = views.rgb
+            clock.mark("convert")
 
-        # 최신 데이터만 유지
-        if expression_result_queue.full():
-            try:
-                expression_result_queue.get_nowait()
-            except:
-                pass
+            # gaze 스레드가 추적 중인 얼굴 박스가 있으면 얼굴 탐지 생략
+            result_data = analyzer.process_frame(frame, rgb, roi=face_roi, ts=views.ts)
+            clock.mark("postprocess")
+            analyzer_scheduler.record("expression", time.perf_counter() - started)
+            result_sink.emit("expression", seq, views.ts, {"emotion": result_data}, views.captured)
 
-        expression_result_queue.put((frame, result_data))
+            # 최신 데이터만 유지
+            expression_result_slot.publish((frame, result_data), FrameStamp(seq, views.ts, views.captured))
+            clock.mark("publish")
 
-    print("🙂 Expression Thread Stopped")
+    print(f"🙂 Expression Thread Stopped (dropped {frames.dropped} frames)")
 
 
 # =====================================================
@@ -106,6 +78,7 @@ def start_expression_thread(emotion_detector=None):
         daemon=True
     )
     t_ex.start()
+    flags.lifecycle.add_thread("expression", t_ex)  # 종료 시 타임아웃 join
     print("🚀 expression_thread_example 실행됨! (Camera 공유 버전)")
     return t_ex
 
@@ -115,17 +88,17 @@ def start_expression_thread(emotion_detector=None):
 # =====================================================
 if __name__ == "__main__":
     from modules.camera.camera_manager import start_camera_thread
-    import modules.shared_flags as flags
 
-    flags.RUNNING = True
     start_camera_thread()
 
     # 지금은 감정모델 없음 → None
     start_expression_thread(None)
 
+    seen = 0
     while True:
-        if not expression_result_queue.empty():
-            frame, emo = expression_result_queue.get()
+        item = expression_result_slot.wait_newer(seen, timeout=0.03)
+        if item is not None:
+            seen, (frame, emo) = item
 
             if emo:
                 print("dominant:", emo["dominant"])
@@ -133,7 +106,7 @@ if __name__ == "__main__":
             cv2.imshow("Expression Thread Debug", frame)
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
-            flags.RUNNING = False
+            flags.stop_token.set()
             break
 
     cv2.destroyAllWindows()
@@ -1,7 +1,7 @@
 # 별도로 face_setup 기능이 불필요하다 판단하여 face_detect에 통합
 import cv2
 from emotion_detect import emotion_detect
-from emotion_stabilizer import emo_stabilizer
+from emotion_stabilizer import EmotionStabilizer
 
 def face_detect(video_path, detector=None, frame_interval=30, display=True):
     frame_crop = None
@@ -11,6 +11,7 @@ def face_detect(video_path, detector=None, frame_interval=30, display=True):
         return
 
     frame_count = 0
+    emo_stabilizer = EmotionStabilizer()
     while True:
         ret, frame = cap.read()
         if not ret:
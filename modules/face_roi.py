@@ -0,0 +1,157 @@
+# modules/face_roi.py
+
+import threading
+import time
+
+from modules.landmarks import landmark_array
+
+
+# =====================================================
+# 🎯 얼굴 ROI 추적 (gaze / expression 공유)
+# =====================================================
+class FaceROITracker:
+    """
+    직전 프레임의 얼굴 랜드마크로 다음 프레임의 얼굴 영역(여유 포함)을 예측한다.
+
+      - gaze     : FaceMesh 를 전체 프레임 대신 predict() 영역 crop 에만 실행
+      - expression: 얼굴 탐지(FaceDetection) 없이 face_box() 로 바로 crop
+
+    crop 안에서 얼굴을 놓치거나(miss), 얼굴이 crop 가장자리에 붙으면 추적을 풀고
+    다음 프레임은 전체 프레임에서 다시 탐지한다.
+
+    좌표는 모두 전체 프레임 기준 픽셀 (x1, y1, x2, y2).
+    스레드 모드에서만 공유된다 (프로세스 모드의 expression 은 기존처럼 전체 탐지).
+    """
+
+    def __init__(self, padding=0.5, min_size=128, max_misses=1, edge_margin=0.05, max_age=0.5):
+        """
+        padding     : 얼굴 크기 대비 crop 여유 비율 (한쪽 기준)
+        min_size    : crop 최소 한 변(px)
+        max_misses  : crop 에서 연속으로 못 찾으면 전체 프레임 탐지로 전환할 횟수
+        edge_margin : 얼굴이 crop 가장자리에서 이 비율 이내면 추적 불안정 → 재탐지
+        max_age     : face_box() 가 유효한 시간(초, 프레임 시각 기준)
+        """
+        self.enabled = True
+        self.padding = padding
+        self.min_size = min_size
+        self.max_misses = max_misses
+        self.edge_margin = edge_margin
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._face = None     # 마지막 얼굴 박스 (랜드마크 외곽)
+        self._roi = None      # 다음 프레임 crop 영역
+        self._ts = None       # 마지막 갱신 프레임 시각
+        self._misses = 0
+
+        # 통계
+        self.tracked = 0
+        self.full = 0
+        self.lost = 0
+
+    def reset(self):
+        with self._lock:
+            self._face = self._roi = self._ts = None
+            self._misses = 0
+
+    # -------------------------------
+    # gaze: crop 영역 예측 / 갱신
+    # -------------------------------
+    def predict(self, w, h):
+        """다음 FaceMesh 입력 영역. None 이면 전체 프레임"""
+        with self._lock:
+            roi = self._roi if self.enabled else None
+            if roi is not None and (roi[2] > w or roi[3] > h):
+                roi = self._roi = None  # 해상도가 바뀜
+            if roi is None:
+                self.full += 1
+            else:
+                self.tracked += 1
+            return roi
+
+    def update(self, landmarks, box, w, h, ts=None):
+        """
+        landmarks : crop(box) 기준 정규화 랜드마크 (box 가 None 이면 전체 프레임 기준)
+                    (N, 3) 배열 또는 MediaPipe 랜드마크
+        box       : 이번에 FaceMesh 에 넣은 영역 (predict() 반환값)
+        """
+        x0, y0, bw, bh = (0, 0, w, h) if box is None else (box[0], box[1], box[2] - box[0], box[3] - box[1])
+
+        points = landmark_array(landmarks)[:, :2]
+        (nx1, ny1), (nx2, ny2) = points.min(axis=0).tolist(), points.max(axis=0).tolist()
+        face = (
+            int(x0 + nx1 * bw), int(y0 + ny1 * bh),
+            int(x0 + nx2 * bw), int(y0 + ny2 * bh),
+        )
+
+        # 얼굴이 crop 가장자리에 붙었으면 잘렸을 수 있음 → 신뢰도 낮음, 다음 프레임은 재탐지
+        m = self.edge_margin
+        at_edge = box is not None and (nx1 < m or ny1 < m or nx2 > 1 - m or ny2 > 1 - m)
+
+        with self._lock:
+            self._face = face
+            self._ts = time.monotonic() if ts is None else ts
+            self._misses = 0
+            if at_edge:
+                self.lost += 1
+                self._roi = None
+            else:
+                self._roi = self._next_roi(face, box, w, h)
+
+    def miss(self):
+        """crop(또는 전체 프레임)에서 얼굴을 못 찾음"""
+        with self._lock:
+            self._misses += 1
+            if self._roi is not None and self._misses >= self.max_misses:
+                self.lost += 1
+                self._roi = None
+            self._face = None
+
+    def _next_roi(self, face, box, w, h):
+        fx1, fy1, fx2, fy2 = face
+        size = max(fx2 - fx1, fy2 - fy1)
+
+        # 얼굴이 아직 현재 crop 안쪽에 있고 크기도 비슷하면 crop 을 그대로 둠
+        # (매 프레임 crop 이 흔들리면 FaceMesh 내부 추적이 매번 어긋남)
+        if box is not None:
+            bw = box[2] - box[0]
+            inner = self.edge_margin * 2 * bw
+            if (box[0] + inner <= fx1 and box[1] + inner <= fy1 and
+                    fx2 <= box[2] - inner and fy2 <= box[3] - inner and
+                    size * (1 + 2 * self.padding) * 0.7 <= bw):
+                return box
+
+        side = max(self.min_size, int(size * (1 + 2 * self.padding)))
+        if side >= min(w, h):
+            return None  # 얼굴이 화면 대부분 → 전체 프레임이 더 나음
+
+        cx, cy = (fx1 + fx2) // 2, (fy1 + fy2) // 2
+        x1 = min(max(0, cx - side // 2), w - side)
+        y1 = min(max(0, cy - side // 2), h - side)
+        return x1, y1, x1 + side, y1 + side
+
+    # -------------------------------
+    # expression: 얼굴 박스 재사용
+    # -------------------------------
+    def face_box(self, ts=None):
+        """최근(max_age 이내) 얼굴 박스. 없으면 None → 직접 탐지"""
+        with self._lock:
+            if not self.enabled or self._face is None:
+                return None
+            now = time.monotonic() if ts is None else ts
+            if now - self._ts > self.max_age:
+                return None
+            return self._face
+
+    def stats(self):
+        total = self.tracked + self.full
+        return {
+            "tracked": self.tracked,
+            "full": self.full,
+            "lost": self.lost,
+            "tracked_ratio": self.tracked / total if total else 0.0,
+        }
+
+
+# 스레드 모드 공용 인스턴스
+face_roi = FaceROITracker()
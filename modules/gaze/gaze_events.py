@@ -0,0 +1,197 @@
+# modules/gaze/gaze_events.py
+"""
+시선 이벤트 — 프레임별 판정(정면 / 좌우 / 상하 / 깜빡임)을 구간 시작 / 끝 이벤트로
+
+GazeTracker 결과는 프레임마다 상태값이라 "언제부터 언제까지 왼쪽을 봤나" 를 알려면
+결과를 매 프레임 받아서 직접 이어 붙여야 한다. GazeEventSegmenter 는 상태가 바뀔 때만
+
+  fixation_start / fixation_end    : 정면 응시 구간
+  deviation_start / deviation_end  : 이탈 구간 (정면을 벗어났다가 돌아올 때까지 1개)
+  deviation_turn                   : 이탈 중 방향이 바뀜 (LEFT → LEFT_UP 등, 구간은 이어짐)
+  blink_start / blink_end          : 깜빡임
+
+이벤트를 낸다. *_end 이벤트는 구간 길이(duration, 소스 시각 기준)를 같이 가진다.
+deviation_start / turn 의 direction 은 그 시점 방향, deviation_end 는 구간에서 가장 오래 본 방향.
+깜빡이는 프레임은 GazeSession 처럼 정면 / 이탈 판정에서 빼므로 깜빡임이 구간을 끊지 않는다.
+(GazeSession 의 deviation_count 는 측정 중 + 0.05~10초 구간만 세므로 이탈 구간 수와 다를 수 있음)
+
+분할은 결과를 만드는 쪽(분석 스레드 / 프로세스 모드는 자식)에서 하고, 이벤트만 넘긴다.
+GazeEventLog 는 최근 이벤트만 보관하는 고정 크기 로그 + 구독 콜백.
+소비하는 쪽(sink / 기록기 / 대시보드)은 프레임마다 결과를 polling 하는 대신 subscribe() 하거나 since() 로 새 이벤트만 읽는다.
+"""
+
+import threading
+from collections import Counter, deque, namedtuple
+
+# seq: 버스 번호, ts: 소스 시각, captured: 캡처 순간 perf_counter (FrameStamp 와 같은 기준)
+GazeEvent = namedtuple("GazeEvent", "kind direction ts captured seq duration")
+
+FIXATION_START, FIXATION_END = "fixation_start", "fixation_end"
+DEVIATION_START, DEVIATION_TURN, DEVIATION_END = "deviation_start", "deviation_turn", "deviation_end"
+BLINK_START, BLINK_END = "blink_start", "blink_end"
+
+CENTER = "CENTER"
+
+
+def gaze_direction(left_right, up_down):
+    """("Left", "Up") → "LEFT_UP", 둘 다 정면이면 "CENTER" (GazeSession 과 같은 대소문자 무시 판정)"""
+    parts = [d for d in (str(left_right).upper(), str(up_down).upper()) if d != CENTER]
+    return "_".join(parts) if parts else CENTER
+
+
+# =====================================================
+# ✂️ 프레임 상태 → 구간 이벤트
+# =====================================================
+class GazeEventSegmenter:
+    """분석기 1개(= 프레임 순서대로 호출하는 스레드 1개) 전용. 스레드 안전하지 않음"""
+
+    def __init__(self):
+        self.direction = None        # 현재 방향 (None = 아직 프레임 없음)
+        self.started = None          # 진행 중 정면 / 이탈 구간 시작 (ts)
+        self.turned = None           # 이탈 중 현재 방향이 시작된 시각 (ts)
+        self.directions = {}         # 진행 중 이탈 구간의 방향별 시간 (끝날 때 가장 긴 방향)
+        self.blink_started = None    # 진행 중 깜빡임 시작 (ts)
+        self.last = None             # 마지막 프레임 (ts, captured, seq) — close() 기본값
+
+    def update(self, state, ts, captured=None, seq=None):
+        """
+        state : GazeSession.update() 가 돌려준 GazeState (left_right / up_down / is_blinking)
+        반환  : 이번 프레임에서 생긴 이벤트 list (대부분 빈 list)
+        """
+        events = []
+        self.last = (ts, captured, seq)
+
+        if state.is_blinking:
+            if self.blink_started is None:
+                self.blink_started = ts
+                events.append(GazeEvent(BLINK_START, None, ts, captured, seq, None))
+            return events
+        if self.blink_started is not None:
+            events.append(GazeEvent(BLINK_END, None, ts, captured, seq, ts - self.blink_started))
+            self.blink_started = None
+
+        direction = gaze_direction(state.left_right, state.up_down)
+        if direction == self.direction:
+            return events
+
+        if self.direction is not None and self.direction != CENTER and direction != CENTER:
+            # 이탈 중 방향만 바뀜 → 같은 구간
+            self._turn(ts)
+            self.direction = direction
+            events.append(GazeEvent(DEVIATION_TURN, direction, ts, captured, seq, None))
+            return events
+
+        if self.direction is not None:
+            events.append(self._end(ts, captured, seq))
+        self.direction = direction
+        self.started = self.turned = ts
+        self.directions = {}
+        kind = FIXATION_START if direction == CENTER else DEVIATION_START
+        events.append(GazeEvent(kind, direction, ts, captured, seq, None))
+        return events
+
+    def _turn(self, ts):
+        self.directions[self.direction] = self.directions.get(self.direction, 0.0) + ts - self.turned
+        self.turned = ts
+
+    def _end(self, ts, captured, seq):
+        if self.direction == CENTER:
+            return GazeEvent(FIXATION_END, CENTER, ts, captured, seq, ts - self.started)
+        self._turn(ts)
+        dominant = max(self.directions, key=self.directions.get)
+        return GazeEvent(DEVIATION_END, dominant, ts, captured, seq, ts - self.started)
+
+    def close(self, ts=None, captured=None, seq=None):
+        """종료 시 진행 중 깜빡임 / 구간 마감 (기본: 마지막 프레임 시각)"""
+        if ts is None:
+            if self.last is None:
+                return []
+            ts, captured, seq = self.last
+
+        events = []
+        if self.blink_started is not None:
+            events.append(GazeEvent(BLINK_END, None, ts, captured, seq, ts - self.blink_started))
+            self.blink_started = None
+        if self.direction is not None:
+            events.append(self._end(ts, captured, seq))
+            self.direction = self.started = self.turned = None
+            self.directions = {}
+        return events
+
+
+# =====================================================
+# 📜 고정 크기 이벤트 로그 + 구독
+# =====================================================
+class GazeEventLog:
+    """
+    append(event) : 번호를 붙여 보관 (maxlen 을 넘으면 오래된 것부터 버림) → 구독 콜백 호출
+    subscribe(fn) : fn(event) 를 이벤트를 넣은 스레드에서 호출 (무거운 일은 큐로 넘길 것)
+    since(after)  : after 번 이후 이벤트 [(번호, event)] — 늦게 읽어 버려진 만큼은 빠짐
+
+    count  : 지금까지 들어온 이벤트 수 (= 마지막 번호)
+    kinds  : 종류별 개수
+    """
+
+    def __init__(self, maxlen=1024):
+        self._events = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._subscribers = ()
+        self.count = 0
+        self.kinds = Counter()
+
+    def subscribe(self, fn):
+        with self._lock:
+            self._subscribers = self._subscribers + (fn,)
+        return fn
+
+    def unsubscribe(self, fn):
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s is not fn)
+
+    def append(self, event):
+        with self._lock:
+            self.count += 1
+            self._events.append((self.count, event))
+            self.kinds[event.kind] += 1
+            subscribers = self._subscribers
+        for fn in subscribers:
+            try:
+                fn(event)
+            except Exception as e:
+                print(f"❌ gaze event subscriber error: {e}")
+
+    def extend(self, events):
+        for event in events:
+            self.append(event)
+
+    def since(self, after=0):
+        with self._lock:
+            if self.count <= after:
+                return []
+            return [item for item in self._events if item[0] > after]
+
+    def recent(self, n=None):
+        with self._lock:
+            events = [event for _, event in self._events]
+        return events if n is None else events[-n:]
+
+    def summary(self):
+        with self._lock:
+            return {"events": self.count, "kept": len(self._events), "kinds": dict(self.kinds)}
+
+
+def event_record(event):
+    """sink / 기록기용 dict (captured 는 프로세스 안에서만 의미 있는 perf_counter 라 뺌)"""
+    return {"kind": event.kind, "direction": event.direction, "seq": event.seq,
+            "ts": event.ts, "duration": event.duration}
+
+
+def print_event_summary(summary, prefix="[GAZE]"):
+    kinds = summary["kinds"]
+    print(f"{prefix} 시선 이벤트 {summary['events']}개 — 정면 구간 {kinds.get(FIXATION_START, 0)}개 / "
+          f"이탈 구간 {kinds.get(DEVIATION_START, 0)}개 (방향 전환 {kinds.get(DEVIATION_TURN, 0)}) / "
+          f"깜빡임 {kinds.get(BLINK_START, 0)}회")
+
+
+# 단일 모드(thread / process / async) 공용 로그 — 세션 호스트는 세션마다 따로
+gaze_events = GazeEventLog()
@@ -1,17 +1,17 @@
 import cv2
-import mediapipe as mp
 import math
+import numpy as np
+
+from modules import latency
+from modules.landmarks import LandmarkBuffer
 
 class GazeTracker:
     def __init__(self):
-        # MediaPipe FaceMesh 초기화
+        # MediaPipe FaceMesh 초기화 (그래프는 처음 쓸 때 생성 → Holistic 모드에서는 만들지 않음)
+        import mediapipe as mp
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        self._face_mesh = None
+        self._points = LandmarkBuffer()  # 랜드마크 → (478, 3) 배열 (프레임마다 재사용)
 
         # ---------------------------------------------------------
         # [변수명 유지] 상수 및 설정값
@@ -67,126 +67,174 @@ class GazeTracker:
         self.gaze_direction_y = "Center"
         self.is_blinking = False
         self.current_avg_ear = 0.0
-
-    def _get_pixel_coords(self, landmarks, index, w, h):
-        lm = landmarks[index]
-        return int(lm.x * w), int(lm.y * h)
-
-    def _get_ear(self, landmarks, indices, w, h):
-        top = self._get_pixel_coords(landmarks, indices[0], w, h)
-        bot = self._get_pixel_coords(landmarks, indices[1], w, h)
-        in_ = self._get_pixel_coords(landmarks, indices[2], w, h)
-        out = self._get_pixel_coords(landmarks, indices[3], w, h)
+        self.face_found = False  # 이번 프레임에서 얼굴을 찾았나 (못 찾으면 위 상태값은 직전 그대로)
+
+    @property
+    def face_mesh(self):
+        if self._face_mesh is None:
+            self._face_mesh = self.mp_face_mesh.FaceMesh(
+                max_num_faces=1,
+                refine_landmarks=True,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+        return self._face_mesh
+
+    @staticmethod
+    def _get_pixel_coords(points, indices, w, h):
+        """(N, 3) 정규화 좌표 배열 → indices 점들의 픽셀 좌표 [(x, y), ...] (int() 와 같은 버림)"""
+        return (points[indices, :2].astype(np.float64) * (w, h)).astype(np.int64).tolist()
+
+    @staticmethod
+    def _get_ear(top, bot, in_, out):
         vert = math.dist(top, bot)
         horiz = math.dist(in_, out)
         return vert / horiz if horiz > 0 else 0
 
-    def process_frame(self, image):
+    def process_frame(self, image, image_rgb=None, draw=True, roi=None, ts=None):
         """
         메인 로직: 이미지를 받아서 분석하고, 그림을 그려서 돌려줌
+        image_rgb 를 넘기면 (공유 프레임의 RGB 캐시) 색 변환을 생략
+        draw=False 면 그리지 않고 입력 이미지를 그대로 돌려줌 (상태값만 갱신)
+        roi (FaceROITracker) 를 넘기면 직전 얼굴 주변 crop 에만 FaceMesh 실행 (ts: 프레임 시각)
         """
-        image.setflags(write=False)
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        if image_rgb is None:
+            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         #image_rgb = cv2.flip(image_rgb, 1)
-        results = self.face_mesh.process(image_rgb)
-        image.setflags(write=True)
-        image = cv2.cvtColor(image_rgb, cv2.COLOR_RGB2BGR)
 
         image_height, image_width, _ = image.shape
 
+        # 얼굴 주변만 잘라서 추론 (추적을 놓쳤으면 전체 프레임)
+        box = roi.predict(image_width, image_height) if roi is not None else None
+        if box is not None:
+            x1, y1, x2, y2 = box
+            mesh_input = np.ascontiguousarray(image_rgb[y1:y2, x1:x2])
+            mesh_width, mesh_height = x2 - x1, y2 - y1
+        else:
+            mesh_input = image_rgb
+            mesh_width, mesh_height = image_width, image_height
+
+        latency.mark("convert")  # 얼굴 crop 복사
+        self.face_found = False
+        results = self.face_mesh.process(mesh_input)
+        latency.mark("inference")
+
+        # 입력 프레임은 다른 스레드와 공유 → RGB→BGR 재변환 대신 그리기용 복사본만 생성
+        if draw:
+            image = image.copy()
+
         if results.multi_face_landmarks:
             for face_landmarks in results.multi_face_landmarks:
-                landmarks = face_landmarks.landmark
-
-                try:
-                    # --- [추가] 0. 깜빡임 감지 (EAR) ---
-                    l_ear = self._get_ear(landmarks, self.LEFT_EYE_EAR_IDX, image_width, image_height)
-                    r_ear = self._get_ear(landmarks, self.RIGHT_EYE_EAR_IDX, image_width, image_height)
-                    self.current_avg_ear = (l_ear + r_ear) / 2.0
-
-                    if self.current_avg_ear < self.BLINK_THRESHOLD:
-                        self.is_blinking = True
-                        # 눈을 감으면 시선 계산 건너뜀 (continue 대신 else로 분기 처리)
-                    else:
-                        self.is_blinking = False
-
-                        # ---------------------------------------------
-                        # 기존 시선 계산 로직
-                        # ---------------------------------------------
-
-                        # --- 1. Anchor (미간) ---
-                        anchor_point = self._get_pixel_coords(landmarks, self.STABLE_ANCHOR_POINT, image_width,
-                                                              image_height)
-
-                        # --- 2. 정규화 기준 거리 ---
-                        L_inner = self._get_pixel_coords(landmarks, self.LEFT_EYE_INNER_CORNER, image_width,
-                                                         image_height)
-                        R_inner = self._get_pixel_coords(landmarks, self.RIGHT_EYE_INNER_CORNER, image_width,
-                                                         image_height)
-                        stable_dist = math.dist(L_inner, R_inner)
-                        if stable_dist == 0: stable_dist = 1
-
-                        # --- 3. 눈동자 중심 ---
-                        L_iris_pts = [self._get_pixel_coords(landmarks, i, image_width, image_height) for i in
-                                      self.LEFT_IRIS_HORIZONTAL]
-                        center_left_x = sum([p[0] for p in L_iris_pts]) // 2
-                        center_left_y = sum([p[1] for p in L_iris_pts]) // 2
-
-                        R_iris_pts = [self._get_pixel_coords(landmarks, i, image_width, image_height) for i in
-                                      self.RIGHT_IRIS_HORIZONTAL]
-                        center_right_x = sum([p[0] for p in R_iris_pts]) // 2
-                        center_right_y = sum([p[1] for p in R_iris_pts]) // 2
-
-                        avg_pupil_x = (center_left_x + center_right_x) / 2.0
-                        avg_pupil_y = (center_left_y + center_right_y) / 2.0
-
-                        # --- 4. 시선 Metric ---
-                        curr_metric_x = (avg_pupil_x - anchor_point[0]) / stable_dist
-                        curr_metric_y = (avg_pupil_y - anchor_point[1]) / stable_dist
-
-                        # 보정(c키)을 위해 현재 값 저장
-                        self.current_metric_x = curr_metric_x
-                        self.current_metric_y = curr_metric_y
-
-                        # --- 5. 보정값과의 차이 ---
-                        diff_x_raw = curr_metric_x - self.calibrated_metric_x
-                        diff_y_raw = curr_metric_y - self.calibrated_metric_y
-
-                        # --- 6. EMA 적용 ---
-                        if not self.ema_initialized:
-                            self.ema_diff_x = diff_x_raw
-                            self.ema_diff_y = diff_y_raw
-                            self.ema_initialized = True
-                        else:
-                            self.ema_diff_x = (1 - self.EMA_ALPHA) * self.ema_diff_x + self.EMA_ALPHA * diff_x_raw
-                            self.ema_diff_y = (1 - self.EMA_ALPHA) * self.ema_diff_y + self.EMA_ALPHA * diff_y_raw
-
-                        diff_x = self.ema_diff_x
-                        diff_y = self.ema_diff_y
-
-                        # 좌우 판단
-                        if diff_x > self.GAZE_THRESHOLD_X:
-                            self.gaze_direction_x = "Right"
-                        elif diff_x < -self.GAZE_THRESHOLD_X:
-                            self.gaze_direction_x = "Left"
-                        else:
-                            self.gaze_direction_x = "Center"
-
-                        # 상하 판단
-                        if diff_y < -self.GAZE_THRESHOLD_Y:
-                            self.gaze_direction_y = "Up"
-                        elif diff_y > self.GAZE_THRESHOLD_Y:
-                            self.gaze_direction_y = "Down"
-                        else:
-                            self.gaze_direction_y = "Center"
-
-                except Exception:
-                    pass
+                # 랜드마크는 한 번만 배열로 (시선 / EAR / 얼굴 ROI 가 같이 씀)
+                points = self._points(face_landmarks)
+                # 시선/EAR 값은 비율이라 crop 기준 좌표로 계산해도 전체 프레임과 동일
+                self.update_from_landmarks(points, mesh_width, mesh_height)
+                if roi is not None:
+                    roi.update(points, box, image_width, image_height, ts=ts)
+        elif roi is not None:
+            roi.miss()
 
         # --- UI 텍스트 표시 (그리기 함수 호출) ---
-        self._draw_ui(image, image_width, image_height)
+        if draw:
+            self._draw_ui(image, image_width, image_height)
         return image
 
+    def update_from_landmarks(self, landmarks, image_width, image_height):
+        """
+        얼굴 랜드마크(홍채 포함 478개)로 깜빡임/시선 상태만 갱신
+        FaceMesh 결과뿐 아니라 Holistic 의 face_landmarks 도 그대로 받을 수 있음
+        (NormalizedLandmarkList / .landmark 반복 필드 / (N, 3) 배열)
+        """
+        self.face_found = True
+        try:
+            points = landmarks if isinstance(landmarks, np.ndarray) else self._points(landmarks)
+
+            # 필요한 점 15개만 한 번에 픽셀 좌표로
+            # EAR 8 (좌 4 / 우 4) | 미간 1 | 안쪽 눈꼬리 2 | 홍채 4 (좌 2 / 우 2)
+            px = self._get_pixel_coords(points, [
+                *self.LEFT_EYE_EAR_IDX, *self.RIGHT_EYE_EAR_IDX,
+                self.STABLE_ANCHOR_POINT, self.LEFT_EYE_INNER_CORNER, self.RIGHT_EYE_INNER_CORNER,
+                *self.LEFT_IRIS_HORIZONTAL, *self.RIGHT_IRIS_HORIZONTAL,
+            ], image_width, image_height)
+
+            # --- [추가] 0. 깜빡임 감지 (EAR) ---
+            l_ear = self._get_ear(*px[0:4])
+            r_ear = self._get_ear(*px[4:8])
+            self.current_avg_ear = (l_ear + r_ear) / 2.0
+
+            if self.current_avg_ear < self.BLINK_THRESHOLD:
+                self.is_blinking = True
+                # 눈을 감으면 시선 계산 건너뜀 (continue 대신 else로 분기 처리)
+            else:
+                self.is_blinking = False
+
+                # ---------------------------------------------
+                # 기존 시선 계산 로직
+                # ---------------------------------------------
+
+                # --- 1. Anchor (미간) ---
+                anchor_point = px[8]
+
+                # --- 2. 정규화 기준 거리 ---
+                L_inner, R_inner = px[9], px[10]
+                stable_dist = math.dist(L_inner, R_inner)
+                if stable_dist == 0: stable_dist = 1
+
+                # --- 3. 눈동자 중심 ---
+                L_iris_pts = px[11:13]
+                center_left_x = sum([p[0] for p in L_iris_pts]) // 2
+                center_left_y = sum([p[1] for p in L_iris_pts]) // 2
+
+                R_iris_pts = px[13:15]
+                center_right_x = sum([p[0] for p in R_iris_pts]) // 2
+                center_right_y = sum([p[1] for p in R_iris_pts]) // 2
+
+                avg_pupil_x = (center_left_x + center_right_x) / 2.0
+                avg_pupil_y = (center_left_y + center_right_y) / 2.0
+
+                # --- 4. 시선 Metric ---
+                curr_metric_x = (avg_pupil_x - anchor_point[0]) / stable_dist
+                curr_metric_y = (avg_pupil_y - anchor_point[1]) / stable_dist
+
+                # 보정(c키)을 위해 현재 값 저장
+                self.current_metric_x = curr_metric_x
+                self.current_metric_y = curr_metric_y
+
+                # --- 5. 보정값과의 차이 ---
+                diff_x_raw = curr_metric_x - self.calibrated_metric_x
+                diff_y_raw = curr_metric_y - self.calibrated_metric_y
+
+                # --- 6. EMA 적용 ---
+                if not self.ema_initialized:
+                    self.ema_diff_x = diff_x_raw
+                    self.ema_diff_y = diff_y_raw
+                    self.ema_initialized = True
+                else:
+                    self.ema_diff_x = (1 - self.EMA_ALPHA) * self.ema_diff_x + self.EMA_ALPHA * diff_x_raw
+                    self.ema_diff_y = (1 - self.EMA_ALPHA) * self.ema_diff_y + self.EMA_ALPHA * diff_y_raw
+
+                diff_x = self.ema_diff_x
+                diff_y = self.ema_diff_y
+
+                # 좌우 판단
+                if diff_x > self.GAZE_THRESHOLD_X:
+                    self.gaze_direction_x = "Right"
+                elif diff_x < -self.GAZE_THRESHOLD_X:
+                    self.gaze_direction_x = "Left"
+                else:
+                    self.gaze_direction_x = "Center"
+
+                # 상하 판단
+                if diff_y < -self.GAZE_THRESHOLD_Y:
+                    self.gaze_direction_y = "Up"
+                elif diff_y > self.GAZE_THRESHOLD_Y:
+                    self.gaze_direction_y = "Down"
+                else:
+                    self.gaze_direction_y = "Center"
+
+        except Exception:
+            pass
+
     def _draw_ui(self, image, w, h):
         # 1줄: 좌우
         text_x = 50
@@ -0,0 +1,501 @@
+# modules/gaze/gaze_session.py
+
+import time
+from collections import namedtuple
+
+# 프레임마다 대시보드 / 이벤트 분할로 넘기는 현재 상태 (build_result() 의 약 40개 필드 중 화면에 쓰는 것만)
+GazeState = namedtuple(
+    "GazeState",
+    "left_right up_down is_blinking ear calibrated blink_threshold center_ratio center_score final_gaze_score",
+)
+
+# 이탈로 인정하는 길이 (이보다 짧으면 떨림, 길면 측정 오류로 보고 버림)
+MIN_DEVIATION = 0.05
+MAX_DEVIATION = 10.0
+
+
+def score_center_ratio(center_ratio: float) -> int:
+    """
+    80% 이상 → 100점
+    30% 이하 → 0점
+    중간은 선형 증가
+    """
+    if center_ratio <= 30:
+        return 0
+    elif center_ratio >= 80:
+        return 100
+    else:
+        return int(round((center_ratio - 30) / 50 * 100))
+
+def score_avg_deviation_time(avg_deviation_time: float) -> int:
+    """
+    평균 이탈시간 점수화
+    - 1초 이하 → 100점
+    - 3초 이상 → 0점
+    - 그 사이는 선형 감소
+    """
+    if avg_deviation_time <= 1.0:
+        return 100
+    elif avg_deviation_time >= 3.0:
+        return 0
+    else:
+        score = (3.0 - avg_deviation_time) / 2.0 * 100
+        return int(round(score))
+
+
+# =====================================================
+# 📊 시선 누적값 (방향별 시간 + 이탈 시간 통계) — 구간끼리 합치기 가능
+# =====================================================
+class GazeSessionStats:
+    """
+    이탈 시간은 목록으로 쌓지 않고 개수 / 합 / 최대 + 고정 폭 히스토그램만 유지한다.
+    → 프레임마다 평균 / 최대 이탈 시간이 O(1), 메모리는 면접 길이와 무관.
+
+    snapshot() 은 JSON 으로 저장할 수 있는 dict, from_snapshot() / merge() 로
+    따로 측정한 구간(동영상 조각 / 세션 여러 개)을 합쳐 하나의 리포트를 만든다.
+    """
+
+    BIN_WIDTH = 0.25                             # 초
+    BINS = int(MAX_DEVIATION / BIN_WIDTH)        # 0 ~ 10초 (마지막 칸은 10초 포함)
+
+    # 깜빡임 제외 / 측정 중 시간 누적 (초)
+    TIME_FIELDS = (
+        "total_time", "center_time", "off_center_time",
+        "lr_off_time", "ud_off_time", "diag_off_time",
+        "left_time", "right_time", "up_time", "down_time",
+    )
+
+    def __init__(self):
+        for name in self.TIME_FIELDS:
+            setattr(self, name, 0.0)
+        self.deviation_count = 0
+        self.deviation_total = 0.0
+        self.deviation_max = 0.0
+        self.deviation_bins = [0] * self.BINS
+
+    def add_deviation(self, duration):
+        i = min(self.BINS - 1, int(duration / self.BIN_WIDTH))
+        self.deviation_bins[i] += 1
+        self.deviation_count += 1
+        self.deviation_total += duration
+        self.deviation_max = max(self.deviation_max, duration)
+
+    @property
+    def avg_deviation_time(self):
+        return self.deviation_total / self.deviation_count if self.deviation_count else 0.0
+
+    @property
+    def center_ratio(self):
+        return self.center_time / self.total_time * 100.0 if self.total_time > 0 else 0.0
+
+    def deviation_percentile(self, q):
+        """q (0~100) 번째 이탈 시간 — 해당 칸의 상한 (실제 최대값으로 자름)"""
+        if not self.deviation_count:
+            return None
+        rank = max(1, -(-self.deviation_count * q // 100))
+        seen = 0
+        for i, c in enumerate(self.deviation_bins):
+            seen += c
+            if seen >= rank:
+                return min((i + 1) * self.BIN_WIDTH, self.deviation_max)
+        return self.deviation_max
+
+    # -------------------------------
+    # 저장 / 합치기
+    # -------------------------------
+    def snapshot(self):
+        data = {name: getattr(self, name) for name in self.TIME_FIELDS}
+        data.update({
+            "deviation_count": self.deviation_count,
+            "deviation_total": self.deviation_total,
+            "deviation_max": self.deviation_max,
+            "bin_width": self.BIN_WIDTH,
+            "deviation_bins": list(self.deviation_bins),
+        })
+        return data
+
+    @classmethod
+    def from_snapshot(cls, data):
+        if data.get("bin_width") != cls.BIN_WIDTH or len(data.get("deviation_bins", ())) != cls.BINS:
+            raise ValueError(f"incompatible gaze stats bins: {data.get('bin_width')} x "
+                             f"{len(data.get('deviation_bins', ()))} (expected {cls.BIN_WIDTH} x {cls.BINS})")
+        stats = cls()
+        for name in cls.TIME_FIELDS:
+            setattr(stats, name, float(data[name]))
+        stats.deviation_count = int(data["deviation_count"])
+        stats.deviation_total = float(data["deviation_total"])
+        stats.deviation_max = float(data["deviation_max"])
+        stats.deviation_bins = [int(c) for c in data["deviation_bins"]]
+        return stats
+
+    def merge(self, other):
+        """other (GazeSessionStats / snapshot dict) 를 더함 → self"""
+        if isinstance(other, dict):
+            other = GazeSessionStats.from_snapshot(other)
+        for name in self.TIME_FIELDS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.deviation_count += other.deviation_count
+        self.deviation_total += other.deviation_total
+        self.deviation_max = max(self.deviation_max, other.deviation_max)
+        self.deviation_bins = [a + b for a, b in zip(self.deviation_bins, other.deviation_bins)]
+        return self
+
+    # -------------------------------
+    # 최종 리포트
+    # -------------------------------
+    def report(self):
+        """최종 점수 / 피드백 dict (GazeSession.finish() 와 같은 형식)"""
+        avg_deviation_time = self.avg_deviation_time
+        avg_deviation_score = score_avg_deviation_time(avg_deviation_time)
+        center_ratio = self.center_ratio
+        center_score = score_center_ratio(center_ratio)
+
+        #전체 면접에 대한 최종 합산 점수 계산
+        final_gaze_score = int(round((center_score * 0.6) + (avg_deviation_score * 0.4)))
+
+        feedback_text = generate_gaze_feedback(
+            final_gaze_score,
+            center_ratio,
+            avg_deviation_time,
+            self.left_time, self.right_time, self.up_time, self.down_time, self.off_center_time
+        )
+
+        return {
+            "final_gaze_score": final_gaze_score,
+            "center_score": center_score,
+            "center_ratio": center_ratio,
+            "center_time": self.center_time,
+            "total_time": self.total_time,
+            "avg_deviation_score": avg_deviation_score,
+            "avg_deviation_time": avg_deviation_time,
+            "deviation_count": self.deviation_count,
+            "max_deviation_time": self.deviation_max,
+            "off_center_time": self.off_center_time,
+            "left_time": self.left_time,
+            "right_time": self.right_time,
+            "up_time": self.up_time,
+            "down_time": self.down_time,
+            "feedback": feedback_text,
+            # 🔽 다른 구간과 합칠 때 (merge_gaze_reports)
+            "stats": self.snapshot(),
+        }
+
+
+def merge_gaze_reports(reports):
+    """구간별 finish() 리포트 (또는 stats snapshot) 여러 개 → 합친 최종 리포트"""
+    stats = GazeSessionStats()
+    for report in reports:
+        stats.merge(report.get("stats", report))
+    return stats.report()
+
+
+# =====================================================
+# 👁 면접 1회분 시선 누적 통계
+# =====================================================
+class GazeSession:
+    """
+    GazeTracker 의 프레임별 판정(좌우/상하/깜빡임)을 받아
+    정면 유지 비율, 이탈 시간, 이탈 방향, 점수를 누적 계산한다.
+
+    스레드 모드(gaze_worker)와 프로세스 모드(process_mode)가 같은 로직을 쓰도록 분리.
+    """
+
+    def __init__(self, measuring=False):
+        self.resets = -1
+        self.reset(measuring)
+
+    def reset(self, measuring=True):
+        """'c' 보정 시 호출 → 누적값 리셋 + 측정 시작"""
+        # ✅ "c키 이후"에만 측정 시작 (원치 않으면 True로 바꾸면 됨)
+        self.measuring_started = measuring
+        self.resets += 1  # 보정 횟수 (오프라인 재채점에서 누적 구간 구분)
+
+        # ✅ 깜빡임 제외 시간 / 이탈 방향 시간 / 이탈 시간 통계 누적 (measuring_started 이후)
+        self.stats = GazeSessionStats()
+
+        self.last_ts = time.perf_counter()
+
+        self.deviation_started = False
+        self.deviation_start_ts = None
+
+    def _close_deviation(self, now):
+        # OFF → CENTER (이탈 종료)
+        if self.deviation_started and self.deviation_start_ts is not None:
+            dur = now - self.deviation_start_ts
+            if MIN_DEVIATION <= dur <= MAX_DEVIATION:
+                self.stats.add_deviation(dur)
+            self.deviation_started = False
+            self.deviation_start_ts = None
+
+    def update(self, tracker, now=None):
+        """프레임 1장 처리 후 호출. 누적 갱신 + 현재 상태(GazeState) 반환"""
+
+        # ✅ 시간 누적(프레임 처리 기준)
+        if now is None:
+            now = time.perf_counter()
+        dt = now - self.last_ts
+        self.last_ts = now
+
+        # dt가 너무 작거나 이상하면 방어
+        if dt <= 0 or dt > 1.0:
+            dt = 0.0
+
+        # =========================
+        # 정면 판정 (대소문자 안전)
+        # =========================
+        gx = str(tracker.gaze_direction_x).upper()
+        gy = str(tracker.gaze_direction_y).upper()
+        is_center = (gx == "CENTER" and gy == "CENTER")
+
+        # =========================
+        # 정면 유지 시간 / 이탈 평균시간 계산
+        # (깜빡임 제외)
+        # =========================
+        if self.measuring_started and dt > 0 and not tracker.is_blinking:
+            stats = self.stats
+
+            # 🔹 전체 측정 시간
+            stats.total_time += dt
+
+            # 🔹 정면 유지 시간
+            if is_center:
+                stats.center_time += dt
+
+            # 🔹 이탈 평균시간 계산
+            if not is_center:
+                # CENTER → OFF (이탈 시작)
+                if not self.deviation_started:
+                    self.deviation_started = True
+                    self.deviation_start_ts = now
+                stats.off_center_time += dt
+
+                x_off = (gx != "CENTER")
+                y_off = (gy != "CENTER")
+
+                # 상하냐/좌우냐/대각이냐(서로 겹치지 않게 분리)
+                if x_off and not y_off:
+                    stats.lr_off_time += dt
+                elif y_off and not x_off:
+                    stats.ud_off_time += dt
+                elif x_off and y_off:
+                    stats.diag_off_time += dt
+
+                # 상세 방향(좌/우/상/하) 시간 누적
+                if gx == "LEFT":
+                    stats.left_time += dt
+                elif gx == "RIGHT":
+                    stats.right_time += dt
+
+                if gy == "UP":
+                    stats.up_time += dt
+                elif gy == "DOWN":
+                    stats.down_time += dt
+            else:
+                self._close_deviation(now)
+
+        return self.state(tracker)
+
+    def state(self, tracker):
+        """현재 판정 + 점수만 (O(1), 작은 tuple) — 프레임마다 스레드 / 프로세스 사이로 넘기는 값"""
+        stats = self.stats
+        center_score = score_center_ratio(stats.center_ratio)
+        avg_deviation_score = score_avg_deviation_time(stats.avg_deviation_time)
+        return GazeState(
+            tracker.gaze_direction_x,
+            tracker.gaze_direction_y,
+            tracker.is_blinking,
+            tracker.current_avg_ear,
+            tracker.is_calibrated,
+            tracker.BLINK_THRESHOLD,
+            stats.center_ratio,
+            center_score,
+            int(round((center_score * 0.6) + (avg_deviation_score * 0.4))),
+        )
+
+    def build_result(self, tracker):
+        """프레임별 전체 기록 (재채점용 원시값 포함) — sink / 기록기에 프레임 스트림을 켰을 때만"""
+        stats = self.stats
+        off_center_time = stats.off_center_time
+
+        # =========================
+        # 평균 / 최대 이탈시간 + 점수 계산 (누적 합 / 개수 / 최대 → O(1))
+        # =========================
+        avg_deviation_time = stats.avg_deviation_time
+        avg_deviation_score = score_avg_deviation_time(avg_deviation_time)
+        max_deviation_time = stats.deviation_max
+
+        center_ratio = stats.center_ratio
+        center_score = score_center_ratio(center_ratio)
+        #최종 시선 점수 계산 (정면 60% + 이탈 40%)
+        final_gaze_score = int(round((center_score * 0.6) + (avg_deviation_score * 0.4)))
+
+        deviation_count = stats.deviation_count
+
+        # ✅ 이탈 방향 비율 계산(이탈 시간 기준)
+        if off_center_time > 0:
+            lr_ratio = stats.lr_off_time / off_center_time
+            ud_ratio = stats.ud_off_time / off_center_time
+            diag_ratio = stats.diag_off_time / off_center_time
+
+            left_ratio = stats.left_time / off_center_time
+            right_ratio = stats.right_time / off_center_time
+            up_ratio = stats.up_time / off_center_time
+            down_ratio = stats.down_time / off_center_time
+        else:
+            lr_ratio = ud_ratio = diag_ratio = 0.0
+            left_ratio = right_ratio = up_ratio = down_ratio = 0.0
+
+        # (선택) 좌/우 밸런스(좌우만 놓고 봤을 때)
+        lr_total = stats.left_time + stats.right_time
+        if lr_total > 0:
+            left_ratio_lr = stats.left_time / lr_total
+            right_ratio_lr = stats.right_time / lr_total
+        else:
+            left_ratio_lr = right_ratio_lr = 0.0
+
+        # (선택) 상/하 밸런스(상하만 놓고 봤을 때)
+        ud_total = stats.up_time + stats.down_time
+        if ud_total > 0:
+            up_ratio_ud = stats.up_time / ud_total
+            down_ratio_ud = stats.down_time / ud_total
+        else:
+            up_ratio_ud = down_ratio_ud = 0.0
+
+        return {
+            "left_right": tracker.gaze_direction_x,
+            "up_down": tracker.gaze_direction_y,
+            "is_blinking": tracker.is_blinking,
+            "ear": tracker.current_avg_ear,
+            "ema_x": tracker.ema_diff_x,
+            "ema_y": tracker.ema_diff_y,
+            "calibrated": tracker.is_calibrated,
+            "blink_threshold": tracker.BLINK_THRESHOLD,
+
+            # 🔽 재채점용 원시값 (보정 전 시선 metric / 보정 기준값 / 얼굴 검출 여부)
+            "face": tracker.face_found,
+            "metric_x": tracker.current_metric_x,
+            "metric_y": tracker.current_metric_y,
+            "calib_x": tracker.calibrated_metric_x,
+            "calib_y": tracker.calibrated_metric_y,
+            "resets": self.resets,
+
+            # ✅ 정면유지비율 + 점수
+            "measuring": self.measuring_started,
+            "center_ratio": center_ratio,
+            "center_score": center_score,
+            "center_time": stats.center_time,
+            "total_time": stats.total_time,
+
+            # 🔽 이탈 평균시간 결과
+            "avg_deviation_time": avg_deviation_time,
+            "deviation_count": deviation_count,
+            "avg_deviation_score": avg_deviation_score,
+            "max_deviation_time": max_deviation_time,
+
+            "final_gaze_score": final_gaze_score,
+
+            # 🔽 이탈 방향 비율(이탈 시간 기준)
+            "off_center_time": off_center_time,
+
+            "lr_ratio": lr_ratio,
+            "ud_ratio": ud_ratio,
+            "diag_ratio": diag_ratio,
+
+            "left_ratio": left_ratio,
+            "right_ratio": right_ratio,
+            "up_ratio": up_ratio,
+            "down_ratio": down_ratio,
+
+            # (선택) 밸런스
+            "left_ratio_lr": left_ratio_lr,
+            "right_ratio_lr": right_ratio_lr,
+            "up_ratio_ud": up_ratio_ud,
+            "down_ratio_ud": down_ratio_ud,
+        }
+
+    def finish(self, now=None):
+        """면접 종료 시 호출. 진행 중 이탈을 마감하고 최종 점수/피드백 dict 반환"""
+        # 기본값: 마지막으로 처리한 프레임 시각 (동영상 소스에서도 일관되게)
+        if now is None:
+            now = self.last_ts
+
+        # ============================
+        # 🔚 종료 직전: 진행 중 이탈 마감
+        # ============================
+        self._close_deviation(now)
+
+        return self.stats.report()
+
+    def snapshot(self):
+        """지금까지 누적값 (마감된 이탈만) — 다른 구간과 merge_gaze_reports / GazeSessionStats.merge 로 합침"""
+        return self.stats.snapshot()
+
+
+# =====================================================
+# 🎯 자동 보정 ('c' 키를 누를 사람이 없을 때: 헤드리스 / 녹화 영상)
+# =====================================================
+class AutoCalibration:
+    """첫 프레임 시각 기준 after 초가 지나면 한 번만 due() → True"""
+
+    def __init__(self, after=None):
+        self.after = after
+        self.first_ts = None
+        self.done = after is None
+
+    def due(self, ts):
+        if self.done:
+            return False
+        if self.first_ts is None:
+            # 보정은 처리된 프레임의 현재 시선값이 필요 → 최소 1프레임 뒤
+            self.first_ts = ts
+            return False
+        if ts - self.first_ts >= self.after:
+            self.done = True
+            return True
+        return False
+
+
+def print_gaze_report(report):
+    """finish() 결과 콘솔 출력"""
+    # print(f"[GAZE] 정면 응시 점수: {report['center_score']}점 (정면 유지 {report['center_ratio']:.1f}%)")
+    # print(f"[GAZE] 시선 이탈 점수: {report['avg_deviation_score']}점 (이탈 복귀 평균 {report['avg_deviation_time']:.2f}초)")
+    print(f"[GAZE] 최종 시선 종합 점수: {report['final_gaze_score']}점")
+
+    print("[시선 피드백]")
+    print(report["feedback"])
+
+
+# ---------------------------------------------------------
+# 규칙 기반 피드백 생성 함수
+# ---------------------------------------------------------
+def generate_gaze_feedback(total_score, center_ratio, avg_dev_time,
+                               left_t, right_t, up_t, down_t, off_time):
+    feedbacks = []
+
+    # 1. 종합 평가
+    if total_score >= 80:
+        feedbacks.append("전반적으로 안정적인 시선 처리를 유지했습니다.")
+    elif total_score >= 60:
+        feedbacks.append("시선 처리가 다소 불안정합니다. 면접관(카메라)과 더 눈을 맞추려 노력해 보세요.")
+    else:
+        feedbacks.append("시선 이탈이 잦습니다. 자신감 있는 인상을 위해 카메라를 응시하는 연습이 필요합니다.")
+
+    # 2. 이탈 시간 피드백
+    if avg_dev_time > 2.0:
+        feedbacks.append("- 딴 곳을 응시하는 시간이 다소 깁니다. 답변이 막히더라도 시선을 빨리 정면으로 회복해 보세요.")
+
+    # 3. 습관 분석 (어느 방향을 많이 보는지)
+    if off_time > 0:
+        directions = {"왼쪽": left_t, "오른쪽": right_t, "위": up_t, "아래": down_t}
+        max_dir = max(directions, key=directions.get)
+        max_ratio = (directions[max_dir] / off_time) * 100
+
+        if max_ratio > 40:  # 한 방향으로 40% 이상 치우쳤을 때
+            if max_dir == "위":
+                feedbacks.append(f"- 답변을 생각할 때 주로 '{max_dir}'를 쳐다보는 습관이 있습니다. 허공을 보는 대신 정면을 보세요.")
+            elif max_dir in ["왼쪽", "오른쪽"]:
+                feedbacks.append(f"- 무의식적으로 '{max_dir}'을 응시하는 경향이 있습니다. 시선을 중앙으로 고정해 보세요.")
+            elif max_dir == "아래":
+                feedbacks.append("- 시선이 '아래'로 향하는 경우가 많아 자신감이 부족해 보일 수 있습니다.")
+
+    return "\n".join(feedbacks)
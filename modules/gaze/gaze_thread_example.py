@@ -2,23 +2,38 @@
 
 import cv2
 import threading
-import queue
 import time
 from modules.gaze.gaze_module import GazeTracker
+from modules.gaze.gaze_events import GazeEventSegmenter, gaze_events, print_event_summary
+from modules.gaze.gaze_session import (  # noqa: F401  (기존 import 경로 호환)
+    AutoCalibration,
+    GazeSession,
+    generate_gaze_feedback,
+    print_gaze_report,
+    score_avg_deviation_time,
+    score_center_ratio,
+)
 import modules.shared_flags as flags
+import modules.result_sink as result_sink
+from modules.scheduler import analyzer_scheduler
+from modules.face_roi import face_roi
 
 # 🔥 camera_manager에서 공통 프레임 가져오기
-from modules.camera.camera_manager import shared_frame_queue
+from modules.camera.camera_manager import frame_bus
+from modules.latest_slot import LatestSlot
+from modules.latency import FrameStamp, latency_tracker
+from modules.startup import DUMMY_FRAME, startup
 
 # 분석 결과 → main.py
-gaze_result_queue = queue.Queue(maxsize=5)
+gaze_result_slot = LatestSlot("gaze")
 
 calibrate_event = threading.Event()  # 보정 요청 이벤트
 
-# ✅ 종료 시 마지막 값 저장용 (원하면 main에서 참조 가능)
-last_center_ratio = 0.0
-last_center_time = 0.0
-last_total_time = 0.0
+# 첫 프레임 후 N초 뒤 자동 보정 (None = 'c' 키로만)
+auto_calibrate_after = None
+
+# sink / 기록기에 프레임별 전체 결과(build_result)도 보냄 (기본: 구간 이벤트 + 종료 리포트만)
+gaze_frames = False
 
 
 def request_gaze_calibration():
@@ -26,72 +41,38 @@ def request_gaze_calibration():
     calibrate_event.set()
 
 
-def score_center_ratio(center_ratio: float) -> int:
-    """
-    80% 이상 → 100점
-    30% 이하 → 0점
-    중간은 선형 증가
-    """
-    if center_ratio <= 30:
-        return 0
-    elif center_ratio >= 80:
-        return 100
-    else:
-        return int(round((center_ratio - 30) / 50 * 100))
-
-def score_avg_deviation_time(avg_deviation_time: float) -> int:
-    """
-    평균 이탈시간 점수화
-    - 1초 이하 → 100점
-    - 3초 이상 → 0점
-    - 그 사이는 선형 감소
-    """
-    if avg_deviation_time <= 1.0:
-        return 100
-    elif avg_deviation_time >= 3.0:
-        return 0
-    else:
-        score = (3.0 - avg_deviation_time) / 2.0 * 100
-        return int(round(score))
-
-
-def gaze_worker():
-    global last_center_ratio, last_center_time, last_total_time
-
-    tracker = GazeTracker()
-    print("👁 Gaze Thread Started")
+def set_auto_calibration(seconds):
+    """헤드리스 / 녹화 영상처럼 'c' 키를 누를 수 없을 때 (스레드 시작 전에 호출)"""
+    global auto_calibrate_after
+    auto_calibrate_after = seconds
 
-    # ✅ "c키 이후"에만 측정 시작 (원치 않으면 True로 바꾸면 됨)
-    measuring_started = False
 
-    # ✅ 깜빡임 제외 시간 기반 누적
-    total_gaze_time = 0.0
-    center_gaze_time = 0.0
+def set_gaze_frames(enabled):
+    """프레임별 시선 결과 스트림 켜기 (재채점 / 오프라인 분석용, 스레드 시작 전에 호출)"""
+    global gaze_frames
+    gaze_frames = enabled
 
-    last_ts = time.perf_counter()
 
-    deviation_started = False
-    deviation_start_ts = None
-    deviation_durations = []
-
-    # ✅ 이탈 방향 시간 누적(깜빡임 제외, measuring_started 이후)
-    off_center_time = 0.0
-
-    lr_off_time = 0.0
-    ud_off_time = 0.0
-    diag_off_time = 0.0
-
-    left_time = 0.0
-    right_time = 0.0
-    up_time = 0.0
-    down_time = 0.0
+def gaze_worker():
+    # 구독 전에 그래프 생성 + 더미 프레임 1장 (ROI / 세션 누적값은 건드리지 않음)
+    tracker = startup.warm_up("gaze", GazeTracker, lambda t: t.process_frame(DUMMY_FRAME, draw=False))
+    session = GazeSession()
+    segmenter = GazeEventSegmenter()  # 프레임 판정 → 정면 / 이탈 / 깜빡임 구간 이벤트 (gaze_events 구독자에게)
+    auto_calibration = AutoCalibration(auto_calibrate_after)
+    frames = frame_bus.subscribe("gaze")
+    print("👁 Gaze Thread Started")
 
-    while flags.RUNNING:
+    while flags.running():
 
-        if shared_frame_queue.empty():
+        # 새 프레임이 올 때까지 블로킹 대기 (타임아웃마다 종료 플래그 확인)
+        item = frames.wait(timeout=0.1)
+        if item is None:
+            # 동영상/이미지 소스가 끝났으면 종료
+            if frames.finished:
+                break
             continue
 
-        frame = shared_frame_queue.get()
+        seq, views = item
 
         # 'c' 보정 요청이 있으면 calibrate + 리셋 + 측정 시작
         if calibrate_event.is_set():
@@ -100,332 +81,82 @@ def gaze_worker():
             except Exception:
                 pass
 
-            # ✅ 전체/정면 누적 리셋
-            total_gaze_time = 0.0
-            center_gaze_time = 0.0
-            measuring_started = True
-            last_ts = time.perf_counter()
-
-            # ✅ 이탈 구간 리셋
-            deviation_started = False
-            deviation_start_ts = None
-            deviation_durations = []
-
-            # ✅ 이탈 방향 누적 리셋
-            off_center_time = 0.0
-            lr_off_time = 0.0
-            ud_off_time = 0.0
-            diag_off_time = 0.0
-            left_time = 0.0
-            right_time = 0.0
-            up_time = 0.0
-            down_time = 0.0
+            # ✅ 전체/정면/이탈 누적 리셋
+            session.reset()
 
             calibrate_event.clear()
 
-        processed = tracker.process_frame(frame)
-
-        # ✅ 시간 누적(프레임 처리 기준)
-        now = time.perf_counter()
-        dt = now - last_ts
-        last_ts = now
-
-        # dt가 너무 작거나 이상하면 방어
-        if dt <= 0 or dt > 1.0:
-            dt = 0.0
-
-        # =========================
-        # 정면 판정 (대소문자 안전)
-        # =========================
-        is_center = (
-                str(tracker.gaze_direction_x).upper() == "CENTER"
-                and str(tracker.gaze_direction_y).upper() == "CENTER"
-        )
-
-        # =========================
-        # 정면 유지 시간 / 이탈 평균시간 계산
-        # (깜빡임 제외)
-        # =========================
-        if measuring_started and dt > 0 and not tracker.is_blinking:
-
-            # 🔹 전체 측정 시간
-            total_gaze_time += dt
-
-            # 🔹 정면 유지 시간
-            if is_center:
-                center_gaze_time += dt
-
-            # ✅ 이탈 방향 시간 누적(정면이 아닐 때만)
-            gx = str(tracker.gaze_direction_x).upper()
-            gy = str(tracker.gaze_direction_y).upper()
-
-            # 🔹 이탈 평균시간 계산
-            if not is_center:
-                # CENTER → OFF (이탈 시작)
-                if not deviation_started:
-                    deviation_started = True
-                    deviation_start_ts = time.perf_counter()
-                off_center_time += dt
-
-                x_off = (gx != "CENTER")
-                y_off = (gy != "CENTER")
-
-                # 상하냐/좌우냐/대각이냐(서로 겹치지 않게 분리)
-                if x_off and not y_off:
-                    lr_off_time += dt
-                elif y_off and not x_off:
-                    ud_off_time += dt
-                elif x_off and y_off:
-                    diag_off_time += dt
-
-                # 상세 방향(좌/우/상/하) 시간 누적
-                if gx == "LEFT":
-                    left_time += dt
-                elif gx == "RIGHT":
-                    right_time += dt
-
-                if gy == "UP":
-                    up_time += dt
-                elif gy == "DOWN":
-                    down_time += dt
-            else:
-                # OFF → CENTER (이탈 종료)
-                if deviation_started and deviation_start_ts is not None:
-                    dur = time.perf_counter() - deviation_start_ts
-                    if 0.05 <= dur <= 10.0:
-                        deviation_durations.append(dur)
-                    deviation_started = False
-                    deviation_start_ts = None
-
-        # =========================
-        # 평균 이탈시간 + 점수 계산
-        # =========================
-        avg_deviation_time = (
-            sum(deviation_durations) / len(deviation_durations)
-            if deviation_durations else 0.0
-        )
-
-        avg_deviation_score = score_avg_deviation_time(avg_deviation_time)
-
-        # =========================
-        # 최대 이탈시간 계산
-        # =========================
-        max_deviation_time = max(deviation_durations) if deviation_durations else 0.0
-
-
-        center_ratio = (center_gaze_time / total_gaze_time * 100.0) if total_gaze_time > 0 else 0.0
-        center_score = score_center_ratio(center_ratio)
-        #최종 시선 점수 계산 (정면 60% + 이탈 40%)
-        final_gaze_score = int(round((center_score * 0.6) + (avg_deviation_score * 0.4)))
-
-        deviation_count = len(deviation_durations)
-
-        # ✅ 이탈 방향 비율 계산(이탈 시간 기준)
-        if off_center_time > 0:
-            lr_ratio = lr_off_time / off_center_time
-            ud_ratio = ud_off_time / off_center_time
-            diag_ratio = diag_off_time / off_center_time
-
-            left_ratio = left_time / off_center_time
-            right_ratio = right_time / off_center_time
-            up_ratio = up_time / off_center_time
-            down_ratio = down_time / off_center_time
-        else:
-            lr_ratio = ud_ratio = diag_ratio = 0.0
-            left_ratio = right_ratio = up_ratio = down_ratio = 0.0
-
-        # (선택) 좌/우 밸런스(좌우만 놓고 봤을 때)
-        lr_total = left_time + right_time
-        if lr_total > 0:
-            left_ratio_lr = left_time / lr_total
-            right_ratio_lr = right_time / lr_total
-        else:
-            left_ratio_lr = right_ratio_lr = 0.0
-
-        # (선택) 상/하 밸런스(상하만 놓고 봤을 때)
-        ud_total = up_time + down_time
-        if ud_total > 0:
-            up_ratio_ud = up_time / ud_total
-            down_ratio_ud = down_time / ud_total
-        else:
-            up_ratio_ud = down_ratio_ud = 0.0
-
-        result = {
-            "left_right": tracker.gaze_direction_x,
-            "up_down": tracker.gaze_direction_y,
-            "is_blinking": tracker.is_blinking,
-            "ear": tracker.current_avg_ear,
-
-            # ✅ 정면유지비율 + 점수
-            "measuring": measuring_started,
-            "center_ratio": center_ratio,
-            "center_score": center_score,
-            "center_time": center_gaze_time,
-            "total_time": total_gaze_time,
-
-            # 🔽 이탈 평균시간 결과
-            "avg_deviation_time": avg_deviation_time,
-            "deviation_count": deviation_count,
-            "avg_deviation_score": avg_deviation_score,
-            "max_deviation_time": max_deviation_time,
-
-            "final_gaze_score": final_gaze_score,
-
-            # 🔽 이탈 방향 비율(이탈 시간 기준)
-            "off_center_time": off_center_time,
-
-            "lr_ratio": lr_ratio,
-            "ud_ratio": ud_ratio,
-            "diag_ratio": diag_ratio,
-
-            "left_ratio": left_ratio,
-            "right_ratio": right_ratio,
-            "up_ratio": up_ratio,
-            "down_ratio": down_ratio,
-
-            # (선택) 밸런스
-            "left_ratio_lr": left_ratio_lr,
-            "right_ratio_lr": right_ratio_lr,
-            "up_ratio_ud": up_ratio_ud,
-            "down_ratio_ud": down_ratio_ud,
-        }
-
-        # 최신 데이터만 유지
-        if gaze_result_queue.full():
-            try:
-                gaze_result_queue.get_nowait()
-            except:
-                pass
+        # 목표 fps / CPU 예산에 따라 이번 프레임은 건너뛰기
+        if not analyzer_scheduler.should_run("gaze", seq, views.ts):
+            continue
+        started = time.perf_counter()
 
-        gaze_result_queue.put((processed, result))
+        with latency_tracker.clock("gaze", views.captured) as clock:
+            rgb = views.rgb
+            clock.mark("convert")
 
-    # ============================
-    # 🔚 종료 직전: 진행 중 이탈 마감
-    # ============================
-    if deviation_started and deviation_start_ts is not None:
-        dur = time.perf_counter() - deviation_start_ts
-        if 0.05 <= dur <= 10.0:
-            deviation_durations.append(dur)
-        deviation_started = False
-        deviation_start_ts = None
+            # 직전 얼굴 주변 crop 에만 FaceMesh (표정 스레드도 이 얼굴 박스를 사용)
+            # 그리지 않음 → processed 는 공유 프레임 그대로 (안내 문구는 대시보드가 그림)
+            processed = tracker.process_frame(views.bgr, rgb, draw=False,
+                                              roi=face_roi, ts=views.ts)
+
+            # ✅ 정면 유지 / 이탈 시간 누적 + 점수 계산 (프레임 시각 기준 → 오프라인에서도 동일 결과)
+            state = session.update(tracker, views.ts)
+            clock.mark("postprocess")
+            analyzer_scheduler.record("gaze", time.perf_counter() - started)
+            if gaze_frames:
+                result_sink.emit("gaze", seq, views.ts, session.build_result(tracker), views.captured)
+            gaze_events.extend(segmenter.update(state, views.ts, views.captured, seq))
+
+            # 자동 보정 시각이 되면 다음 프레임에서 'c' 와 같은 경로로 보정
+            if auto_calibration.due(views.ts):
+                calibrate_event.set()
+
+            # 최신 데이터만 유지
+            gaze_result_slot.publish((processed, state), FrameStamp(seq, views.ts, views.captured))
+            clock.mark("publish")
 
     # ============================
-    # 📊 종료 시 이탈 시선 점수 출력
+    # 📊 종료 시 최종 점수 + 피드백
     # ============================
-    final_avg_deviation_time = (
-        sum(deviation_durations) / len(deviation_durations)
-        if deviation_durations else 0.0
-    )
-    final_deviation_count = len(deviation_durations)
-    final_max_deviation_time = max(deviation_durations) if deviation_durations else 0.0
-    final_avg_deviation_score = score_avg_deviation_time(final_avg_deviation_time)
-
-    #if off_center_time > 0:
-    #    print(
-    #        f"📌 [GAZE] 이탈 방향 비율: "
-    #        f"좌우 {lr_off_time / off_center_time * 100:.1f}% / "
-    #        f"위아래 {ud_off_time / off_center_time * 100:.1f}% / "
-    #        f"상하좌우 {diag_off_time / off_center_time * 100:.1f}% | "
-    #        f"좌 {left_time / off_center_time * 100:.1f}% 우 {right_time / off_center_time * 100:.1f}% "
-    #        f"위 {up_time / off_center_time * 100:.1f}% 아래 {down_time / off_center_time * 100:.1f}%"
-    #    )
-    #else:
-    #    print("📌 [GAZE] 이탈 방향 비율: 측정된 이탈 없음")
-
-    #print(
-    #    f"📌 [GAZE] 이탈 시선 점수: {final_avg_deviation_score}점 "
-    #    f"(평균 {final_avg_deviation_time:.2f}s / "
-    #    f"횟수 {final_deviation_count} / "
-    #    f"최대 {final_max_deviation_time:.2f}s)"
-    #)
-
-    # 종료 시 최종 계산
-    final_center_ratio = (center_gaze_time / total_gaze_time * 100.0) if total_gaze_time > 0 else 0.0
-    final_center_score = score_center_ratio(final_center_ratio)
-
-    #전체 면접에 대한 최종 합산 점수 계산
-    total_final_gaze_score = int(round((final_center_score * 0.6) + (final_avg_deviation_score * 0.4)))
-
-    # 외부 참조용 저장
-    last_center_ratio = final_center_ratio
-    last_center_time = center_gaze_time
-    last_total_time = total_gaze_time
-
-    # 출력
-    # print(f"[GAZE] 정면 응시 점수: {final_center_score}점 (정면 유지 {final_center_ratio:.1f}%)")
-    # print(f"[GAZE] 시선 이탈 점수: {final_avg_deviation_score}점 (이탈 복귀 평균 {final_avg_deviation_time:.2f}초)")
-    print(f"[GAZE] 최종 시선 종합 점수: {total_final_gaze_score}점")
-
-    # 피드백 생성 및 출력
-    feedback_text = generate_gaze_feedback(
-        total_final_gaze_score,
-        final_center_ratio,
-        final_avg_deviation_time,
-        left_time, right_time, up_time, down_time, off_center_time
-    )
-
-    print("[시선 피드백]")
-    print(feedback_text)
+    report = session.finish()
+    gaze_events.extend(segmenter.close())
+
+    print_gaze_report(report)
+    result_sink.emit_report("gaze", report)
+    print_event_summary(gaze_events.summary())
+    print(f"[GAZE] 처리 프레임 {frames.received} / 드롭 {frames.dropped}")
+    roi_stats = face_roi.stats()
+    print(f"[GAZE] 얼굴 ROI 추적 {roi_stats['tracked_ratio'] * 100:.0f}% "
+          f"(crop {roi_stats['tracked']} / 전체 {roi_stats['full']} / 재탐지 {roi_stats['lost']})")
 
 def start_gaze_thread():
     t_gaze = threading.Thread(target=gaze_worker, daemon=True)
     t_gaze.start()
+    flags.lifecycle.add_thread("gaze", t_gaze)  # 종료 시 타임아웃 join
     print("🚀 gaze_thread_example 실행됨! (Camera 공유 버전)")
     return t_gaze
 
-# ---------------------------------------------------------
-# 규칙 기반 피드백 생성 함수
-# ---------------------------------------------------------
-def generate_gaze_feedback(total_score, center_ratio, avg_dev_time,
-                               left_t, right_t, up_t, down_t, off_time):
-    feedbacks = []
-
-    # 1. 종합 평가
-    if total_score >= 80:
-        feedbacks.append("전반적으로 안정적인 시선 처리를 유지했습니다.")
-    elif total_score >= 60:
-        feedbacks.append("시선 처리가 다소 불안정합니다. 면접관(카메라)과 더 눈을 맞추려 노력해 보세요.")
-    else:
-        feedbacks.append("시선 이탈이 잦습니다. 자신감 있는 인상을 위해 카메라를 응시하는 연습이 필요합니다.")
-
-    # 2. 이탈 시간 피드백
-    if avg_dev_time > 2.0:
-        feedbacks.append("- 딴 곳을 응시하는 시간이 다소 깁니다. 답변이 막히더라도 시선을 빨리 정면으로 회복해 보세요.")
-
-    # 3. 습관 분석 (어느 방향을 많이 보는지)
-    if off_time > 0:
-        directions = {"왼쪽": left_t, "오른쪽": right_t, "위": up_t, "아래": down_t}
-        max_dir = max(directions, key=directions.get)
-        max_ratio = (directions[max_dir] / off_time) * 100
-
-        if max_ratio > 40:  # 한 방향으로 40% 이상 치우쳤을 때
-            if max_dir == "위":
-                feedbacks.append(f"- 답변을 생각할 때 주로 '{max_dir}'를 쳐다보는 습관이 있습니다. 허공을 보는 대신 정면을 보세요.")
-            elif max_dir in ["왼쪽", "오른쪽"]:
-                feedbacks.append(f"- 무의식적으로 '{max_dir}'을 응시하는 경향이 있습니다. 시선을 중앙으로 고정해 보세요.")
-            elif max_dir == "아래":
-                feedbacks.append("- 시선이 '아래'로 향하는 경우가 많아 자신감이 부족해 보일 수 있습니다.")
-
-    return "\n".join(feedbacks)
-
 
 if __name__ == "__main__":
     from modules.camera.camera_manager import start_camera_thread
+    from modules.overlay import draw_gaze
 
     start_camera_thread()
-    flags.RUNNING = True
 
     start_gaze_thread()
 
+    seen = 0
     while True:
-        if not gaze_result_queue.empty():
-            frame, data = gaze_result_queue.get()
+        item = gaze_result_slot.wait_newer(seen, timeout=0.03)
+        if item is not None:
+            seen, (frame, data) = item
 
-            print(f"시선: {data['left_right']}, {data['up_down']} / "
-                  f"깜빡임: {data['is_blinking']} / EAR={data['ear']:.3f} / "
-                  f"정면유지: {data.get('center_ratio', 0):.1f}% / 점수: {data.get('center_score', 0)}")
+            print(f"시선: {data.left_right}, {data.up_down} / "
+                  f"깜빡임: {data.is_blinking} / EAR={data.ear:.3f} / "
+                  f"정면유지: {data.center_ratio:.1f}% / 점수: {data.center_score}")
 
-            cv2.imshow("Gaze Debug", frame)
+            cv2.imshow("Gaze Debug", draw_gaze(frame.copy(), data))
 
         key = cv2.waitKey(1) & 0xFF
         if key == ord('c'):
@@ -433,5 +164,5 @@ if __name__ == "__main__":
         if key == ord('q'):
             break
 
-    flags.RUNNING = False
+    flags.stop_token.set()
     cv2.destroyAllWindows()
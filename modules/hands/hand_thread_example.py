@@ -1,60 +1,65 @@
 import cv2
 import threading
-import queue
-import mediapipe as mp
+import time
 
-from modules.shared_flags import RUNNING
-from modules.camera.camera_manager import shared_frame_queue   # 🔥 공통 카메라 큐 사용
+from modules.hands.hands_module import HandsAnalyzer
+import modules.shared_flags as flags
+import modules.result_sink as result_sink
+from modules.scheduler import analyzer_scheduler
+from modules.camera.camera_manager import frame_bus   # 🔥 공통 카메라 버스 사용
+from modules.latest_slot import LatestSlot
+from modules.latency import FrameStamp, latency_tracker
+from modules.startup import DUMMY_FRAME, startup
 
 # 분석 결과 → main.py
-hands_result_queue = queue.Queue(maxsize=5)
-
-# MediaPipe Hands 초기화
-mp_hands = mp.solutions.hands
-mp_draw = mp.solutions.drawing_utils
-
+hands_result_slot = LatestSlot("hands")
 
 # ======================================================
 # ✋ Hands 분석 스레드
 # ======================================================
 def hands_worker():
-    hands = mp_hands.Hands(
-        max_num_hands=2,
-        model_complexity=1,
-        min_detection_confidence=0.5,
-        min_tracking_confidence=0.5,
+    # 구독 전에 그래프 생성 + 더미 프레임 1장 (다른 분석 스레드와 동시에)
+    analyzer = startup.warm_up(
+        "hands", lambda: HandsAnalyzer(max_num_hands=2), lambda a: a.process_frame(DUMMY_FRAME, draw=False)
     )
 
+    frames = frame_bus.subscribe("hands")
     print("✋ Hands Thread Started")
 
-    while RUNNING:
+    while flags.running():
 
-        # 카메라 프레임이 아직 안 왔으면 패스
-        if shared_frame_queue.empty():
+        # 새 프레임이 올 때까지 블로킹 대기 (타임아웃마다 종료 플래그 확인)
+        item = frames.wait(timeout=0.1)
+        if item is None:
+            # 동영상/이미지 소스가 끝났으면 종료
+            if frames.finished:
+                break
             continue
 
         # 📌 공통 카메라 프레임 가져오기
-        frame = shared_frame_queue.get()
+        seq, views = item
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = hands.process(rgb)
+        # 목표 fps / CPU 예산에 따라 이번 프레임은 건너뛰기
+        if not analyzer_scheduler.should_run("hands", seq, views.ts):
+            continue
+        started = time.perf_counter()
 
-        if result.multi_hand_landmarks:
-            for handLms in result.multi_hand_landmarks:
-                mp_draw.draw_landmarks(
-                    frame, handLms, mp_hands.HAND_CONNECTIONS
-                )
+        with latency_tracker.clock("hands", views.captured) as clock:
+            # RGB 변환은 프레임당 한 번만 (다른 분석기와 공유)
+            rgb = views.rgb
+            clock.mark("convert")
 
-        # 최신 결과만 유지
-        if hands_result_queue.full():
-            try:
-                hands_result_queue.get_nowait()
-            except:
-                pass
+            # 공유 프레임에는 그리지 않음 → 손 랜드마크만 넘기고 대시보드가 그림
+            _, hands = analyzer.process_frame(views.bgr, rgb, draw=False)
+            clock.mark("postprocess")
+            analyzer_scheduler.record("hands", time.perf_counter() - started)
+            result_sink.emit("hands", seq, views.ts, {"hands": hands}, views.captured)
 
-        hands_result_queue.put(frame)
+            # 최신 결과만 유지
+            hands_result_slot.publish((views.bgr, hands), FrameStamp(seq, views.ts, views.captured))
+            clock.mark("publish")
 
-    print("✋ Hands Thread Stopped")
+    print(f"✋ Hands Thread Stopped (dropped {frames.dropped} frames)")
 
 
 # ======================================================
@@ -63,6 +68,7 @@ def hands_worker():
 def start_hands_thread():
     t_hands = threading.Thread(target=hands_worker, daemon=True)
     t_hands.start()
+    flags.lifecycle.add_thread("hands", t_hands)  # 종료 시 타임아웃 join
 
     print("🚀 hands_thread_example 실행됨! (Camera 공유 버전)")
     return t_hands
@@ -73,18 +79,20 @@ def start_hands_thread():
 # ======================================================
 if __name__ == "__main__":
     from modules.camera.camera_manager import start_camera_thread
+    from modules.overlay import draw_hands
     start_camera_thread()  # 단독 테스트 시 카메라 실행 필요
 
-    RUNNING = True
     start_hands_thread()
 
+    seen = 0
     while True:
-        if not hands_result_queue.empty():
-            frame = hands_result_queue.get()
-            cv2.imshow("Hands Debug", frame)
+        item = hands_result_slot.wait_newer(seen, timeout=0.03)
+        if item is not None:
+            seen, (frame, hands) = item
+            cv2.imshow("Hands Debug", draw_hands(frame.copy(), hands))
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
             break
 
-    RUNNING = False
+    flags.stop_token.set()
     cv2.destroyAllWindows()
\ No newline at end of file
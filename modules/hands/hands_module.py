@@ -0,0 +1,67 @@
+import cv2
+
+from modules import latency
+from modules.landmarks import landmark_array
+
+
+class HandsAnalyzer:
+    def __init__(self, max_num_hands=2):
+        # MediaPipe Hands 초기화 (그래프는 처음 쓸 때 생성 → Holistic 모드에서는 만들지 않음)
+        import mediapipe as mp
+        self.mp_hands = mp.solutions.hands
+        self.max_num_hands = max_num_hands
+        self._hands = None
+        self.drawing = mp.solutions.drawing_utils
+
+    @property
+    def hands(self):
+        if self._hands is None:
+            self._hands = self.mp_hands.Hands(
+                max_num_hands=self.max_num_hands,
+                model_complexity=1,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5,
+            )
+        return self._hands
+
+    # =========================
+    # 1) 프레임에서 손 인식
+    # =========================
+    def detect_hands(self, frame, rgb=None):
+        # 공유 프레임에서 이미 만든 RGB가 있으면 재사용
+        if rgb is None:
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        result = self.hands.process(rgb)
+        latency.mark("inference")
+        return result
+
+    # =========================
+    # 2) 전체 프레임 처리
+    # =========================
+    def process_frame(self, frame, rgb=None, draw=True):
+        """
+        반환: (frame, hands)
+        hands = 손마다 (21, 3) 정규화 좌표 배열 리스트
+        draw=True 면 frame 위에 직접 그림 → 공유 프레임이면 복사본을 넘길 것
+        """
+        result = self.detect_hands(frame, rgb)
+        return self.process_landmarks(frame, result.multi_hand_landmarks, draw)
+
+    # =========================
+    # 3) 랜드마크만 받아서 처리 (Holistic 등 외부 추론 결과)
+    # =========================
+    def process_landmarks(self, frame, hand_landmarks_list, draw=True):
+        hands = []
+        if hand_landmarks_list:
+            for handLms in hand_landmarks_list:
+                if handLms is None:
+                    continue
+                # 손마다 새 배열 (결과 슬롯으로 나가므로 버퍼 재사용 안 함)
+                hands.append(landmark_array(handLms))
+
+                if draw:
+                    self.drawing.draw_landmarks(
+                        frame, handLms, self.mp_hands.HAND_CONNECTIONS
+                    )
+
+        return frame, hands
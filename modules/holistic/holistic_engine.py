@@ -0,0 +1,34 @@
+# modules/holistic/holistic_engine.py
+
+import cv2
+
+from modules import latency
+
+
+class HolisticEngine:
+    """
+    MediaPipe Holistic 1개로 pose(33) + face mesh(478, 홍채 포함) + 양손(21×2) 랜드마크를
+    한 번의 추론으로 얻는다. (Pose / FaceMesh / Hands / FaceDetection 4개 그래프 대체)
+    """
+
+    def __init__(self, model_complexity=1):
+        import mediapipe as mp
+        self.mp_holistic = mp.solutions.holistic
+        self.holistic = self.mp_holistic.Holistic(
+            model_complexity=model_complexity,
+            refine_face_landmarks=True,  # 눈동자(Iris) 추적을 위해 필수
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5,
+        )
+
+    def process(self, frame, rgb=None):
+        """
+        반환: MediaPipe 결과
+          - pose_landmarks / face_landmarks / left_hand_landmarks / right_hand_landmarks
+        """
+        # 공유 프레임에서 이미 만든 RGB가 있으면 재사용
+        if rgb is None:
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        result = self.holistic.process(rgb)
+        latency.mark("inference")
+        return result
@@ -0,0 +1,163 @@
+# modules/holistic/holistic_thread_example.py
+
+import threading
+import time
+
+from modules.holistic.holistic_engine import HolisticEngine
+from modules.pose.pose_module import PoseAnalyzer
+from modules.gaze.gaze_module import GazeTracker
+from modules.gaze.gaze_events import GazeEventSegmenter, gaze_events, print_event_summary
+from modules.gaze.gaze_session import AutoCalibration, GazeSession, print_gaze_report
+from modules.hands.hands_module import HandsAnalyzer
+from modules.expression.expression_analyzer import ExpressionAnalyzer
+import modules.shared_flags as flags
+import modules.result_sink as result_sink
+from modules.scheduler import analyzer_scheduler
+from modules.latency import FrameStamp, latency_tracker
+from modules.landmarks import LandmarkBuffer
+from modules.startup import DUMMY_FRAME, startup
+
+# 🔥 공용 카메라 프레임
+from modules.camera.camera_manager import frame_bus
+
+# 결과는 기존 모듈별 슬롯으로 그대로 전달 (main.py 대시보드 호환)
+from modules.pose.pose_thread_example import pose_result_slot
+import modules.gaze.gaze_thread_example as gaze_thread
+from modules.gaze.gaze_thread_example import gaze_result_slot, calibrate_event
+from modules.hands.hand_thread_example import hands_result_slot
+from modules.expression.expression_thread_example import expression_result_slot
+
+
+# =====================================================
+# 🧍 Holistic 스레드: 1회 추론 → pose / gaze / hands / expression 로직으로 분배
+# =====================================================
+def holistic_worker(emotion_detector=None):
+    # 구독 전에 Holistic 그래프 생성 + 더미 프레임 1장
+    engine = startup.warm_up("holistic", HolisticEngine, lambda e: e.process(DUMMY_FRAME))
+
+    # 기존 분석기는 랜드마크 후처리만 사용 (각자의 MediaPipe 그래프는 만들지 않음)
+    pose = PoseAnalyzer()
+    tracker = GazeTracker()
+    session = GazeSession()
+    segmenter = GazeEventSegmenter()
+    auto_calibration = AutoCalibration(gaze_thread.auto_calibrate_after)
+    hands = HandsAnalyzer()
+    expression = ExpressionAnalyzer(emotion_detector)
+    face_points = LandmarkBuffer()  # 얼굴 랜드마크 → 배열 1번 (시선 / 표정 박스가 같이 씀)
+
+    # 추론 자체는 시선 샘플링 속도로 (예산 초과에도 건너뛰지 않음)
+    if "holistic" not in analyzer_scheduler.tasks:
+        analyzer_scheduler.register("holistic", **analyzer_scheduler.config("gaze"))
+
+    frames = frame_bus.subscribe("holistic")
+    print("🧍 Holistic Thread Started")
+
+    while flags.running():
+
+        # 새 프레임이 올 때까지 블로킹 대기 (타임아웃마다 종료 플래그 확인)
+        item = frames.wait(timeout=0.1)
+        if item is None:
+            # 동영상/이미지 소스가 끝났으면 종료
+            if frames.finished:
+                break
+            continue
+
+        seq, views = item
+        frame = views.bgr
+        h, w = views.height, views.width
+
+        # 'c' 보정 요청 (gaze_thread_example.request_gaze_calibration 과 공유)
+        if calibrate_event.is_set():
+            try:
+                tracker.calibrate()
+            except Exception:
+                pass
+            session.reset()
+            calibrate_event.clear()
+
+        if not analyzer_scheduler.should_run("holistic", seq, views.ts):
+            continue
+        started = time.perf_counter()
+
+        # 대기 / 색 변환 / 추론은 분석기 4개가 같이 거친 단계 → 각 결과 지연에 이어 붙임
+        with latency_tracker.clock("holistic", views.captured) as shared:
+            rgb = views.rgb
+            shared.mark("convert")
+            result = engine.process(frame, rgb)
+        analyzer_scheduler.record("holistic", time.perf_counter() - started)
+        stamp = FrameStamp(seq, views.ts, views.captured)
+        face = face_points(result.face_landmarks) if result.face_landmarks else None
+
+        # ---------- 시선 ----------
+        if analyzer_scheduler.should_run("gaze", seq, views.ts):
+            started = time.perf_counter()
+            with latency_tracker.clock("gaze", views.captured, shared.stages) as clock:
+                tracker.face_found = False
+                if face is not None:
+                    tracker.update_from_landmarks(face, w, h)
+                gaze_state = session.update(tracker, views.ts)
+                clock.mark("postprocess")
+                analyzer_scheduler.record("gaze", time.perf_counter() - started)
+                gaze_result_slot.publish((frame, gaze_state), stamp)
+                if gaze_thread.gaze_frames:
+                    result_sink.emit("gaze", seq, views.ts, session.build_result(tracker), views.captured)
+                gaze_events.extend(segmenter.update(gaze_state, views.ts, views.captured, seq))
+                clock.mark("publish")
+
+            if auto_calibration.due(views.ts):
+                calibrate_event.set()
+
+        # ---------- 자세 ----------
+        if analyzer_scheduler.should_run("pose", seq, views.ts):
+            started = time.perf_counter()
+            with latency_tracker.clock("pose", views.captured, shared.stages) as clock:
+                _, motion, coords = pose.process_landmarks(frame, result.pose_landmarks, draw=False)
+                clock.mark("postprocess")
+                analyzer_scheduler.record("pose", time.perf_counter() - started)
+                pose_result_slot.publish((frame, motion, coords), stamp)
+                result_sink.emit("pose", seq, views.ts, {"motion": motion, "coords": coords}, views.captured)
+                clock.mark("publish")
+
+        # ---------- 손 ----------
+        if analyzer_scheduler.should_run("hands", seq, views.ts):
+            started = time.perf_counter()
+            with latency_tracker.clock("hands", views.captured, shared.stages) as clock:
+                _, hand_points = hands.process_landmarks(
+                    frame, [result.left_hand_landmarks, result.right_hand_landmarks], draw=False
+                )
+                clock.mark("postprocess")
+                analyzer_scheduler.record("hands", time.perf_counter() - started)
+                hands_result_slot.publish((frame, hand_points), stamp)
+                result_sink.emit("hands", seq, views.ts, {"hands": hand_points}, views.captured)
+                clock.mark("publish")
+
+        # ---------- 표정 (얼굴 박스는 face mesh 외곽에서) ----------
+        if face is not None and analyzer_scheduler.should_run("expression", seq, views.ts):
+            started = time.perf_counter()
+            with latency_tracker.clock("expression", views.captured, shared.stages) as clock:
+                box = ExpressionAnalyzer.box_from_landmarks(face, w, h)
+                emo = expression.process_box(frame, box)
+                clock.mark("postprocess")
+                analyzer_scheduler.record("expression", time.perf_counter() - started)
+                expression_result_slot.publish((frame, emo), stamp)
+                result_sink.emit("expression", seq, views.ts, {"emotion": emo}, views.captured)
+                clock.mark("publish")
+
+    # ============================
+    # 📊 종료 시 최종 점수 + 피드백 (gaze 스레드와 동일)
+    # ============================
+    report = session.finish()
+    gaze_events.extend(segmenter.close())
+
+    print_gaze_report(report)
+    result_sink.emit_report("gaze", report)
+    print_event_summary(gaze_events.summary())
+    print(f"🧍 Holistic Thread Stopped (processed {frames.received} / dropped {frames.dropped} frames)")
+
+
+def start_holistic_thread(emotion_detector=None):
+    t = threading.Thread(target=holistic_worker, args=(emotion_detector,), daemon=True)
+    t.start()
+    flags.lifecycle.add_thread("holistic", t)  # 종료 시 타임아웃 join
+    print("🚀 holistic_thread_example 실행됨! (Camera 공유 버전)")
+    return t
@@ -0,0 +1,83 @@
+# modules/landmarks.py
+"""
+MediaPipe 랜드마크 → NumPy (N, 3) float32 변환 (gaze / pose / hands / 얼굴 ROI 공용)
+
+랜드마크를 lm.x / lm.y / lm.z 로 하나씩 읽으면 점마다 protobuf 객체를 만들고 속성 3번 접근 →
+얼굴 478점이면 프레임당 1400번이 넘는 파이썬 레벨 접근이다.
+
+NormalizedLandmarkList 를 통째로 직렬화(C 구현)하면 점마다 같은 길이의 레코드가 나온다.
+  0a <len> | 0d <x f32> | 15 <y f32> | 1d <z f32> | (25 <visibility> 2d <presence>)
+x / y / z 는 레코드마다 같은 위치에 5바이트 간격으로 있으므로 bytes 위에 strided view 를 만들어
+(N, 3) 버퍼로 한 번에 복사한다. 배치가 다르면 (필드 누락 등) 속성 접근으로 대체.
+"""
+
+import numpy as np
+
+_RECORD_TAG = 0x0A                      # NormalizedLandmarkList.landmark (field 1, length-delimited)
+_TAG_POS = np.array([0, 1, 2, 7, 12])   # 레코드 안 위치: 레코드 태그 / 레코드 길이 / x / y / z 태그
+
+
+def landmark_array(landmarks, out=None):
+    """
+    landmarks : NormalizedLandmarkList (results.pose_landmarks 등 — 직렬화 경로)
+                / 반복 필드 (.landmark) / 랜드마크 시퀀스 / (N, ≥3) 배열
+    out       : 결과를 쓸 (N, 3) float32 버퍼 (크기가 맞으면 재사용, 아니면 새로 만듦)
+    반환      : (N, 3) float32 — 정규화 x, y, z
+    """
+    if isinstance(landmarks, np.ndarray):
+        if out is None or out.shape != (len(landmarks), 3):
+            return np.ascontiguousarray(landmarks[:, :3], dtype=np.float32)
+        np.copyto(out, landmarks[:, :3], casting="unsafe")
+        return out
+
+    serialize = getattr(landmarks, "SerializeToString", None)
+    if serialize is not None:
+        view = _strided_xyz(serialize())
+        if view is not None:
+            if out is None or out.shape != view.shape:
+                out = np.empty(view.shape, np.float32)
+            np.copyto(out, view)
+            return out
+        landmarks = landmarks.landmark
+
+    n = len(landmarks)
+    if out is None or out.shape != (n, 3):
+        out = np.empty((n, 3), np.float32)
+    out.reshape(-1)[:] = np.fromiter((v for lm in landmarks for v in (lm.x, lm.y, lm.z)), np.float32, count=3 * n)
+    return out
+
+
+def _strided_xyz(data):
+    """직렬화된 NormalizedLandmarkList → (N, 3) float32 view (레코드 길이 / 태그가 일정하지 않으면 None)"""
+    if len(data) < 2 or data[0] != _RECORD_TAG or data[1] >= 0x80 or data[1] < 15:
+        return None
+    stride = data[1] + 2
+    n, rest = divmod(len(data), stride)
+    if rest:
+        return None
+
+    # 모든 레코드의 길이 바이트 / 태그 위치가 같아야 함 (길이가 다른 레코드가 섞이면 여기서 걸림)
+    raw = np.frombuffer(data, np.uint8).reshape(n, stride)
+    expected = np.array([_RECORD_TAG, stride - 2, 0x0D, 0x15, 0x1D], np.uint8)
+    if not (raw[:, _TAG_POS] == expected).all():
+        return None
+    return np.ndarray((n, 3), dtype="<f4", buffer=data, offset=3, strides=(stride, 5))
+
+
+class LandmarkBuffer:
+    """
+    분석기 1개가 프레임마다 재사용하는 변환 버퍼 (점 개수별 1개)
+    반환 배열은 다음 호출에 덮어써짐 → 결과로 내보낼 값은 복사하거나 새 배열로 계산할 것
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def __call__(self, landmarks):
+        n = len(landmarks) if isinstance(landmarks, np.ndarray) else None
+        if n is None:
+            n = len(getattr(landmarks, "landmark", landmarks))
+        out = self._buffers.get(n)
+        if out is None:
+            out = self._buffers[n] = np.empty((n, 3), np.float32)
+        return landmark_array(landmarks, out)
@@ -0,0 +1,187 @@
+# modules/latency.py
+
+import math
+import threading
+import time
+from collections import namedtuple
+
+
+# 결과마다 붙는 원본 프레임 도장 (seq: 버스 번호, ts: 소스 시각, captured: 캡처 순간 perf_counter)
+FrameStamp = namedtuple("FrameStamp", "seq ts captured")
+
+# 단계 이름 (출력 순서)
+STAGES = ("queue", "convert", "inference", "postprocess", "publish", "total", "display", "stt")
+
+
+# =====================================================
+# 📈 지연 시간 히스토그램 (로그 버킷 → 기록 O(1), 메모리 고정)
+# =====================================================
+class LatencyHistogram:
+    """
+    0.01ms ~ 100s 를 2^(1/8) 배 간격(약 9%) 버킷으로 나눠 개수만 센다.
+    → 샘플을 쌓아 두지 않아도 p50 / p95 / p99 를 버킷 정밀도로 추정
+    """
+
+    MIN_MS = 0.01
+    STEPS_PER_OCTAVE = 8
+    BUCKETS = int(math.ceil(math.log2(100_000 / MIN_MS) * STEPS_PER_OCTAVE)) + 1
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        if ms <= self.MIN_MS:
+            i = 0
+        else:
+            i = min(self.BUCKETS - 1, int(math.log2(ms / self.MIN_MS) * self.STEPS_PER_OCTAVE) + 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = min(self.min_ms, ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def _upper(self, i):
+        return self.MIN_MS * 2 ** (i / self.STEPS_PER_OCTAVE)
+
+    def percentile(self, q):
+        """q (0~100) 번째 값 — 해당 버킷의 상한 (실제 최소/최대값 범위로 자름)"""
+        if not self.count:
+            return None
+        rank = max(1, int(math.ceil(self.count * q / 100.0)))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return min(max(self._upper(i), self.min_ms), self.max_ms)
+        return self.max_ms
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.total_ms / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max_ms if self.count else None,
+        }
+
+
+# =====================================================
+# ⏱ 단계별 시계 (분석 1회분)
+# =====================================================
+class StageClock:
+    """
+    mark(stage) 를 부를 때마다 직전 mark 이후 경과 시간을 그 단계에 더한다.
+    같은 단계를 여러 번 mark 하면 합산 (예: 표정 = 얼굴 탐지 + 감정 모델).
+    with 블록 안에서는 이 스레드의 현재 시계가 되어
+    분석기 내부의 latency.mark("inference") 가 여기로 기록된다.
+
+    shared : 여러 결과가 같이 거친 단계 (Holistic 추론 1회 → pose / gaze / hands / expression)
+             를 이어받아 시작 (queue 는 다시 재지 않음)
+    """
+
+    def __init__(self, analyzer, captured=None, tracker=None, shared=None):
+        self.analyzer = analyzer
+        self.captured = captured
+        self.tracker = tracker
+        self.stages = dict(shared) if shared else {}
+        self._last = time.perf_counter()
+        if captured is not None and not shared:
+            # 캡처 → 분석 스레드가 프레임을 집어 든 순간까지
+            self.stages["queue"] = self._last - captured
+
+    def mark(self, stage):
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def __enter__(self):
+        self._outer = getattr(_local, "clock", None)
+        _local.clock = self
+        return self
+
+    def __exit__(self, *exc):
+        _local.clock = self._outer
+        if self.tracker is not None and exc[0] is None:
+            self.tracker.record_stages(self.analyzer, self.stages, self.captured)
+        return False
+
+
+_local = threading.local()
+
+
+def mark(stage):
+    """현재 스레드에 열린 StageClock 이 있으면 단계 기록 (없으면 아무 것도 안 함)"""
+    clock = getattr(_local, "clock", None)
+    if clock is not None:
+        clock.mark(stage)
+
+
+# =====================================================
+# 📊 분석기 × 단계별 히스토그램 모음
+# =====================================================
+class LatencyTracker:
+    def __init__(self):
+        self._hists = {}   # (analyzer, stage) → LatencyHistogram
+        self._lock = threading.Lock()
+
+    def clock(self, analyzer, captured=None, shared=None):
+        """with latency_tracker.clock("pose", views.captured) as clock: ..."""
+        return StageClock(analyzer, captured, tracker=self, shared=shared)
+
+    def record(self, analyzer, stage, seconds):
+        with self._lock:
+            self._add(analyzer, stage, seconds)
+
+    def record_stages(self, analyzer, stages, captured=None):
+        """stages: {단계: 초}. captured 가 있으면 캡처 → 지금까지를 total 로 기록"""
+        now = time.perf_counter()
+        with self._lock:
+            for stage, seconds in stages.items():
+                self._add(analyzer, stage, seconds)
+            if captured is not None:
+                self._add(analyzer, "total", now - captured)
+
+    def _add(self, analyzer, stage, seconds):
+        hist = self._hists.get((analyzer, stage))
+        if hist is None:
+            hist = self._hists[(analyzer, stage)] = LatencyHistogram()
+        hist.add(seconds * 1000.0)
+
+    def percentiles(self, analyzer=None):
+        """
+        {analyzer: {stage: {"count", "mean", "p50", "p95", "p99", "max"}}} (단위 ms)
+        analyzer 를 주면 그 분석기의 {stage: ...} 만
+        """
+        with self._lock:
+            out = {}
+            for name, stage in sorted(self._hists, key=_order):
+                out.setdefault(name, {})[stage] = self._hists[(name, stage)].summary()
+        if analyzer is not None:
+            return out.get(analyzer, {})
+        return out
+
+    def reset(self):
+        with self._lock:
+            self._hists.clear()
+
+
+def _order(key):
+    name, stage = key
+    return name, STAGES.index(stage) if stage in STAGES else len(STAGES), stage
+
+
+def print_latency_report(report):
+    print("⏳ [Latency] 캡처 기준 단계별 지연 (ms, p50 / p95 / p99)")
+    for name, stages in report.items():
+        print(f"   {name}")
+        for stage, s in stages.items():
+            print(f"      {stage:<12} {s['p50']:8.1f} {s['p95']:8.1f} {s['p99']:8.1f}   (n={s['count']})")
+
+
+# 전역 트래커 (스레드 모드 / 프로세스 모드 부모 쪽)
+latency_tracker = LatencyTracker()
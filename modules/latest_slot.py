@@ -0,0 +1,91 @@
+# modules/latest_slot.py
+
+import itertools
+import threading
+import time
+
+
+# =====================================================
+# 📮 최신 값 1개만 보관하는 결과 슬롯 (분석 스레드 → 대시보드)
+# =====================================================
+class LatestSlot:
+    """
+    queue.Queue(maxsize=5) + drain 대신 쓰는 "마지막 결과" 보관함.
+
+      - publish(value, stamp) : 값을 바꾸고 version 을 1 올림 (이전 값은 바로 버려짐)
+      - get()          : (version, value) — 락 없이 읽음
+      - get_stamped()  : (version, value, stamp) — stamp = 원본 프레임 FrameStamp (지연 측정용)
+      - poll(after)    : after 보다 새 값이면 (version, value), 아니면 None
+      - wait_newer(after, timeout) : 새 값이 올 때까지 대기
+
+    (version, value, stamp) 튜플 하나를 통째로 바꿔 끼우므로 읽는 쪽은 락이 필요 없다.
+    대기 중인 스레드가 있을 때만 Condition 으로 깨운다.
+    보관하는 결과는 항상 1개 → 메모리 / 전달 지연이 일정.
+
+    overwritten : 아무도 읽기 전에 새 결과로 덮어써진 결과 수 (결과 큐 드롭)
+    pending     : 아직 안 읽은 결과가 있으면 1
+    first_published : 첫 결과를 받은 시각 (perf_counter, 시작 리포트의 첫 결과 시각)
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self._item = (0, None, None)    # version 0 = 아직 결과 없음
+        self._counter = itertools.count(1)
+        self._cond = threading.Condition()
+        self._waiting = 0
+        self._read = 0                  # 마지막으로 읽어 간 version
+        self.overwritten = 0
+        self.first_published = None
+
+    @property
+    def version(self):
+        return self._item[0]
+
+    @property
+    def pending(self):
+        return 1 if self._item[0] > self._read else 0
+
+    def publish(self, value, stamp=None):
+        # 생산자는 슬롯당 1개(분석 스레드) 기준. next() 자체는 CPython 에서 원자적
+        version = next(self._counter)
+        if version == 1:
+            self.first_published = time.perf_counter()
+        if self._item[0] > self._read:
+            self.overwritten += 1
+        self._item = (version, value, stamp)
+        if self._waiting:
+            with self._cond:
+                self._cond.notify_all()
+        return version
+
+    def _take(self, item):
+        self._read = item[0]
+        return item[0], item[1]
+
+    def get(self):
+        return self._take(self._item)
+
+    def get_stamped(self):
+        item = self._item
+        self._read = item[0]
+        return item
+
+    def poll(self, after=0):
+        item = self._item
+        return self._take(item) if item[0] > after else None
+
+    def wait_newer(self, after=0, timeout=None):
+        item = self._item
+        if item[0] > after:
+            return self._take(item)
+
+        with self._cond:
+            # 대기 등록 후 다시 확인 → publish 와 엇갈려도 놓치지 않음
+            self._waiting += 1
+            try:
+                self._cond.wait_for(lambda: self._item[0] > after, timeout)
+            finally:
+                self._waiting -= 1
+
+        item = self._item
+        return self._take(item) if item[0] > after else None
@@ -0,0 +1,115 @@
+# modules/lifecycle.py
+
+import threading
+import time
+
+
+# =====================================================
+# 🧹 스레드 / 장치 수명 관리 (종료 토큰 공유 + 타임아웃 join + 자원 해제)
+# =====================================================
+class Lifecycle:
+    """
+    모든 워커는 같은 stop_token(threading.Event)을 본다.
+    shutdown() 은
+      1) stop_token.set()
+      2) on_stop 콜백 (대기 중인 스레드 깨우기: frame_bus.close 등)
+      3) 등록한 스레드를 순서대로 타임아웃 join
+      4) 등록한 자원(VideoCapture 등)을 역순으로 해제
+    를 하고, 단계별 소요 시간을 리포트로 돌려준다.
+
+    `from modules.shared_flags import RUNNING` 처럼 값을 복사하면 종료를 못 보므로
+    플래그 대신 토큰 객체를 공유한다.
+    """
+
+    def __init__(self, stop_token=None):
+        self.stop_token = stop_token if stop_token is not None else threading.Event()
+        self._threads = []      # (name, thread)
+        self._resources = []    # (name, release)
+        self._on_stop = []      # callable
+        self._steps = []        # step() 기록
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return not self.stop_token.is_set()
+
+    def add_thread(self, name, thread):
+        with self._lock:
+            self._threads.append((name, thread))
+        return thread
+
+    def threads(self):
+        """등록된 (이름, 스레드) 목록 복사본 (메트릭 수집 등)"""
+        with self._lock:
+            return list(self._threads)
+
+    def add_resource(self, name, release):
+        """shutdown 때 (스레드 join 뒤) 역순으로 호출 — 여러 번 불려도 안전해야 함"""
+        with self._lock:
+            self._resources.append((name, release))
+
+    def on_stop(self, callback):
+        with self._lock:
+            self._on_stop.append(callback)
+
+    def step(self, name, fn, *args, **kwargs):
+        """종료 과정의 한 단계를 시간 재서 실행 (예: 프로세스 풀 정지)"""
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._steps.append({"name": name, "ms": (time.perf_counter() - started) * 1000.0})
+
+    def shutdown(self, timeout=3.0):
+        """
+        timeout : 스레드 1개당 join 최대 대기(초)
+        반환    : {"threads": [...], "resources": [...], "steps": [...], "total_ms", "all_stopped"}
+        """
+        started = time.perf_counter()
+        self.stop_token.set()
+
+        for callback in self._on_stop:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ on_stop error: {e}")
+
+        threads = []
+        for name, t in self._threads:
+            t0 = time.perf_counter()
+            t.join(timeout)
+            threads.append({
+                "name": name,
+                "stopped": not t.is_alive(),
+                "ms": (time.perf_counter() - t0) * 1000.0,
+            })
+
+        resources = []
+        for name, release in reversed(self._resources):
+            t0 = time.perf_counter()
+            error = None
+            try:
+                release()
+            except Exception as e:
+                error = str(e)
+            resources.append({"name": name, "ms": (time.perf_counter() - t0) * 1000.0, "error": error})
+
+        return {
+            "threads": threads,
+            "resources": resources,
+            "steps": list(self._steps),
+            "total_ms": (time.perf_counter() - started) * 1000.0,
+            "all_stopped": all(t["stopped"] for t in threads),
+        }
+
+
+def print_shutdown_report(report):
+    print(f"🧹 [Shutdown] {report['total_ms']:.0f} ms")
+    for s in report["steps"]:
+        print(f"   step     {s['name']:<12} {s['ms']:7.1f} ms")
+    for t in report["threads"]:
+        state = "stopped" if t["stopped"] else "⚠️ still running (timeout)"
+        print(f"   thread   {t['name']:<12} {t['ms']:7.1f} ms  {state}")
+    for r in report["resources"]:
+        state = f"⚠️ {r['error']}" if r["error"] else "released"
+        print(f"   resource {r['name']:<12} {r['ms']:7.1f} ms  {state}")
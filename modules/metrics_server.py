@@ -0,0 +1,195 @@
+# modules/metrics_server.py
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# =====================================================
+# 📡 로컬 메트릭 엔드포인트 (Prometheus text format, opt-in)
+# =====================================================
+# 값은 이미 있는 카운터(스케줄러 / 프레임 버스 / 결과 슬롯 / 지연 히스토그램)를
+# 스크레이프 요청이 올 때만 읽어서 만든다 → 아무도 안 읽으면 비용 0 (대기 스레드 1개뿐)
+
+class MetricsServer:
+    """
+    server = MetricsServer(port=9108)
+    server.add_collector(bus_metrics(frame_bus))
+    server.start()      # http://127.0.0.1:9108/metrics
+
+    collector : 인자 없는 함수 → [(이름, 타입, 설명, [(labels dict, 값), ...]), ...]
+                (summary 의 _sum / _count 는 (접미사, labels, 값) 으로)
+    """
+
+    def __init__(self, port=9108, host="127.0.0.1"):
+        self.host = host
+        self.port = port
+        self.collectors = []
+        self.started = time.time()
+        self._httpd = None
+        self._thread = None
+
+    def add_collector(self, collector):
+        self.collectors.append(collector)
+
+    def render(self):
+        lines = []
+        families = [(
+            "pipeline_uptime_seconds", "gauge", "메트릭 서버 시작 후 경과 시간",
+            [({}, time.time() - self.started)],
+        )]
+        for collector in self.collectors:
+            try:
+                families.extend(collector())
+            except Exception as e:
+                # 한 수집기가 실패해도 나머지는 내보냄
+                lines.append(f"# collector error: {e}")
+
+        for name, kind, help_text, samples in families:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample in samples:
+                suffix, labels, value = sample if len(sample) == 3 else ("", *sample)
+                if value is None:
+                    continue
+                lines.append(f"{name}{suffix}{_labels(labels)} {float(value):.6g}")
+        return "\n".join(lines) + "\n"
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = server.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # 스크레이프마다 콘솔 출력하지 않음
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]  # port=0 이면 OS 가 고른 포트
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.1,), daemon=True)
+        self._thread.start()
+        print(f"📡 metrics: http://{self.host}:{self.port}/metrics")
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+
+def _labels(labels):
+    if not labels:
+        return ""
+    inner = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels.items()
+    )
+    return "{" + inner + "}"
+
+
+# =====================================================
+# 🔌 기존 카운터 → 메트릭 (수집기)
+# =====================================================
+def scheduler_metrics(scheduler):
+    """분석기별 달성 fps / 실행 수 / 건너뛴 프레임 / 평균 처리 시간"""
+    def collect():
+        report = scheduler.report()
+        tasks = [(name, r) for name, r in report.items() if not name.startswith("_")]
+        return [
+            ("analyzer_achieved_fps", "gauge", "분석기별 달성 fps",
+             [({"analyzer": n}, r["achieved_fps"]) for n, r in tasks]),
+            ("analyzer_runs_total", "counter", "분석기 실행 횟수",
+             [({"analyzer": n}, r["runs"]) for n, r in tasks]),
+            ("analyzer_skipped_total", "counter", "스케줄러가 건너뛴 프레임 수",
+             [({"analyzer": n, "reason": "rate"}, r["skipped_rate"]) for n, r in tasks]
+             + [({"analyzer": n, "reason": "budget"}, r["skipped_budget"]) for n, r in tasks]),
+            ("analyzer_busy_ms_avg", "gauge", "분석 1회 평균 처리 시간 (ms)",
+             [({"analyzer": n}, r["avg_cost_ms"]) for n, r in tasks]),
+        ]
+    return collect
+
+
+def bus_metrics(frame_bus):
+    """카메라 프레임 버스 구독자별 수신 / 드롭 / 밀린 프레임 수"""
+    def collect():
+        stats = frame_bus.stats()
+        return [
+            ("camera_frames_published_total", "counter", "카메라가 버스에 올린 프레임 수",
+             [({}, frame_bus.latest_seq + 1)]),
+            ("camera_frames_received_total", "counter", "구독자가 가져간 프레임 수",
+             [({"subscriber": n}, s["received"]) for n, s in stats.items()]),
+            ("camera_frames_dropped_total", "counter", "구독자가 못 보고 지나간 프레임 수 (카메라 큐 드롭)",
+             [({"subscriber": n}, s["dropped"]) for n, s in stats.items()]),
+            ("camera_queue_depth", "gauge", "구독자별 아직 안 읽은 프레임 수",
+             [({"subscriber": n}, s["backlog"]) for n, s in stats.items()]),
+        ]
+    return collect
+
+
+def slot_metrics(slots):
+    """결과 슬롯: 발행 수 / 읽히기 전에 덮어써진 결과 수 / 안 읽은 결과 수"""
+    def collect():
+        return [
+            ("result_published_total", "counter", "결과 슬롯에 발행된 결과 수",
+             [({"analyzer": n}, s.version) for n, s in slots.items()]),
+            ("result_dropped_total", "counter", "읽히기 전에 새 결과로 덮어써진 결과 수",
+             [({"analyzer": n}, s.overwritten) for n, s in slots.items()]),
+            ("result_queue_depth", "gauge", "아직 안 읽은 결과 수 (0 또는 1)",
+             [({"analyzer": n}, s.pending) for n, s in slots.items()]),
+        ]
+    return collect
+
+
+def latency_metrics(tracker):
+    """단계별 지연 히스토그램 (추론 시간, STT 왕복 시간 포함) → summary"""
+    def collect():
+        samples = []
+        for analyzer, stages in tracker.percentiles().items():
+            for stage, s in stages.items():
+                labels = {"analyzer": analyzer, "stage": stage}
+                for key, quantile in (("p50", "0.5"), ("p95", "0.95"), ("p99", "0.99")):
+                    samples.append(({**labels, "quantile": quantile}, s[key]))
+                samples.append(("_sum", labels, (s["mean"] or 0.0) * s["count"]))
+                samples.append(("_count", labels, s["count"]))
+        return [
+            ("pipeline_stage_latency_ms", "summary", "캡처 기준 단계별 지연 (ms)", samples),
+        ]
+    return collect
+
+
+def thread_cpu_metrics(lifecycle):
+    """등록된 스레드별 CPU 시간 (Linux /proc) + 프로세스 전체 CPU 시간"""
+    tick = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def collect():
+        per_thread = []
+        for name, t in lifecycle.threads():
+            seconds = _thread_cpu_seconds(t.native_id, tick) if t.is_alive() else None
+            per_thread.append(({"thread": name}, seconds))
+        return [
+            ("thread_cpu_seconds_total", "counter", "스레드별 CPU 시간 (user + system, Linux 만)", per_thread),
+            ("process_cpu_seconds_total", "counter", "프로세스 전체 CPU 시간", [({}, time.process_time())]),
+        ]
+    return collect
+
+
+def _thread_cpu_seconds(native_id, tick):
+    try:
+        with open(f"/proc/self/task/{native_id}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except (OSError, IndexError, TypeError):
+        return None
+    # ")" 뒤 필드: state(0) ... utime(11) stime(12)
+    return (int(fields[11]) + int(fields[12])) / tick
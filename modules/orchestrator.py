@@ -0,0 +1,305 @@
+# modules/orchestrator.py
+"""
+asyncio 오케스트레이터 (main.py --mode async)
+
+스레드 모드는 카메라 / 분석기 4개 / 음성 / 대시보드가 각자 while 루프를 도는 스레드라
+속도 조절과 종료 순서가 스레드마다 흩어져 있다. 여기서는 이벤트 루프(메인 스레드) 하나가
+
+  capture    : 프레임 읽기 (블로킹 read 는 I/O executor) → 분석기별 큐
+  analyzer×4 : 큐에서 프레임 → 추론 executor 에서 Step 실행 → 결과 슬롯 / sink
+  voice      : 녹음 / STT 호출을 I/O executor 에서 await (루프는 막지 않음)
+  ui         : 대시보드 갱신 + 키 입력 (창이 있으면 메인 스레드여야 함) 또는 헤드리스 감시
+
+를 TaskGroup 안의 task 로 돌린다.
+
+  - 추론 executor 는 크기 고정 (기본: min(분석기 수, 코어 수)). 분석기 task 는 자기 추론이
+    끝나야 다음 프레임을 꺼내므로 executor 대기열은 분석기 수를 넘지 않는다.
+  - 분석기별 큐는 크기 1 (backpressure)
+      실시간 : 분석기가 아직 이전 프레임을 처리 중이면 대기 중인 프레임을 새 프레임으로 교체 (드롭)
+      lockstep : capture 가 put 에서 기다림 → 모든 분석기가 모든 프레임을 받음
+  - 종료: 소스 끝 → 큐마다 종료 표시 → 분석기가 남은 프레임을 다 처리하면 끝.
+          q / 창 닫기 / --duration / stop_token → 모든 task 취소 → executor 가 진행 중인 추론을 마칠 때까지 join
+
+결과 슬롯 / sink record / 지연 히스토그램 / 스케줄러는 스레드 모드와 같은 것을 쓴다 (대시보드 그대로).
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+from modules.analyzer_steps import ANALYZERS, STEPS, frame_record
+from modules.camera.frame_source import open_source
+from modules.camera.frame_views import FrameViews
+from modules.gaze.gaze_events import GazeEventSegmenter, gaze_events
+from modules.latency import FrameStamp, latency_tracker
+from modules.process_mode import _legacy_item
+from modules.scheduler import analyzer_scheduler
+from modules.startup import DUMMY_FRAME, startup
+import modules.result_sink as result_sink
+import modules.shared_flags as flags
+
+_END = None  # 분석기 큐 종료 표시
+
+
+class AsyncOrchestrator:
+    def __init__(self, source, slots, analyzers=ANALYZERS, step_kwargs=None, lockstep=False,
+                 workers=None, scheduler=analyzer_scheduler, voice_slot=None):
+        """
+        source      : 카메라 번호 / 동영상 경로 / 이미지 폴더 / FrameSource
+        slots       : {분석기: LatestSlot} (스레드 모드 결과 슬롯 → 대시보드 호환)
+        step_kwargs : {분석기: STEPS[분석기] 생성 인자}
+        workers     : 추론 executor 크기 (기본: min(분석기 수, 코어 수))
+        voice_slot  : 음성 결과 슬롯 (None = 음성 끔)
+        """
+        self.source = open_source(source)
+        self.slots = slots
+        self.names = tuple(analyzers)
+        self.step_kwargs = step_kwargs or {}
+        self.lockstep = lockstep
+        self.workers = workers or max(1, min(len(self.names), os.cpu_count() or 1))
+        self.scheduler = scheduler
+        self.voice_slot = voice_slot
+
+        self.steps = {}
+        self.frames = 0
+        self.dropped = {name: 0 for name in self.names}   # 큐에서 새 프레임으로 교체된 수
+        self.errors = 0
+        self.source_finished = False
+        self.report = None
+        self.gaze_segmenter = GazeEventSegmenter()  # gaze task 만 (추론 executor 에서 프레임 순서대로) 호출
+
+        self._inference = ThreadPoolExecutor(self.workers, thread_name_prefix="inference")
+        self._io = ThreadPoolExecutor(2, thread_name_prefix="io")   # 프레임 read + 녹음 / STT
+        self._queues = {}
+        self._stop = None
+        self._calibrate = False
+        self._remaining = len(self.names)
+
+    # -------------------------------
+    # 외부 제어 (루프 스레드에서 호출)
+    # -------------------------------
+    def stop(self):
+        if self._stop is not None:
+            self._stop.set()
+
+    def calibrate_gaze(self):
+        """'c' 키 → 다음 gaze 프레임 전에 보정 (gaze task 가 executor 에서 실행)"""
+        self._calibrate = True
+
+    # -------------------------------
+    # 실행
+    # -------------------------------
+    def run(self, dashboard=None, duration=None):
+        """메인 스레드에서 호출 → 끝날 때까지 블로킹. 시선 최종 리포트 반환"""
+        return asyncio.run(self.main(dashboard, duration))
+
+    async def main(self, dashboard=None, duration=None):
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._queues = {name: asyncio.Queue(maxsize=1) for name in self.names}
+
+        try:
+            # 분석기 생성 + 더미 프레임 warm-up 을 추론 executor 에서 동시에 (소스 열기와도 겹침)
+            opened, *steps = await asyncio.gather(
+                loop.run_in_executor(self._io, self.source.open),
+                *(loop.run_in_executor(self._inference, self._build, name) for name in self.names),
+            )
+            if not opened:
+                print(f"❌ Camera open failed ({self.source.name})")
+                return None
+            self.steps = dict(zip(self.names, steps))
+            startup.mark("ready")
+            print(f"🔥 Analyzers ready in {startup.marks['ready']:.2f}s (async, {self.workers} inference workers)")
+
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(self._capture(loop), name="capture")]
+                tasks += [tg.create_task(self._analyze(loop, name), name=name) for name in self.names]
+                if self.voice_slot is not None:
+                    tasks.append(tg.create_task(self._voice(loop), name="voice"))
+                ui = self._dashboard(dashboard) if dashboard is not None else self._watch(duration)
+                tasks.append(tg.create_task(ui, name="ui"))
+
+                # 소스 끝(분석기 모두 종료) 또는 종료 요청 → 남은 task 취소
+                await self._stop.wait()
+                flags.stop_token.set()
+                for task in tasks:
+                    task.cancel()
+        finally:
+            # 취소돼도 executor 스레드는 진행 중인 read / 추론을 마침 → join 후 자원 해제
+            self._inference.shutdown(wait=True)
+            self._io.shutdown(wait=True)
+            self.source.release()
+
+            # Ctrl+C 로 main task 가 취소돼도 최종 리포트 / 진행 중 구간 이벤트는 남김 (run() 이 self.report 로 돌려줌)
+            gaze = self.steps.get("gaze")
+            self.report = gaze.finish() if gaze is not None else None
+            gaze_events.extend(self.gaze_segmenter.close())
+            expression = self.steps.get("expression")
+            if expression is not None and os.path.exists(expression.analyzer.tmp_path):
+                os.remove(expression.analyzer.tmp_path)
+        return self.report
+
+    def _build(self, name):
+        return startup.warm_up(
+            name, lambda: STEPS[name](**self.step_kwargs.get(name, {})), lambda step: step.warm_up(DUMMY_FRAME)
+        )
+
+    # -------------------------------
+    # 📷 capture
+    # -------------------------------
+    async def _capture(self, loop):
+        print(f"📷 Async capture started ({self.source.name})")
+        try:
+            while True:
+                ret, frame, ts = await loop.run_in_executor(self._io, self.source.read)
+                captured = time.perf_counter()
+                if not ret:
+                    if self.source.exhausted:
+                        break
+                    continue  # 카메라 일시적 실패 → 재시도
+
+                item = (self.frames, FrameViews(frame, ts, captured))
+                self.frames += 1
+                for name, queue in self._queues.items():
+                    await self._offer(name, queue, item)
+
+            # 소스 끝: 대기 중인 프레임을 분석기가 꺼낸 뒤 종료 표시 (마지막 프레임도 처리됨)
+            self.source_finished = True
+            for queue in self._queues.values():
+                await queue.put(_END)
+        finally:
+            print(f"📷 Async capture ended ({self.frames} frames)")
+
+    async def _offer(self, name, queue, item):
+        if self.lockstep:
+            await queue.put(item)   # 분석기가 직전 프레임을 꺼낼 때까지 대기 (드롭 없음)
+        else:
+            self._replace(name, queue, item)
+
+    def _replace(self, name, queue, item):
+        """크기 1 큐: 아직 안 꺼낸 프레임이 있으면 버리고 새 것으로"""
+        if queue.full():
+            queue.get_nowait()
+            self.dropped[name] += 1
+        queue.put_nowait(item)
+
+    # -------------------------------
+    # 🧠 analyzer
+    # -------------------------------
+    async def _analyze(self, loop, name):
+        queue = self._queues[name]
+        step = self.steps[name]
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    break
+                seq, views = item
+
+                if name == "gaze" and self._calibrate:
+                    self._calibrate = False
+                    await loop.run_in_executor(self._inference, step.calibrate)
+
+                if not self.scheduler.should_run(name, seq, views.ts):
+                    continue
+                await loop.run_in_executor(self._inference, self._run, name, step, seq, views)
+        finally:
+            self._remaining -= 1
+            if self._remaining == 0:
+                self.stop()   # 모든 분석기가 마지막 프레임까지 처리함
+
+    def _run(self, name, step, seq, views):
+        """추론 executor 스레드: 스레드 모드 워커 1회와 같은 측정 / 전달"""
+        started = time.perf_counter()
+        try:
+            with latency_tracker.clock(name, views.captured) as clock:
+                views.rgb  # 색 변환 (같은 프레임의 다른 분석기와 공유)
+                clock.mark("convert")
+                result = step(views)
+                clock.mark("postprocess")
+                self.scheduler.record(name, time.perf_counter() - started)
+                record = frame_record(step, result)
+                if record is not None:
+                    result_sink.emit(name, seq, views.ts, record, views.captured)
+                if name == "gaze":
+                    gaze_events.extend(self.gaze_segmenter.update(result, views.ts, views.captured, seq))
+                self.slots[name].publish(_legacy_item(name, views.bgr, result),
+                                         FrameStamp(seq, views.ts, views.captured))
+                clock.mark("publish")
+        except Exception as e:
+            self.errors += 1
+            print(f"❌ {name} error: {e}")
+
+    # -------------------------------
+    # 🎤 voice (녹음 / STT 는 I/O executor 에서 await)
+    # -------------------------------
+    async def _voice(self, loop):
+        from modules.voice.voice_module import preprocess_audio, record_until_silence
+        from modules.voice.stt_google import google_stt, prepare
+
+        await loop.run_in_executor(self._io, startup.warm_up, "voice", lambda: None, lambda _: prepare())
+        print("🎧 Async voice started")
+        while True:
+            try:
+                audio_path = await loop.run_in_executor(
+                    self._io, lambda: record_until_silence(
+                        output_path="temp.wav", rate=16000, silence_limit=1.2, stop_token=flags.stop_token
+                    )
+                )
+                if audio_path is None:
+                    continue
+                await loop.run_in_executor(self._io, preprocess_audio, audio_path, 16000)
+
+                started = time.perf_counter()
+                text = await loop.run_in_executor(self._io, google_stt, audio_path) or "(음성 없음)"
+                latency_tracker.record("voice", "stt", time.perf_counter() - started)
+
+                result = {"text": text, "timestamp": time.time()}
+                self.voice_slot.publish(result)
+                result_sink.emit("voice", None, result["timestamp"], result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print("❌ Voice error:", e)
+                await asyncio.sleep(0.5)
+
+    # -------------------------------
+    # 🖥 ui
+    # -------------------------------
+    async def _dashboard(self, dashboard, window_name="AI Mock Interview - Dashboard"):
+        """창 / 키 입력은 메인 스레드(= 루프 스레드)에서. 화면 갱신 사이에는 루프에 양보"""
+        while True:
+            if dashboard.render():
+                try:
+                    cv2.imshow(window_name, dashboard.canvas)
+                except cv2.error:
+                    print("🔥 imshow error — window closed")
+                    break
+
+            if cv2.getWindowProperty(window_name, cv2.WND_PROP_VISIBLE) < 1:
+                print("🔥 Window closed by user.")
+                break
+
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('c'):
+                self.calibrate_gaze()
+                print("✅ 'c' pressed → Gaze center calibration requested")
+            if key == ord('q'):
+                print("🔚 'q' pressed. Exiting.")
+                break
+
+            await asyncio.sleep(dashboard.wait_ms() / 1000.0)
+        self.stop()
+
+    async def _watch(self, duration=None):
+        """헤드리스: 시간 제한 / 외부 종료 요청(stop_token) 감시"""
+        started = time.monotonic()
+        while not flags.stop_token.is_set():
+            if duration is not None and time.monotonic() - started >= duration:
+                print("⏱ Duration reached.")
+                break
+            await asyncio.sleep(0.1)
+        self.stop()
@@ -0,0 +1,93 @@
+# modules/overlay.py
+
+import cv2
+
+# MediaPipe drawing_utils 기본 스타일과 동일한 색
+LANDMARK_COLOR = (0, 0, 255)
+CONNECTION_COLOR = (224, 224, 224)
+
+# pose / hands 연결선 (mediapipe 는 처음 그릴 때 import → 대시보드 import 가 가벼움)
+_CONNECTIONS = {}
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+# =====================================================
+# 🎨 오버레이 렌더러 (분석 결과 레코드 → 표시 해상도 이미지에 그림)
+# =====================================================
+# 분석 스레드는 공유 프레임에 그리지 않고 랜드마크 / 수치만 넘긴다.
+# 대시보드가 패널 크기로 줄인 이미지 위에 여기 함수들로 그린다.
+#   → 분석 비용이 화면을 보는지 여부와 무관, 공유 프레임은 읽기 전용
+
+def connections(name):
+    """'pose' / 'hands' 랜드마크 연결선 (index 쌍 튜플)"""
+    if not _CONNECTIONS:
+        import mediapipe as mp
+        _CONNECTIONS["pose"] = tuple(mp.solutions.pose.POSE_CONNECTIONS)
+        _CONNECTIONS["hands"] = tuple(mp.solutions.hands.HAND_CONNECTIONS)
+    return _CONNECTIONS[name]
+
+
+def _points(image, coords):
+    h, w = image.shape[:2]
+    return [(int(x * w), int(y * h)) for x, y, *_ in coords]
+
+
+def draw_landmarks(image, coords, connections, radius=2, thickness=2):
+    """정규화 좌표 (N, 2|3) + 연결선 → image 에 직접 그림"""
+    if coords is None or len(coords) == 0:
+        return image
+    pts = _points(image, coords)
+    for a, b in connections:
+        cv2.line(image, pts[a], pts[b], CONNECTION_COLOR, thickness)
+    for p in pts:
+        cv2.circle(image, p, radius, LANDMARK_COLOR, thickness)
+    return image
+
+
+def draw_pose(image, coords):
+    """PoseAnalyzer 결과 (33, 3)"""
+    return draw_landmarks(image, coords, connections("pose"))
+
+
+def draw_hands(image, hands):
+    """HandsAnalyzer 결과: 손마다 (21, 3)"""
+    for hand in hands or ():
+        draw_landmarks(image, hand, connections("hands"))
+    return image
+
+
+def draw_gaze(image, gaze, source_width=None):
+    """
+    gaze : GazeSession.update() 가 돌려준 GazeState
+    GazeTracker._draw_ui 와 같은 배치 (시선 방향 / 깜빡임 / 보정 안내 / EAR 임계값)
+    source_width : 원본 프레임 폭 → 글자 크기/위치를 표시 해상도에 맞게 축소
+    """
+    h, w = image.shape[:2]
+    s = w / source_width if source_width else 1.0
+    thick = max(1, int(round(2 * s)))
+
+    def px(v):
+        return int(v * s)
+
+    text_x, text_y = px(50), px(50)
+    cv2.putText(image, gaze.left_right, (text_x, text_y),
+                FONT, 1 * s, (0, 255, 0), thick, cv2.LINE_AA)
+    cv2.putText(image, gaze.up_down, (text_x, text_y + px(40)),
+                FONT, 1 * s, (0, 255, 0), thick, cv2.LINE_AA)
+
+    if gaze.is_blinking:
+        cv2.putText(image, "Blinking...", (text_x, text_y + px(80)),
+                    FONT, 0.8 * s, (0, 0, 255), thick, cv2.LINE_AA)
+
+    if gaze.calibrated:
+        calib_instruction, calib_color = "Calibrated", (0, 255, 0)
+    else:
+        calib_instruction, calib_color = "Press 'c' to Calibrate Center", (0, 0, 255)
+    size = cv2.getTextSize(calib_instruction, FONT, 1 * s, thick)[0]
+    cv2.putText(image, calib_instruction, ((w - size[0]) // 2, h - px(30)),
+                FONT, 1 * s, calib_color, thick, cv2.LINE_AA)
+
+    cv2.putText(image, f"Limit: {gaze.blink_threshold:.3f}", (w - px(200), px(50)),
+                FONT, 0.7 * s, (200, 200, 200), thick)
+    return image
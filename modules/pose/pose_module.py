@@ -1,38 +1,60 @@
 import cv2
-import mediapipe as mp
 import numpy as np
-from collections import deque
+
+from modules import latency
+from modules.landmarks import landmark_array
 
 class PoseAnalyzer:
     def __init__(self, smooth_window=5, motion_threshold=20):
-        # MediaPipe 초기화
+        # MediaPipe 초기화 (Pose 그래프는 처음 쓸 때 생성 → Holistic 모드에서는 만들지 않음)
+        # mediapipe import 도 여기서 → main import 가 가벼워지고 분석 스레드에서 병렬로 로드
+        import mediapipe as mp
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        self._pose = None
         self.drawing = mp.solutions.drawing_utils
 
-        # 안정화용 버퍼
-        self.landmark_buffer = deque(maxlen=smooth_window)
+        # 안정화용 버퍼: 최근 smooth_window 프레임 좌표 (smooth_window, 33, 3) 링 — 랜드마크를 여기로 바로 변환
+        self.smooth_window = smooth_window
+        self._ring = None
+        self._ring_next = 0
+        self._ring_filled = 0
         self.prev_coords = None
         self.motion_threshold = motion_threshold
 
+    @property
+    def pose(self):
+        if self._pose is None:
+            self._pose = self.mp_pose.Pose(
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+        return self._pose
+
     # =========================
     # 1) 프레임에서 자세 인식
     # =========================
-    def detect_pose(self, frame):
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    def detect_pose(self, frame, rgb=None):
+        # 공유 프레임에서 이미 만든 RGB가 있으면 재사용
+        if rgb is None:
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         result = self.pose.process(rgb)
+        latency.mark("inference")
         return result
 
     # =========================
     # 2) 좌표 안정화(이동 평균)
     # =========================
     def stabilize(self, landmarks):
-        self.landmark_buffer.append(landmarks)
-        avg = np.mean(self.landmark_buffer, axis=0)
-        return avg
+        """landmarks: MediaPipe pose_landmarks 또는 (33, 3) 배열 → 최근 프레임 평균 (새 배열)"""
+        n = len(landmarks) if isinstance(landmarks, np.ndarray) else len(landmarks.landmark)
+        if self._ring is None or self._ring.shape[1] != n:
+            self._ring = np.empty((self.smooth_window, n, 3), np.float32)
+            self._ring_next = self._ring_filled = 0
+
+        landmark_array(landmarks, out=self._ring[self._ring_next])
+        self._ring_next = (self._ring_next + 1) % self.smooth_window
+        self._ring_filled = min(self._ring_filled + 1, self.smooth_window)
+        return self._ring[:self._ring_filled].mean(axis=0)
 
     # =========================
     # 3) 움직임 변화량 계산
@@ -49,35 +71,36 @@ class PoseAnalyzer:
     # =========================
     # 4) 전체 프레임 처리
     # =========================
-    def process_frame(self, frame):
-        result = self.detect_pose(frame)
+    def process_frame(self, frame, rgb=None, draw=True):
+        result = self.detect_pose(frame, rgb)
+        return self.process_landmarks(frame, result.pose_landmarks, draw)
 
-        if not result.pose_landmarks:
+    # =========================
+    # 5) 랜드마크만 받아서 처리 (Holistic 등 외부 추론 결과)
+    # =========================
+    def process_landmarks(self, frame, pose_landmarks, draw=True):
+        if not pose_landmarks:
             return frame, 0, None
 
-        # 좌표 배열화
-        landmarks = np.array(
-            [(lm.x, lm.y, lm.z) for lm in result.pose_landmarks.landmark]
-        )
-
-        # 1. 흔들림 안정화
-        stabilized = self.stabilize(landmarks)
+        # 1. 흔들림 안정화 (좌표 배열화는 안정화 링 버퍼에 바로)
+        stabilized = self.stabilize(pose_landmarks)
 
         # 2. 움직임 변화량 계산
         motion_value = self.calc_motion(stabilized)
 
-        # 3. 시각화
-        self.drawing.draw_landmarks(
-            frame,
-            result.pose_landmarks,
-            self.mp_pose.POSE_CONNECTIONS
-        )
+        # 3. 시각화 (프로세스 모드 등 결과만 필요하면 생략)
+        if draw:
+            self.drawing.draw_landmarks(
+                frame,
+                pose_landmarks,
+                self.mp_pose.POSE_CONNECTIONS
+            )
 
         return frame, motion_value, stabilized
 
 
 # =========================
-# 5) 모듈 단독 실행용 테스트
+# 6) 모듈 단독 실행용 테스트
 # =========================
 if __name__ == "__main__":
     analyzer = PoseAnalyzer()
@@ -3,6 +3,8 @@ import mediapipe as mp
 import numpy as np
 from collections import deque
 
+from modules.landmarks import landmark_array
+
 mp_pose = mp.solutions.pose
 pose = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
 mp_drawing = mp.solutions.drawing_utils
@@ -26,15 +28,14 @@ while cap.isOpened():
     state_eng = "Detecting..."
 
     if results.pose_landmarks:
-        landmarks = results.pose_landmarks.landmark
-
-        coords = [(landmarks[i].x, landmarks[i].y) for i in important_joints]
+        # 랜드마크 → (33, 3) 배열 한 번에, 관절 x / y 만
+        coords = landmark_array(results.pose_landmarks)[important_joints, :2]
         coords_buffer.append(coords)
 
         # 프레임 간 변화량 평균 계산
         if len(coords_buffer) == coords_buffer.maxlen:
             motion = np.mean([
-                np.linalg.norm(np.array(coords_buffer[i]) - np.array(coords_buffer[i - 1]))
+                np.linalg.norm(coords_buffer[i] - coords_buffer[i - 1])
                 for i in range(1, len(coords_buffer))
             ])
 
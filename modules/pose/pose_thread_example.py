@@ -1,46 +1,65 @@
 # modules/pose/pose_thread_example.py
 
-import cv2
 import threading
-import queue
+import time
 from modules.pose.pose_module import PoseAnalyzer
-from modules.shared_flags import RUNNING
-from modules.camera.camera_manager import shared_frame_queue   # 🔥 공유 카메라 큐 사용
+import modules.shared_flags as flags
+import modules.result_sink as result_sink
+from modules.scheduler import analyzer_scheduler
+from modules.camera.camera_manager import frame_bus   # 🔥 공유 카메라 버스 사용
+from modules.latest_slot import LatestSlot
+from modules.latency import FrameStamp, latency_tracker
+from modules.startup import DUMMY_FRAME, startup
 
-result_queue = queue.Queue(maxsize=5)
+# 최신 결과 1개 → main.py
+pose_result_slot = LatestSlot("pose")
 
 
 def pose_worker():
-    analyzer = PoseAnalyzer()
+    # 구독 전에 그래프 생성 + 더미 프레임 1장 (다른 분석 스레드와 동시에)
+    analyzer = startup.warm_up("pose", PoseAnalyzer, lambda a: a.process_frame(DUMMY_FRAME, draw=False))
+    frames = frame_bus.subscribe("pose")
     print("💪 Pose Thread Started")
 
-    while RUNNING:
-        # 카메라 프레임이 아직 생성되지 않았다면 잠시 대기
-        if shared_frame_queue.empty():
+    while flags.running():
+        # 새 프레임이 올 때까지 블로킹 대기 (타임아웃마다 종료 플래그 확인)
+        item = frames.wait(timeout=0.1)
+        if item is None:
+            # 동영상/이미지 소스가 끝났으면 종료
+            if frames.finished:
+                break
             continue
 
-        # 공통 카메라 프레임 가져오기
-        frame = shared_frame_queue.get()
+        # 공통 카메라 프레임 가져오기 (다른 스레드와 공유 → 읽기만)
+        seq, views = item
 
-        processed_frame, motion, coords = analyzer.process_frame(frame)
+        # 목표 fps / CPU 예산에 따라 이번 프레임은 건너뛰기
+        if not analyzer_scheduler.should_run("pose", seq, views.ts):
+            continue
+        started = time.perf_counter()
 
-        result = (processed_frame, motion, coords)
+        # 캡처 → 대기 / 색 변환 / 추론 / 후처리 / 전달 단계별 지연 기록
+        with latency_tracker.clock("pose", views.captured) as clock:
+            rgb = views.rgb
+            clock.mark("convert")
 
-        # 가장 오래된 값 버리기
-        if result_queue.full():
-            try:
-                result_queue.get_nowait()
-            except:
-                pass
+            # 그리지 않고 수치/좌표만 (스켈레톤은 대시보드가 표시 해상도에서 그림)
+            _, motion, coords = analyzer.process_frame(views.bgr, rgb, draw=False)
+            clock.mark("postprocess")
+            analyzer_scheduler.record("pose", time.perf_counter() - started)
+            result_sink.emit("pose", seq, views.ts, {"motion": motion, "coords": coords}, views.captured)
 
-        result_queue.put(result)
+            # 최신 값만 유지 (이전 결과는 바로 버려짐)
+            pose_result_slot.publish((views.bgr, motion, coords), FrameStamp(seq, views.ts, views.captured))
+            clock.mark("publish")
 
-    print("💪 Pose Thread Stopped")
+    print(f"💪 Pose Thread Stopped (dropped {frames.dropped} frames)")
 
 
 def start_pose_thread():
     t_pose = threading.Thread(target=pose_worker, daemon=True)
     t_pose.start()
+    flags.lifecycle.add_thread("pose", t_pose)  # 종료 시 타임아웃 join
 
     print("🚀 pose_thread_example 실행됨! (Camera 공유 버전)")
     return t_pose
@@ -0,0 +1,358 @@
+# modules/process_mode.py
+"""
+멀티 프로세스 분석 모드
+
+스레드 모드에서는 pose / gaze / hands / expression 의 파이썬 쪽 처리
+(랜드마크 가공, 점수 계산 등)가 GIL 때문에 한 코어에서 번갈아 돈다.
+이 모드에서는 분석기마다 별도 프로세스를 띄우고,
+
+  카메라 스레드 → FrameBus → (부모) 공유 메모리 링에 1번 복사
+                                   ↓ (복사 없이 뷰로 읽기)
+                       pose / gaze / hands / expression 프로세스
+                                   ↓ Pipe (작은 결과 dict / GazeState + 시선 구간 이벤트)
+                       (부모) 결과 수신 스레드 → 기존 결과 슬롯 (LatestSlot)
+
+단계별 지연(대기 / 색 변환 / 추론 / 후처리)은 자식이 재서 결과와 같이 보내고,
+부모가 전달 단계를 더해 latency_tracker 에 기록한다.
+
+처럼 프레임은 한 번만 공유 메모리에 올리고, 결과만 파이프로 돌려받는다.
+시선 구간 분할은 gaze 자식이 하고 이벤트만 보낸다 (프레임별 전체 결과는 frames=True 일 때만).
+--lockstep 이면 자식마다 프레임 처리(또는 건너뜀)를 알리고, 모두 알린 뒤에 다음 프레임을 올린다.
+"""
+
+import multiprocessing as mp
+import threading
+from multiprocessing.connection import wait as wait_connections
+
+import time
+
+from modules.analyzer_steps import ANALYZERS, STEPS, frame_record
+from modules.camera.frame_views import FrameViews
+from modules.camera.shm_frame_ring import ShmFrameRing
+from modules.gaze.gaze_events import GazeEventSegmenter, gaze_events
+from modules.scheduler import RateScheduler
+from modules.latency import FrameStamp, StageClock, latency_tracker
+from modules.startup import DUMMY_FRAME, startup
+import modules.result_sink as result_sink
+
+
+def analyzer_process(name, new_frame, stop_event, conn, step_kwargs=None, schedule=None, warmup=True,
+                     lockstep=False):
+    """
+    자식 프로세스 진입점 (spawn 호환을 위해 모듈 최상위 함수)
+    schedule: RateScheduler.register() 설정 (프로세스별 목표 fps / stride)
+    warmup  : 첫 프레임 전에 더미 프레임으로 그래프 생성 → ("ready", 소요 초) 를 부모에 알림
+    lockstep: 프레임마다 처리(또는 건너뜀)를 부모에 알림 → 부모는 모두 알린 뒤 다음 프레임을 올림
+
+    공유 메모리 링은 첫 카메라 프레임 크기로 만들어지므로 warm-up 이 끝난 뒤 ("ring", spec) 명령으로 붙는다.
+    (소스 해상도가 바뀌면 부모가 링을 새로 만들고 같은 명령을 다시 보냄 → 이전 링을 닫고 새 링에 붙음)
+    """
+    started = time.perf_counter()
+    step = STEPS[name](**(step_kwargs or {}))
+    error = None
+    if warmup:
+        try:
+            step.warm_up(DUMMY_FRAME)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    conn.send(("ready", -1, (time.perf_counter() - started if warmup else None, error)))
+    scheduler = RateScheduler()
+    scheduler.register(name, **(schedule or {}))
+    print(f"🧩 {name} process started")
+
+    segmenter = GazeEventSegmenter() if name == "gaze" else None
+    ring = None
+    last_seq = -1
+    torn = 0
+    frame = views = None
+
+    try:
+        while not stop_event.is_set():
+            # 부모에서 온 명령 처리 (링 연결 / 'c' 보정 등)
+            while conn.poll():
+                cmd, arg = conn.recv()
+                if cmd == "ring":
+                    if ring is not None:
+                        frame = views = None   # 이전 링의 뷰를 놓아야 닫힘
+                        ring.close()
+                    ring = ShmFrameRing.attach(*arg)
+                elif cmd == "calibrate" and hasattr(step, "calibrate"):
+                    step.calibrate()
+
+            # 첫 프레임(= 링) 이 오기 전
+            if ring is None:
+                conn.poll(0.1)
+                continue
+
+            # 새 프레임 알림 대기 (타임아웃마다 종료 확인)
+            with new_frame:
+                if ring.latest_seq <= last_seq:
+                    new_frame.wait(timeout=0.1)
+
+            item = ring.read_latest(last_seq)
+            if item is None:
+                continue
+
+            seq, frame, ts, captured = item
+            last_seq = seq
+
+            # 목표 fps / stride 에 따라 건너뛰기
+            if not scheduler.should_run(name, seq, ts):
+                if lockstep:
+                    conn.send(("ack", seq, None))
+                continue
+
+            started = time.perf_counter()
+            with StageClock(name, captured) as clock:
+                views = FrameViews(frame, ts, captured)
+                views.rgb  # 색 변환 (분석 단계는 이 캐시를 재사용)
+                clock.mark("convert")
+                result = step(views)
+                clock.mark("postprocess")
+            scheduler.record(name, time.perf_counter() - started)
+
+            # 처리 도중 슬롯이 덮어써졌다면 결과를 믿을 수 없으므로 버림 (lockstep 에서는 생기지 않음)
+            if not ring.is_valid(seq):
+                torn += 1
+                if lockstep:
+                    conn.send(("ack", seq, None))
+                continue
+
+            # ts / captured 도 같이 → 부모가 원본 프레임을 이미 버렸어도 sink 기록은 남김
+            conn.send(("result", seq, (ts, captured, result, clock.stages, frame_record(step, result))))
+            if segmenter is not None:
+                events = segmenter.update(result, ts, captured, seq)
+                if events:
+                    conn.send(("events", seq, events))
+
+        report = step.finish() if hasattr(step, "finish") else None
+        if segmenter is not None:
+            conn.send(("events", last_seq, segmenter.close()))
+        conn.send(("final", last_seq, {
+            "report": report,
+            "torn": torn,
+            "schedule": scheduler.report()[name],
+        }))
+
+    finally:
+        frame = views = None
+        if ring is not None:
+            ring.close()
+        conn.close()
+        print(f"🧩 {name} process stopped (torn {torn})")
+
+
+# =====================================================
+# 🧭 부모 프로세스 쪽 관리자
+# =====================================================
+def _legacy_item(name, frame, result):
+    """스레드 모드의 결과 슬롯 형식으로 변환 (main 대시보드 호환)"""
+    if name == "pose":
+        return frame, result["motion"], result["coords"]
+    if name == "gaze":
+        return frame, result
+    if name == "hands":
+        return frame, result["hands"]
+    return frame, result["emotion"]
+
+
+class ProcessAnalyzerPool:
+    """
+    분석기별 프로세스 + 공유 메모리 링 + 결과 수신 스레드 관리
+
+    start() 는 자식 생성 + warm-up 만 시작하고 버스를 구독해 둔다 (카메라는 준비된 뒤에 시작할 것).
+    링은 첫 프레임 크기로 만들어 자식에게 알린다 (해상도가 바뀌면 seq 를 이어서 다시 만들어 알림).
+    lockstep=True 면 모든 자식이 직전 프레임을 처리(또는 건너뜀)했다고 알린 뒤 다음 프레임을 올린다
+    → 버스 lockstep 과 이어져 동영상 파일도 드롭 없이 끝까지 분석.
+    """
+
+    def __init__(self, frame_bus, result_slots, names=ANALYZERS, slots=6, step_kwargs=None, schedules=None,
+                 warmup=True, lockstep=False):
+        self.frame_bus = frame_bus
+        self.result_slots = result_slots
+        self.names = tuple(names)
+        self.slots = slots
+        self.step_kwargs = step_kwargs or {}
+        self.schedules = schedules or {}
+        self.warmup = warmup
+        self.lockstep = lockstep
+
+        self.ring = None
+        self.processes = {}
+        self.conns = {}
+        self.finals = {}
+        self.late = {name: 0 for name in self.names}  # 원본 프레임이 링에서 밀려난 뒤 도착한 결과 (sink 만 기록)
+        self.drained = threading.Event()            # 소스 끝 + (lockstep) 모든 자식이 마지막 프레임까지 처리
+
+        self._ctx = mp.get_context("spawn")  # Windows 와 동일한 동작
+        self._stop = threading.Event()
+        self._frames_by_seq = {}
+        self._threads = []
+        self._send_lock = threading.Lock()   # 링 알림(publisher) / 'c' 보정(UI) 이 같은 파이프에 씀
+        self._acked = {name: -1 for name in self.names}
+        self._acks = threading.Condition()
+
+    def start(self):
+        self.new_frame = self._ctx.Condition()
+        self.stop_event = self._ctx.Event()
+
+        for name in self.names:
+            parent_conn, child_conn = self._ctx.Pipe()
+            p = self._ctx.Process(
+                target=analyzer_process,
+                args=(name, self.new_frame, self.stop_event, child_conn,
+                      self.step_kwargs.get(name), self.schedules.get(name), self.warmup, self.lockstep),
+                name=f"{name}-analyzer",
+                daemon=True,
+            )
+            p.start()
+            child_conn.close()
+            self.processes[name] = p
+            self.conns[name] = parent_conn
+
+        # 카메라보다 먼저 구독 (lockstep 버스는 구독자가 모여야 첫 프레임 발행)
+        frames = self.frame_bus.subscribe("shm_publisher")
+        for target, args in ((self._publisher, (frames,)), (self._receiver, ())):
+            t = threading.Thread(target=target, args=args, daemon=True)
+            t.start()
+            self._threads.append(t)
+
+        print(f"🚀 process mode: {', '.join(self.names)} ({len(self.names)} processes"
+              f"{', lockstep' if self.lockstep else ''})")
+
+    # -------------------------------
+    # 카메라 프레임 → 공유 메모리
+    # -------------------------------
+    def _publish(self, views):
+        shape = views.bgr.shape
+        if self.ring is None or self.ring.shape != shape:
+            # 첫 프레임 크기로 링 생성 → 자식들이 붙음
+            # (해상도가 바뀐 소스 — 예: 크기가 섞인 이미지 폴더 — 는 고정 크기 슬롯에 복사할 수 없으므로 새 링으로)
+            old = self.ring
+            self.ring = ShmFrameRing.create(shape, self.slots, last_seq=old.latest_seq if old else -1)
+            for name in self.names:
+                self.send(name, "ring", self.ring.spec)
+            if old is not None:
+                print(f"🔁 frame size changed {old.shape} → {shape}: shared-memory ring re-created")
+                old.close()
+
+        seq = self.ring.publish(views.bgr, views.ts or 0.0, views.captured)
+
+        # 결과가 돌아왔을 때 대시보드에 붙일 원본 프레임 (링에 남아있는 만큼만)
+        self._frames_by_seq[seq] = views
+        self._frames_by_seq.pop(seq - self.slots, None)
+
+        with self.new_frame:
+            self.new_frame.notify_all()
+
+    def _wait_acked(self):
+        """(lockstep) 살아 있는 자식이 모두 마지막으로 올린 프레임을 처리(또는 건너뜀)할 때까지"""
+        if self.ring is None:
+            return
+        seq = self.ring.latest_seq
+        with self._acks:
+            while not self._stop.is_set() and not self.stop_event.is_set():
+                if all(self._acked[name] >= seq or not p.is_alive() for name, p in self.processes.items()):
+                    return
+                self._acks.wait(0.1)
+
+    def _publisher(self, frames):
+        while not self._stop.is_set():
+            item = frames.wait(timeout=0.1)
+            if item is None:
+                if frames.finished:
+                    break
+                continue
+            if self.lockstep:
+                self._wait_acked()
+            self._publish(item[1])
+
+        if self.lockstep:
+            self._wait_acked()
+        self.drained.set()
+        self.frame_bus.unsubscribe(frames.name)
+
+    def wait_drained(self, timeout=None):
+        """소스가 끝난 뒤 자식들이 남은 프레임을 처리할 때까지 (lockstep 이 아니면 마지막 프레임 발행까지)"""
+        return self.drained.wait(timeout)
+
+    # -------------------------------
+    # 결과 수신 → 결과 슬롯
+    # -------------------------------
+    def _receiver(self):
+        live = {conn: name for name, conn in self.conns.items()}
+
+        while live:
+            for conn in wait_connections(list(live), timeout=0.1):
+                name = live[conn]
+                try:
+                    kind, seq, payload = conn.recv()
+                except (EOFError, OSError):
+                    del live[conn]
+                    continue
+
+                if kind == "final":
+                    self.finals[name] = payload
+                    continue
+                if kind == "ready":
+                    startup.ready(name, *payload)  # 자식에서 잰 생성 + warm-up 시간
+                    continue
+                if kind == "ack":
+                    self._ack(name, seq)
+                    continue
+                if kind == "events":
+                    gaze_events.extend(payload)  # gaze 자식이 분할한 구간 이벤트
+                    continue
+
+                ts, captured, result, stages, record = payload
+                started = time.perf_counter()
+
+                # 대시보드용 원본 프레임은 링에 남아 있는 만큼만 (느린 분석기는 늦게 도착할 수 있음)
+                views = self._frames_by_seq.get(seq)
+                if views is not None:
+                    self.result_slots[name].publish(
+                        _legacy_item(name, views.bgr, result),
+                        FrameStamp(seq, ts, captured),
+                    )
+                else:
+                    self.late[name] += 1
+                if record is not None:
+                    result_sink.emit(name, seq, ts, record, captured)
+                stages["publish"] = time.perf_counter() - started
+                latency_tracker.record_stages(name, stages, captured)
+                self._ack(name, seq)
+
+    def _ack(self, name, seq):
+        with self._acks:
+            self._acked[name] = max(self._acked[name], seq)
+            self._acks.notify_all()
+
+    def send(self, name, cmd, arg=None):
+        if name in self.conns:
+            with self._send_lock:
+                self.conns[name].send((cmd, arg))
+
+    def calibrate_gaze(self):
+        self.send("gaze", "calibrate")
+
+    def stop(self, timeout=3.0):
+        self.stop_event.set()
+        with self.new_frame:
+            self.new_frame.notify_all()
+
+        for name, p in self.processes.items():
+            p.join(timeout)
+            if p.is_alive():
+                print(f"⚠️ {name} process did not stop — terminate")
+                p.terminate()
+
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+
+        if self.ring is not None:
+            self.ring.close()
+        late = {name: n for name, n in self.late.items() if n}
+        if late:
+            print(f"🧩 late results (sink only, no dashboard frame): {late}")
+        return self.finals
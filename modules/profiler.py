@@ -0,0 +1,310 @@
+# modules/profiler.py
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+
+
+# =====================================================
+# 🔬 프로파일링 모드 (opt-in: main.py --profile DIR / 환경변수 INTERVIEW_PROFILE=DIR)
+# =====================================================
+# 꺼져 있으면 이 모듈은 import 도 되지 않는다 → 오버헤드 0
+#
+# 켜면 샘플링 스레드 1개가
+#   - interval 마다 sys._current_frames() 로 모든 스레드의 파이썬 스택을 보고
+#     그 사이 스레드가 쓴 CPU 시간(스레드 CPU 시계)만큼 그 스택에 가중치를 준다
+#     → 대기 중인 스레드는 자동으로 0, 스레드마다 "어디서 CPU 를 썼나"
+#   - snapshot_interval 마다 tracemalloc 스냅샷 → 종료 시 첫 구간 대비 증가량
+# 을 모아 종료할 때 스레드별 top-N 핫스팟 / 메모리 증가 리포트를 쓴다.
+#
+# 샘플 순간 대기 함수(threading / queue)에 멈춰 있으면 그 사이 CPU 는 직전 작업 스택에 준다 (대기 직전에 쓴 것).
+# 스레드 CPU 시계가 없는 OS 에서는 벽시계 간격으로 세고, 대기 중인 샘플은 뺀다.
+# MediaPipe 추론 등 네이티브 스레드가 쓴 CPU 는 파이썬 스택이 없어 "(native)" 한 줄로만 나온다.
+# 프로세스 모드(--mode process)의 분석기는 자식 프로세스라 잡히지 않는다 (카메라 / 음성 / 대시보드만).
+
+ENV_VAR = "INTERVIEW_PROFILE"
+
+# "대기 중" 으로 보는 최상단 프레임
+_IDLE_FILES = ("threading.py", "queue.py", "selectors.py")
+
+
+class SamplingProfiler:
+    """
+    profiler = SamplingProfiler(names=flags.lifecycle.threads, main_name="dashboard")
+    profiler.start()
+    ...
+    profiler.stop()
+    profiler.write_reports("profile/")
+
+    names     : () → [(이름, Thread), ...] — 샘플 때마다 스레드 이름을 붙이는 데 씀
+    main_name : 메인 스레드 이름 (대시보드 루프 / 헤드리스 대기)
+    """
+
+    def __init__(self, names=None, main_name="main", interval=0.01, top=20,
+                 snapshot_interval=10.0, trace_frames=1):
+        self.names = names
+        self.main_name = main_name
+        self.interval = interval
+        self.top = top
+        self.snapshot_interval = snapshot_interval
+        self.trace_frames = trace_frames
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._clocks = {}                  # ident → (clock id, 직전 CPU 시간)
+        self._labels = {}                  # ident → 이름 (등록 안 된 스레드는 Thread.name)
+        self._busy_stack = {}              # ident → 마지막으로 일하던 스택 (대기 직전)
+        self.cpu_clock = hasattr(time, "pthread_getcpuclockid")
+
+        # 스레드별 누적 (초): 전체 / 함수 self / 함수 cumulative
+        self.total = defaultdict(float)
+        self.samples = defaultdict(int)
+        self.self_time = defaultdict(lambda: defaultdict(float))
+        self.cum_time = defaultdict(lambda: defaultdict(float))
+
+        self.started = None
+        self.stopped = None
+        self.ticks = 0
+        self.overhead = 0.0                # 샘플링 스레드 자신이 쓴 시간
+        self.process_cpu = 0.0             # 프로세스 전체 CPU (네이티브 스레드 포함)
+        self._process_cpu_start = None
+
+        self._first = None                 # 시작 직후 스냅샷
+        self._baseline = None              # 첫 구간 스냅샷 (모델 로딩 이후 기준)
+        self._last = None
+        self.memory_timeline = []          # (경과 초, 현재 추적 MB, 최대 MB)
+
+    # -------------------------------
+    # 시작 / 정지
+    # -------------------------------
+    def start(self):
+        self.started = time.perf_counter()
+        self._process_cpu_start = time.process_time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+        self._first = self._snapshot()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        print(f"🔬 profiling: {self.interval * 1000:.0f} ms 샘플 "
+              f"({'스레드 CPU 시계' if self.cpu_clock else '벽시계'}), "
+              f"메모리 스냅샷 {self.snapshot_interval:.0f}s 마다")
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._last = self._snapshot()
+        self._record_memory()
+        tracemalloc.stop()
+        self.stopped = time.perf_counter()
+        self.process_cpu = time.process_time() - self._process_cpu_start
+
+    # -------------------------------
+    # 샘플링 스레드
+    # -------------------------------
+    def _run(self):
+        own = threading.get_ident()
+        next_snapshot = time.perf_counter() + self.snapshot_interval
+        last_tick = time.perf_counter()
+
+        while not self._stop.wait(self.interval):
+            t0 = time.perf_counter()
+            wall = t0 - last_tick
+            last_tick = t0
+
+            self._refresh_labels()
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                idle = frame.f_code.co_filename.endswith(_IDLE_FILES)
+                if self.cpu_clock:
+                    weight = self._cpu_delta(ident)
+                else:
+                    weight = 0.0 if idle else wall
+                if idle:
+                    stack = self._busy_stack.get(ident)
+                else:
+                    stack = self._busy_stack[ident] = _stack(frame)
+                if weight:
+                    self._add(self._label(ident), stack or _stack(frame), weight)
+            self.ticks += 1
+
+            if t0 >= next_snapshot:
+                snapshot = self._snapshot()
+                if self._baseline is None:
+                    self._baseline = snapshot
+                else:
+                    self._last = snapshot
+                self._record_memory()
+                next_snapshot = t0 + self.snapshot_interval
+
+            self.overhead += time.perf_counter() - t0
+
+    def _refresh_labels(self):
+        if self.names is not None:
+            for name, t in self.names():
+                if t.ident is not None:
+                    self._labels[t.ident] = name
+        main = threading.main_thread().ident
+        self._labels[main] = self.main_name
+
+    def _label(self, ident):
+        name = self._labels.get(ident)
+        if name is None:
+            # 등록 안 된 스레드 (메트릭 서버 / 기록기 등) → Thread.name
+            for t in threading.enumerate():
+                self._labels.setdefault(t.ident, t.name)
+            name = self._labels.setdefault(ident, f"thread-{ident}")
+        return name
+
+    def _cpu_delta(self, ident):
+        """직전 샘플 이후 이 스레드가 쓴 CPU 시간 (초)"""
+        entry = self._clocks.get(ident)
+        try:
+            if entry is None:
+                clock = time.pthread_getcpuclockid(ident)
+                self._clocks[ident] = (clock, time.clock_gettime(clock))
+                return 0.0
+            clock, previous = entry
+            now = time.clock_gettime(clock)
+        except OSError:
+            self._clocks.pop(ident, None)
+            return 0.0
+        self._clocks[ident] = (clock, now)
+        return max(0.0, now - previous)
+
+    def _add(self, name, stack, weight):
+        self.total[name] += weight
+        self.samples[name] += 1
+        self.self_time[name][stack[0]] += weight
+        cum = self.cum_time[name]
+        for key in set(stack):  # 재귀는 한 번만
+            cum[key] += weight
+
+    # -------------------------------
+    # tracemalloc
+    # -------------------------------
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    def _record_memory(self):
+        current, peak = tracemalloc.get_traced_memory()
+        self.memory_timeline.append((time.perf_counter() - self.started, current / 2**20, peak / 2**20))
+
+    # -------------------------------
+    # 리포트
+    # -------------------------------
+    def hotspots(self):
+        """{스레드: {"cpu_s", "samples", "top": [(self_s, cum_s, 함수), ...]}} — CPU 많이 쓴 스레드 순"""
+        report = {}
+        for name in sorted(self.total, key=self.total.get, reverse=True):
+            selfs = self.self_time[name]
+            cum = self.cum_time[name]
+            top = sorted(selfs, key=selfs.get, reverse=True)[:self.top]
+            report[name] = {
+                "cpu_s": self.total[name],
+                "samples": self.samples[name],
+                "top": [(selfs[k], cum[k], _describe(k)) for k in top],
+                "top_cumulative": [(cum[k], _describe(k)) for k in sorted(cum, key=cum.get, reverse=True)[:self.top]],
+            }
+        return report
+
+    def native_cpu(self):
+        """파이썬 스택이 없는 스레드(네이티브 추론 스레드 등) + 샘플러가 쓴 CPU"""
+        return max(0.0, self.process_cpu - sum(self.total.values()))
+
+    def allocations(self):
+        """첫 구간(없으면 시작) 대비 마지막 스냅샷의 줄별 증가량 top-N → [(증가 bytes, 증가 개수, 위치), ...]"""
+        base = self._baseline or self._first
+        if base is None or self._last is None:
+            return []
+        stats = self._last.compare_to(base, "lineno")
+        stats = sorted(stats, key=lambda s: s.size_diff, reverse=True)[:self.top]
+        return [(s.size_diff, s.count_diff, str(s.traceback[0])) for s in stats if s.size_diff > 0]
+
+    def write_reports(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        elapsed = (self.stopped or time.perf_counter()) - self.started
+        hot = self.hotspots()
+        unit = "스레드 CPU 시간" if self.cpu_clock else "벽시계 (대기 프레임 제외)"
+
+        lines = [
+            f"# 스레드별 핫스팟 — {elapsed:.1f}s, {self.ticks} 샘플 ({self.interval * 1000:.0f} ms, 가중치: {unit})",
+            f"# 샘플러 자체 비용 {self.overhead:.2f}s ({self.overhead / max(elapsed, 1e-9):.1%})",
+            "",
+        ]
+        lines.insert(2, f"# 프로세스 CPU {self.process_cpu:.2f}s = 파이썬 스레드 {sum(self.total.values()):.2f}s "
+                        f"+ (native) {self.native_cpu():.2f}s (MediaPipe 등 네이티브 스레드)")
+        for name, r in hot.items():
+            lines.append(f"[{name}] CPU {r['cpu_s']:.2f}s ({r['cpu_s'] / max(elapsed, 1e-9):.1%} of wall), "
+                         f"{r['samples']} samples")
+            lines.append(f"   {'self s':>8} {'cum s':>8}  function")
+            for self_s, cum_s, where in r["top"]:
+                lines.append(f"   {self_s:8.3f} {cum_s:8.3f}  {where}")
+            lines.append("   -- cumulative --")
+            for cum_s, where in r["top_cumulative"]:
+                lines.append(f"   {'':8} {cum_s:8.3f}  {where}")
+            lines.append("")
+        hotspot_path = os.path.join(directory, "hotspots.txt")
+        with open(hotspot_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+
+        base = "첫 구간" if self._baseline is not None else "시작"
+        lines = [f"# 메모리 증가 ({base} 스냅샷 대비 종료 시점, 줄 단위 top {self.top})", ""]
+        for size, count, where in self.allocations():
+            lines.append(f"   {size / 1024:10.1f} KiB  {count:+8d} blocks  {where}")
+        lines += ["", "# 추적 메모리 (경과 s, 현재 MB, 최대 MB)"]
+        for t, current, peak in self.memory_timeline:
+            lines.append(f"   {t:8.1f} {current:9.2f} {peak:9.2f}")
+        alloc_path = os.path.join(directory, "allocations.txt")
+        with open(alloc_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return hotspot_path, alloc_path
+
+
+def _stack(frame):
+    """최상단부터 (파일, 첫 줄, 함수) 목록"""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+        frame = frame.f_back
+    return stack
+
+
+def _describe(key):
+    filename, lineno, name = key
+    return f"{name} ({_short(filename)}:{lineno})"
+
+
+def _short(filename):
+    cwd = os.getcwd()
+    if filename.startswith(cwd):
+        return os.path.relpath(filename, cwd)
+    parts = filename.replace("\\", "/").split("/")
+    return "/".join(parts[-2:])
+
+
+def print_profile_summary(profiler, paths):
+    """종료 시 콘솔 요약: 스레드별 CPU + 1순위 핫스팟, 메모리 증가 1순위"""
+    print("🔬 [Profile]")
+    for name, r in profiler.hotspots().items():
+        first = r["top"][0][2] if r["top"] else "-"
+        print(f"   {name:<12} CPU {r['cpu_s']:7.2f}s | top: {first}")
+    if profiler.cpu_clock:
+        print(f"   {'(native)':<12} CPU {profiler.native_cpu():7.2f}s | 파이썬 스택 없는 스레드 (MediaPipe 추론 등)")
+    growth = profiler.allocations()
+    if growth:
+        size, _, where = growth[0]
+        print(f"   memory growth top: {size / 1024:.1f} KiB @ {where}")
+    for path in paths:
+        print(f"   → {path}")
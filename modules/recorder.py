@@ -0,0 +1,403 @@
+# modules/recorder.py
+"""
+세션 기록기 — 프레임별 분석 결과를 열(column) 단위 바이너리로 저장
+
+  기록 : RecorderSink 를 result sink 로 걸면 (main.py --record DIR / Session(sink=...))
+         분석 스레드는 record dict 를 deque 에 넣기만 하고 (복사 / 변환 / 파일 IO 없음)
+         백그라운드 writer 스레드가 flush_interval 마다 행으로 바꿔 모으고,
+         스트림별로 chunk_rows 개가 찼을 때(또는 마감 때)만 열 파일 끝에 덧붙인다.
+  읽기 : SessionRecording(DIR) 은 열 파일을 np.memmap 으로 연다
+         → 1시간 분량도 전체를 읽지 않고 시간 구간만 잘라 볼 수 있다.
+
+디렉터리 구조
+  manifest.json              : 스트림별 열 정의 / 확정된 행 수 / 종료 리포트 (크기가 기록 길이와 무관)
+  <stream>.<column>.bin      : 숫자 열 (행 × 모양, 리틀 엔디언), append-only
+  <stream>.<column>.bin/.idx : 문자열 열 = UTF-8 바이트 + 행별 끝 오프셋(int64)
+  gaze_events.*              : 시선 구간 이벤트도 같은 열 스트림 (kind / direction / duration)
+
+manifest 는 chunk 를 다 쓴 뒤, 주기마다 최대 한 번 갱신하므로 중간에 죽어도 manifest 의 행 수까지는 항상 온전하다.
+(잃는 양은 스트림별로 덜 찬 chunk 1개 + 마지막 주기분)
+이미 기록이 있는 DIR 에 다시 기록하면 이전 기록은 지워진다 (열 파일을 새로 씀).
+시각(ts)은 float64, 측정값은 float32 (또는 float16) 로 저장.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from modules.result_sink import ResultSink
+
+EMOTIONS = ("anger", "disgust", "fear", "happiness", "sadness", "surprise", "neutral")
+GAZE_X = {"Left": -1.0, "Center": 0.0, "Right": 1.0}
+GAZE_Y = {"Down": -1.0, "Center": 0.0, "Up": 1.0}
+GAZE_METRICS = (
+    "ear", "ema_x", "ema_y", "blinking", "dir_x", "dir_y",
+    "center_ratio", "center_time", "total_time", "off_center_time",
+    "deviation_count", "avg_deviation_time", "final_gaze_score",
+    # 재채점(modules.rescore)용 원시값
+    "face", "metric_x", "metric_y", "calib_x", "calib_y", "blink_threshold", "measuring", "resets",
+)
+GAZE_FLAGS = ("face", "measuring")
+
+# 스트림별 열: (이름, 종류, 행 모양). 종류 i=int64, t=float64 시각, f=측정값(float32/16), s=문자열
+SCHEMAS = {
+    "pose": [("seq", "i", ()), ("ts", "t", ()), ("motion", "f", ()), ("coords", "f", (33, 3))],
+    "gaze": [("seq", "i", ()), ("ts", "t", ())] + [(name, "f", ()) for name in GAZE_METRICS],
+    "hands": [("seq", "i", ()), ("ts", "t", ()), ("hands", "f", (2, 21, 3))],
+    "expression": [("seq", "i", ()), ("ts", "t", ()), ("raw", "f", (len(EMOTIONS),)),
+                   ("smooth", "f", (len(EMOTIONS),))],
+    "voice": [("ts", "t", ()), ("text", "s", ())],
+    "gaze_events": [("seq", "i", ()), ("ts", "t", ()), ("kind", "s", ()), ("direction", "s", ()),
+                    ("duration", "t", ())],
+}
+
+
+# =====================================================
+# 🔄 분석 결과 record → 행 (writer 스레드에서만 호출)
+# =====================================================
+def _nan(shape):
+    return np.full(shape, np.nan, dtype=np.float64)
+
+
+def _pose_row(r):
+    coords = r.get("coords")
+    return {"motion": r.get("motion") or 0.0,
+            "coords": _nan((33, 3)) if coords is None else np.asarray(coords)}
+
+
+def _gaze_row(r):
+    return {
+        "ear": r.get("ear", np.nan),
+        "ema_x": r.get("ema_x", np.nan),
+        "ema_y": r.get("ema_y", np.nan),
+        "blinking": float(bool(r.get("is_blinking"))),
+        "dir_x": GAZE_X.get(r.get("left_right"), np.nan),
+        "dir_y": GAZE_Y.get(r.get("up_down"), np.nan),
+        **{name: r.get(name, np.nan) for name in GAZE_METRICS[6:] if name not in GAZE_FLAGS},
+        **{name: float(bool(r.get(name))) for name in GAZE_FLAGS},
+    }
+
+
+def _hands_row(r):
+    hands = _nan((2, 21, 3))
+    for i, hand in enumerate((r.get("hands") or [])[:2]):
+        hands[i] = hand
+    return {"hands": hands}
+
+
+def _emotion_vector(values):
+    if not values:
+        return _nan(len(EMOTIONS))
+    return np.array([values.get(name, np.nan) for name in EMOTIONS], dtype=np.float64)
+
+
+def _expression_row(r):
+    emo = r.get("emotion") or {}
+    return {"raw": _emotion_vector(emo.get("raw")), "smooth": _emotion_vector(emo.get("smooth"))}
+
+
+def _voice_row(r):
+    return {"text": r.get("text") or ""}
+
+
+def _event_row(r):
+    duration = r.get("duration")
+    return {"kind": r["kind"], "direction": r.get("direction") or "",
+            "duration": np.nan if duration is None else duration}
+
+
+ROWS = {
+    "pose": _pose_row,
+    "gaze": _gaze_row,
+    "hands": _hands_row,
+    "expression": _expression_row,
+    "voice": _voice_row,
+    "gaze_events": _event_row,
+}
+
+
+# =====================================================
+# 📝 열 파일 1개 (append-only)
+# =====================================================
+class _Column:
+    def __init__(self, directory, stream, name, kind, shape, value_dtype):
+        self.name = name
+        self.kind = kind
+        self.shape = shape
+        self.dtype = {"i": np.dtype("<i8"), "t": np.dtype("<f8"), "f": value_dtype, "s": np.dtype("u1")}[kind]
+        self.file = f"{stream}.{name}.bin"
+        # 같은 DIR 에 다시 기록하면 새로 씀 (manifest 가 rows=0 부터 시작하므로 이전 실행 행을 남기면 안 됨)
+        self._data = open(os.path.join(directory, self.file), "wb")
+        self._index = open(os.path.join(directory, self.file + ".idx"), "wb") if kind == "s" else None
+        self._offset = 0
+        self.buffer = []
+
+    def spec(self):
+        return {"kind": self.kind, "dtype": self.dtype.str, "shape": list(self.shape), "file": self.file}
+
+    def write(self):
+        """버퍼에 모인 행을 한 번에 덧붙임"""
+        if self.kind == "s":
+            ends = []
+            for text in self.buffer:
+                raw = text.encode("utf-8")
+                self._data.write(raw)
+                self._offset += len(raw)
+                ends.append(self._offset)
+            self._index.write(np.asarray(ends, dtype="<i8").tobytes())
+        else:
+            block = np.asarray(self.buffer, dtype=np.float64 if self.kind != "i" else np.int64)
+            self._data.write(block.reshape((len(self.buffer),) + self.shape).astype(self.dtype).tobytes())
+        self.buffer = []
+
+    def flush(self):
+        self._data.flush()
+        if self._index is not None:
+            self._index.flush()
+
+    def close(self):
+        self._data.close()
+        if self._index is not None:
+            self._index.close()
+
+
+# =====================================================
+# 🎥 기록기 (ResultSink)
+# =====================================================
+class RecorderSink(ResultSink):
+    def __init__(self, directory, precision="float32", chunk_rows=256, flush_interval=1.0):
+        """
+        precision      : 측정값 저장 형식 "float32" | "float16" (시각은 항상 float64)
+        chunk_rows     : 스트림별로 이만큼 모이면 파일에 씀 (덜 찬 chunk 는 마감 때)
+        flush_interval : 이 간격(초)마다 쌓인 record 를 행으로 변환 + (바뀌었으면) manifest 갱신
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.flush_interval = flush_interval
+        self.value_dtype = np.dtype(precision).newbyteorder("<")
+
+        self._pending = deque()          # 분석 스레드 → writer (append / popleft 는 스레드 안전)
+        self._wake = threading.Event()
+        self._closed = False
+        self._streams = {}
+        self._manifest = {
+            "version": 2,
+            "precision": self.value_dtype.name,
+            "created": time.time(),
+            "chunk_rows": chunk_rows,
+            "streams": {},
+            "reports": {},
+        }
+        self._dirty = False              # 마지막 저장 이후 manifest 가 바뀜
+        self.dropped = 0                 # 알 수 없는 스트림 / 변환 실패
+        self._save_manifest()            # 이전 기록의 manifest 를 바로 덮어씀 (아직 쓰지 않은 스트림은 빈 것으로)
+        self._thread = threading.Thread(target=self._writer, name="recorder", daemon=True)
+        self._thread.start()
+
+    # -------------------------------
+    # 분석 스레드 쪽 (대기 / 변환 없음)
+    # -------------------------------
+    def write(self, record):
+        if self._closed:
+            return
+        self._pending.append(record)
+        if len(self._pending) >= self.chunk_rows:
+            self._wake.set()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+
+    # -------------------------------
+    # writer 스레드
+    # -------------------------------
+    def _writer(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            closing = self._closed
+
+            self._drain()
+            if closing:
+                self._write_chunks()   # 덜 찬 chunk 는 마감 때만
+            if self._dirty:
+                self._save_manifest()
+
+            if closing:
+                for stream in self._streams.values():
+                    for column in stream["columns"]:
+                        column.close()
+                return
+
+    def _drain(self):
+        while self._pending:
+            record = self._pending.popleft()
+            if record.get("type") == "report":
+                report = {k: v for k, v in record.items() if k not in ("type", "analyzer")}
+                self._manifest["reports"][record.get("analyzer")] = json.loads(
+                    json.dumps(report, default=_to_json)
+                )
+                self._dirty = True
+                continue
+
+            name = record.get("analyzer")
+            if record.get("type") == "event":
+                name = f"{name}_events"
+            row_fn = ROWS.get(name)
+            if row_fn is None:
+                self.dropped += 1
+                continue
+            try:
+                row = row_fn(record)
+            except Exception:
+                self.dropped += 1
+                continue
+
+            stream = self._stream(name)
+            row["seq"] = -1 if record.get("seq") is None else record["seq"]
+            row["ts"] = record.get("ts") if record.get("ts") is not None else np.nan
+            for column in stream["columns"]:
+                column.buffer.append(row[column.name])
+            stream["buffered"] += 1
+            if stream["buffered"] >= self.chunk_rows:
+                self._write_stream(name, stream)
+
+    def _stream(self, name):
+        stream = self._streams.get(name)
+        if stream is None:
+            columns = [_Column(self.directory, name, col, kind, shape, self.value_dtype)
+                       for col, kind, shape in SCHEMAS[name]]
+            stream = self._streams[name] = {"columns": columns, "buffered": 0}
+            self._manifest["streams"][name] = {
+                "rows": 0,
+                "columns": {c.name: c.spec() for c in columns},
+            }
+        return stream
+
+    def _write_chunks(self):
+        for name, stream in self._streams.items():
+            if stream["buffered"]:
+                self._write_stream(name, stream)
+
+    def _write_stream(self, name, stream):
+        for column in stream["columns"]:
+            column.write()
+            column.flush()
+
+        self._manifest["streams"][name]["rows"] += stream["buffered"]
+        stream["buffered"] = 0
+        self._dirty = True
+
+    def _save_manifest(self):
+        path = os.path.join(self.directory, "manifest.json")
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, ensure_ascii=False, default=_to_json)
+        os.replace(tmp, path)
+        self._dirty = False
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+# =====================================================
+# 📖 읽기 (memmap)
+# =====================================================
+class SessionRecording:
+    """
+    rec = SessionRecording("records/interview1")
+    gaze = rec.stream("gaze")                # {열: memmap} — 아직 디스크에서 읽지 않음
+    part = rec.slice("pose", 600.0, 660.0)   # ts 로 구간 자르기 (필요한 페이지만 읽힘)
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+    @property
+    def streams(self):
+        return list(self.manifest["streams"])
+
+    @property
+    def reports(self):
+        return self.manifest.get("reports", {})
+
+    @property
+    def events(self):
+        """시선 구간 이벤트 [{kind, direction, seq, ts, duration}] (gaze_events 스트림을 dict 로)"""
+        if "gaze_events" not in self.manifest["streams"]:
+            return []
+        columns = self.stream("gaze_events")
+        return [
+            {"kind": kind, "direction": direction or None, "seq": int(seq), "ts": float(ts),
+             "duration": None if np.isnan(duration) else float(duration)}
+            for kind, direction, seq, ts, duration in zip(
+                columns["kind"][:], columns["direction"][:], columns["seq"], columns["ts"], columns["duration"])
+        ]
+
+    def rows(self, stream):
+        return self.manifest["streams"][stream]["rows"]
+
+    def column(self, stream, name):
+        meta = self.manifest["streams"][stream]
+        spec = meta["columns"][name]
+        rows = meta["rows"]
+        path = os.path.join(self.directory, spec["file"])
+
+        if spec["kind"] == "s":
+            return _TextColumn(path, rows)
+
+        shape = (rows,) + tuple(spec["shape"])
+        if rows == 0:
+            return np.empty(shape, dtype=spec["dtype"])
+        return np.memmap(path, dtype=spec["dtype"], mode="r", shape=shape)
+
+    def stream(self, stream):
+        return {name: self.column(stream, name) for name in self.manifest["streams"][stream]["columns"]}
+
+    def slice(self, stream, t0=None, t1=None):
+        """t0 <= ts < t1 인 행만 (숫자 열은 memmap 뷰)"""
+        ts = self.column(stream, "ts")
+        start = 0 if t0 is None else int(np.searchsorted(ts, t0, side="left"))
+        stop = len(ts) if t1 is None else int(np.searchsorted(ts, t1, side="left"))
+        return {name: col[start:stop] for name, col in self.stream(stream).items()}
+
+
+class _TextColumn:
+    """UTF-8 바이트 + 행별 끝 오프셋 → 인덱싱 / 슬라이싱할 때만 디코딩"""
+
+    def __init__(self, path, rows):
+        self._rows = rows
+        self._data = np.memmap(path, dtype="u1", mode="r") if rows else np.empty(0, np.uint8)
+        self._ends = (np.memmap(path + ".idx", dtype="<i8", mode="r", shape=(rows,))
+                      if rows else np.empty(0, np.int64))
+
+    def __len__(self):
+        return self._rows
+
+    def _text(self, i):
+        start = int(self._ends[i - 1]) if i > 0 else 0
+        return bytes(self._data[start:int(self._ends[i])]).decode("utf-8")
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._text(i) for i in range(*key.indices(self._rows))]
+        if key < 0:
+            key += self._rows
+        return self._text(key)
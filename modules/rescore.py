@@ -0,0 +1,385 @@
+# modules/rescore.py
+"""
+오프라인 재채점 — 기록된 세션(modules.recorder)으로 임계값만 바꿔 점수를 다시 계산
+
+카메라 / 비전 모델을 다시 돌리지 않고, 저장된 프레임별 원시값
+(시선 metric · 보정 기준값 · EAR · 얼굴 검출 여부 · 자세 좌표)에서
+EMA → 깜빡임 판정 → 방향 판정 → 이탈 구간 → 최종 점수를 세션 전체에 대해 NumPy 로 한 번에 계산한다.
+(프레임 단위 파이썬 루프 없음 → 1시간 분량도 수 ms ~ 수십 ms, 임계값 sweep 이 싸다)
+
+기본값으로 돌리면 GazeTracker + GazeSession 의 온라인 결과와 같다.
+(단, 보정 직후 첫 프레임의 dt 는 0 으로 본다 — 온라인도 동영상 소스에서는 0, 카메라에서는 최대 1프레임 차이)
+
+실행:
+  python -m modules.rescore records/interview1
+  python -m modules.rescore records/interview1 --set threshold_x=0.04 --set ema_alpha=0.2
+  python -m modules.rescore records/interview1 --sweep threshold_x=0.02:0.06:0.005
+
+시선 재채점은 프레임별 시선 기록을 쓴다 (--record 는 --gaze-frames 없이도 항상 기록).
+"""
+
+import argparse
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from modules.gaze.gaze_session import generate_gaze_feedback
+from modules.recorder import SessionRecording
+
+# GazeTracker / GazeSession / 점수 함수의 손으로 맞춘 값들
+GAZE_PARAMS = {
+    "ema_alpha": 0.25,          # GazeTracker.EMA_ALPHA
+    "threshold_x": 0.03,        # GazeTracker.GAZE_THRESHOLD_X
+    "threshold_y": 0.015,       # GazeTracker.GAZE_THRESHOLD_Y
+    "blink_threshold": None,    # 보정 전 깜빡임 임계값 (None: 기록된 값 그대로, 온라인 기본 0.18)
+    "blink_ratio": None,        # 보정 시 임계값 = 그때 EAR × 비율 (None: 기록된 값 그대로, 온라인 0.6)
+    "min_deviation": 0.05,      # 이 길이(초) 미만 이탈은 버림
+    "max_deviation": 10.0,      # 이 길이(초) 초과 이탈은 버림
+    "center_low": 30.0,         # score_center_ratio: 이 비율(%) 이하 0점
+    "center_high": 80.0,        #                     이 비율(%) 이상 100점
+    "deviation_good": 1.0,      # score_avg_deviation_time: 이 시간(초) 이하 100점
+    "deviation_bad": 3.0,       #                           이 시간(초) 이상 0점
+    "center_weight": 0.6,       # 최종 점수 = 정면 × w + 이탈 × (1 - w)
+}
+
+POSE_PARAMS = {
+    "motion_threshold": 20.0,   # PoseAnalyzer.motion_threshold
+}
+
+GAZE_COLUMNS = ("ts", "face", "ear", "metric_x", "metric_y", "calib_x", "calib_y",
+                "blink_threshold", "measuring", "resets")
+
+NO_GAZE_FRAMES = "프레임별 시선 기록이 없습니다 (프레임 기록 없이 만든 이전 기록 — main.py --record DIR 로 다시 기록)"
+
+
+# =====================================================
+# 📥 기록 → 배열 (memmap 에서 한 번만 읽어 float64 로)
+# =====================================================
+def _recording(recording):
+    return recording if isinstance(recording, SessionRecording) else SessionRecording(recording)
+
+
+def load_gaze(recording):
+    rec = _recording(recording)
+    if "gaze" not in rec.streams:
+        raise ValueError(NO_GAZE_FRAMES)
+    columns = rec.stream("gaze")
+    series = {name: np.asarray(columns[name], dtype=np.float64) for name in GAZE_COLUMNS}
+    if len(series["ts"]) and np.isnan(series["metric_x"]).all():
+        raise ValueError("재채점용 원시값이 없는 기록입니다 (metric_x 없음)")
+    return series
+
+
+def load_pose(recording):
+    rec = _recording(recording)
+    columns = rec.stream("pose")
+    return {"ts": np.asarray(columns["ts"], dtype=np.float64),
+            "coords": np.asarray(columns["coords"], dtype=np.float64)}
+
+
+# =====================================================
+# 🧮 벡터 연산 도우미
+# =====================================================
+def _hold_index(mask):
+    """각 프레임에서 mask 가 True 였던 마지막 위치 (없으면 -1) → 직전 값 유지"""
+    idx = np.where(mask, np.arange(len(mask)), -1)
+    return np.maximum.accumulate(idx) if len(idx) else idx
+
+
+@lru_cache(maxsize=16)
+def _ema_kernel(alpha, block):
+    """감쇠 행렬 (sweep / 보정 구간마다 다시 만들지 않게 캐시)"""
+    decay = 1.0 - alpha
+    k = np.arange(block)
+    lag = k[:, None] - k[None, :]
+    weights = np.where(lag >= 0, alpha * decay ** np.maximum(lag, 0), 0.0)
+    return weights.T.copy(), decay ** (k + 1)
+
+
+def ema(x, alpha, block=256):
+    """
+    y[0] = x[0], y[k] = (1 - a) y[k-1] + a x[k]
+    block 개씩 (하삼각 감쇠 행렬 × 입력) 으로 계산하고 블록 사이 carry 만 이어 붙임
+    """
+    n = len(x)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    weights, carry_gain = _ema_kernel(float(alpha), block)
+
+    blocks = -(-n // block)
+    padded = np.zeros(blocks * block)
+    padded[:n] = x
+    local = padded.reshape(blocks, block) @ weights
+
+    carry = x[0]  # (1 - a) x0 + a x0 = x0 → 첫 값에서 시작
+    flat = local.reshape(-1)
+    for b in range(blocks):
+        seg = flat[b * block:(b + 1) * block]
+        seg += carry_gain * carry
+        carry = seg[-1]
+    out[:] = flat[:n]
+    return out
+
+
+def score_center_ratio(center_ratio, low=30.0, high=80.0):
+    """gaze_session.score_center_ratio 의 배열 버전 (구간 경계도 인자로)"""
+    r = np.asarray(center_ratio, dtype=np.float64)
+    score = np.round((r - low) / (high - low) * 100)
+    return np.where(r <= low, 0, np.where(r >= high, 100, score)).astype(int)
+
+
+def score_avg_deviation_time(avg_deviation_time, good=1.0, bad=3.0):
+    """gaze_session.score_avg_deviation_time 의 배열 버전"""
+    t = np.asarray(avg_deviation_time, dtype=np.float64)
+    score = np.round((bad - t) / (bad - good) * 100)
+    return np.where(t <= good, 100, np.where(t >= bad, 0, score)).astype(int)
+
+
+# =====================================================
+# 👁 시선 재채점
+# =====================================================
+def gaze_frames(series, **params):
+    """프레임별 깜빡임 / EMA / 방향 (GazeTracker.update_from_landmarks 를 세션 전체에 한 번에)"""
+    p = {**GAZE_PARAMS, **params}
+    n = len(series["ts"])
+    face = series["face"] > 0.5
+    ear = series["ear"]
+    epoch = np.nan_to_num(series["resets"]).astype(np.int64)
+
+    # --- 깜빡임 임계값 (보정마다 그때 EAR × 비율) ---
+    if p["blink_threshold"] is None and p["blink_ratio"] is None:
+        threshold = series["blink_threshold"]
+    else:
+        initial = 0.18 if p["blink_threshold"] is None else p["blink_threshold"]
+        ratio = 0.6 if p["blink_ratio"] is None else p["blink_ratio"]
+        starts = np.flatnonzero(np.diff(epoch)) + 1
+        # 보정 순간의 EAR = 직전 구간 마지막 프레임 EAR (0.1 이하면 임계값 유지)
+        calib_ear = ear[starts - 1]
+        per_epoch = np.full(len(starts) + 1, np.nan)
+        per_epoch[0] = initial
+        per_epoch[1:] = np.where(calib_ear > 0.1, calib_ear * ratio, np.nan)
+        per_epoch = per_epoch[_hold_index(~np.isnan(per_epoch))]
+        threshold = np.repeat(per_epoch, np.diff(np.concatenate(([0], starts, [n]))))
+
+    # --- 깜빡임: 얼굴을 찾은 프레임에서만 갱신, 못 찾으면 직전 상태 유지 ---
+    last_face = _hold_index(face)
+    blink_now = ear < threshold
+    blinking = np.where(last_face >= 0, blink_now[np.maximum(last_face, 0)], False)
+
+    # --- EMA: 눈 뜬 얼굴 프레임에서만, 보정마다 새로 시작 ---
+    update = face & (ear >= threshold)
+    idx = np.flatnonzero(update)
+    diff_x = series["metric_x"][idx] - series["calib_x"][idx]
+    diff_y = series["metric_y"][idx] - series["calib_y"][idx]
+    ema_x = np.empty(len(idx))
+    ema_y = np.empty(len(idx))
+    bounds = np.flatnonzero(np.diff(epoch[idx])) + 1
+    for lo, hi in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [len(idx)]))):
+        ema_x[lo:hi] = ema(diff_x[lo:hi], p["ema_alpha"])
+        ema_y[lo:hi] = ema(diff_y[lo:hi], p["ema_alpha"])
+
+    # --- 방향: 갱신 프레임에서 판정, 나머지는 직전 판정 유지 (처음엔 Center) ---
+    last = _hold_index(update)
+    seen = last >= 0
+    last = np.maximum(last, 0)
+
+    def held(values):
+        full = np.zeros(n, dtype=values.dtype)
+        full[idx] = values
+        return np.where(seen, full[last], 0)
+
+    return {
+        "blinking": blinking,
+        "ema_x": held(ema_x),
+        "ema_y": held(ema_y),
+        "dir_x": held(np.where(ema_x > p["threshold_x"], 1, np.where(ema_x < -p["threshold_x"], -1, 0))),
+        "dir_y": held(np.where(ema_y < -p["threshold_y"], 1, np.where(ema_y > p["threshold_y"], -1, 0))),
+        "epoch": epoch,
+    }
+
+
+def rescore_gaze(series, **params):
+    """마지막 보정 이후 구간의 최종 리포트 (GazeSession.finish() 와 같은 키)"""
+    p = {**GAZE_PARAMS, **params}
+    frames = gaze_frames(series, **p)
+
+    # finish() 는 마지막 reset() 이후 누적값만 본다
+    epoch = frames["epoch"]
+    start = int(np.searchsorted(epoch, epoch[-1])) if len(epoch) else 0
+    ts = series["ts"][start:]
+    blinking = frames["blinking"][start:]
+    dir_x = frames["dir_x"][start:]
+    dir_y = frames["dir_y"][start:]
+    measuring = series["measuring"][start:] > 0.5
+
+    # --- GazeSession.update: dt 누적 (첫 프레임 / 이상값은 0) ---
+    dt = np.diff(ts, prepend=ts[:1]) if len(ts) else ts
+    dt = np.where((dt <= 0) | (dt > 1.0), 0.0, dt)
+    measured = measuring & (dt > 0) & ~blinking
+    center = (dir_x == 0) & (dir_y == 0)
+    off = measured & ~center
+    x_off = dir_x != 0
+    y_off = dir_y != 0
+
+    total_time = float(dt[measured].sum())
+    center_time = float(dt[measured & center].sum())
+    off_center_time = float(dt[off].sum())
+    left_time = float(dt[off & (dir_x < 0)].sum())
+    right_time = float(dt[off & (dir_x > 0)].sum())
+    up_time = float(dt[off & (dir_y > 0)].sum())
+    down_time = float(dt[off & (dir_y < 0)].sum())
+
+    # --- 이탈 구간: 측정 프레임만 놓고 정면 → 이탈 시작, 이탈 → 정면 끝 (끝나지 않았으면 마지막 프레임) ---
+    t = ts[measured]
+    outside = ~center[measured]
+    prev = np.concatenate(([False], outside[:-1]))
+    began = t[outside & ~prev]
+    ended = t[~outside & prev]
+    if len(ended) < len(began):
+        ended = np.append(ended, ts[-1])
+    durations = ended - began
+    durations = durations[(durations >= p["min_deviation"]) & (durations <= p["max_deviation"])]
+
+    avg_deviation_time = float(durations.mean()) if len(durations) else 0.0
+    max_deviation_time = float(durations.max()) if len(durations) else 0.0
+    center_ratio = center_time / total_time * 100.0 if total_time > 0 else 0.0
+    center_score = int(score_center_ratio(center_ratio, p["center_low"], p["center_high"]))
+    avg_deviation_score = int(score_avg_deviation_time(avg_deviation_time, p["deviation_good"], p["deviation_bad"]))
+    final_gaze_score = int(round(center_score * p["center_weight"] + avg_deviation_score * (1 - p["center_weight"])))
+
+    return {
+        "final_gaze_score": final_gaze_score,
+        "center_score": center_score,
+        "center_ratio": center_ratio,
+        "center_time": center_time,
+        "total_time": total_time,
+        "avg_deviation_score": avg_deviation_score,
+        "avg_deviation_time": avg_deviation_time,
+        "deviation_count": len(durations),
+        "max_deviation_time": max_deviation_time,
+        "off_center_time": off_center_time,
+        "left_time": left_time,
+        "right_time": right_time,
+        "up_time": up_time,
+        "down_time": down_time,
+        "feedback": generate_gaze_feedback(
+            final_gaze_score, center_ratio, avg_deviation_time,
+            left_time, right_time, up_time, down_time, off_center_time,
+        ),
+    }
+
+
+# =====================================================
+# 🧍 자세 재채점
+# =====================================================
+def rescore_pose(series, **params):
+    """안정화된 좌표로 움직임량을 다시 계산 → motion_threshold 초과 비율 / 횟수"""
+    p = {**POSE_PARAMS, **params}
+    coords = series["coords"]
+    valid = ~np.isnan(coords).any(axis=(1, 2))
+    c = coords[valid]
+    # PoseAnalyzer.calc_motion: 자세를 찾은 직전 프레임과의 거리 (첫 프레임 0)
+    motion = np.zeros(len(c))
+    if len(c) > 1:
+        motion[1:] = np.linalg.norm((c[1:] - c[:-1]).reshape(len(c) - 1, -1), axis=1)
+    moving = motion > p["motion_threshold"]
+    rising = moving & ~np.concatenate(([False], moving[:-1]))
+    return {
+        "frames": int(len(c)),
+        "moving_ratio": float(moving.mean() * 100.0) if len(c) else 0.0,
+        "moving_count": int(rising.sum()),
+        "avg_motion": float(motion.mean()) if len(c) else 0.0,
+        "max_motion": float(motion.max()) if len(c) else 0.0,
+    }
+
+
+# =====================================================
+# 🔁 묶음 / sweep
+# =====================================================
+RESCORERS = {
+    "gaze": (load_gaze, rescore_gaze, GAZE_PARAMS),
+    "pose": (load_pose, rescore_pose, POSE_PARAMS),
+}
+
+
+def rescore(recording, **params):
+    """기록 1개 → {"gaze": 리포트, "pose": 리포트} (각자 자기 파라미터만 받음)"""
+    rec = _recording(recording)
+    reports = {}
+    for name, (load, score, defaults) in RESCORERS.items():
+        if name in rec.streams and rec.rows(name):
+            own = {k: v for k, v in params.items() if k in defaults}
+            reports[name] = score(load(rec), **own)
+    return reports
+
+
+def sweep(recording, name, values, **params):
+    """파라미터 1개를 values 로 바꿔 가며 재채점 (원시값은 한 번만 읽음) → [(값, 리포트), ...]"""
+    rec = _recording(recording)
+    analyzer = next(a for a, (_, _, defaults) in RESCORERS.items() if name in defaults)
+    load, score, _ = RESCORERS[analyzer]
+    series = load(rec)
+    return [(value, score(series, **{**params, name: value})) for value in values]
+
+
+def _parse_value(text):
+    return None if text.lower() == "none" else float(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기록된 세션을 비전 모델 없이 다시 채점")
+    parser.add_argument("record", help="modules.recorder 기록 디렉터리 (main.py --record)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="파라미터 덮어쓰기 (예: --set threshold_x=0.04 --set motion_threshold=15)")
+    parser.add_argument("--sweep", default=None, metavar="NAME=START:STOP:STEP",
+                        help="파라미터 1개 범위 sweep (예: threshold_x=0.02:0.06:0.005)")
+    args = parser.parse_args(argv)
+
+    known = {**GAZE_PARAMS, **POSE_PARAMS}
+    params = {}
+    for item in args.set:
+        name, value = item.split("=", 1)
+        if name not in known:
+            parser.error(f"알 수 없는 파라미터: {name} ({', '.join(known)})")
+        params[name] = _parse_value(value)
+
+    rec = SessionRecording(args.record)
+    started = time.perf_counter()
+
+    if args.sweep:
+        name, spec = args.sweep.split("=", 1)
+        if name not in known:
+            parser.error(f"알 수 없는 파라미터: {name} ({', '.join(known)})")
+        lo, hi, step = (float(v) for v in spec.split(":"))
+        values = np.round(np.arange(lo, hi + step / 2, step), 10)
+        results = sweep(rec, name, values, **params)
+        elapsed = time.perf_counter() - started
+        print(f"🔁 sweep {name} ({len(values)}개, {elapsed * 1000:.1f} ms)")
+        for value, report in results:
+            if "final_gaze_score" in report:
+                print(f"   {name}={value:<8g} 점수 {report['final_gaze_score']:3d} | 정면 {report['center_ratio']:5.1f}% "
+                      f"| 이탈 {report['deviation_count']:3d}회 평균 {report['avg_deviation_time']:.2f}s")
+            else:
+                print(f"   {name}={value:<8g} 움직임 {report['moving_ratio']:5.1f}% ({report['moving_count']}회)")
+        return
+
+    reports = rescore(rec, **params)
+    elapsed = time.perf_counter() - started
+    print(f"🧮 재채점 ({elapsed * 1000:.1f} ms)")
+    gaze = reports.get("gaze")
+    if gaze is not None:
+        print(f"[GAZE] 최종 {gaze['final_gaze_score']}점 | 정면 {gaze['center_score']}점 ({gaze['center_ratio']:.1f}%) "
+              f"| 이탈 {gaze['avg_deviation_score']}점 ({gaze['deviation_count']}회, 평균 {gaze['avg_deviation_time']:.2f}s)")
+        print(gaze["feedback"])
+    elif "gaze" not in rec.streams:
+        print(f"[GAZE] {NO_GAZE_FRAMES}")
+    pose = reports.get("pose")
+    if pose is not None:
+        print(f"[POSE] 움직임 {pose['moving_ratio']:.1f}% ({pose['moving_count']}회) "
+              f"| 평균 {pose['avg_motion']:.3f} 최대 {pose['max_motion']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
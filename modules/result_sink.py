@@ -0,0 +1,167 @@
+# modules/result_sink.py
+
+import json
+import threading
+import time
+
+import numpy as np
+
+
+# =====================================================
+# 📤 분석 결과 내보내기 (헤드리스 모드: 창 대신 JSONL / 콜백)
+# =====================================================
+class ResultSink:
+    """
+    분석기가 프레임마다 결과를 넘기는 곳.
+    record = {"type": "result", "analyzer": 이름, "seq": 프레임 번호, "ts": 프레임 시각,
+              "latency_ms": 캡처 → 결과까지, ...결과}
+    세션 종료 리포트는 {"type": "report", "analyzer": 이름, ...}
+    구간 이벤트 (시선 정면 / 이탈 / 깜빡임) 는 {"type": "event", "analyzer": 이름, "kind": ..., ...}
+    """
+
+    def write(self, record):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class JsonlSink(ResultSink):
+    """한 줄에 record 1개 (여러 분석 스레드에서 동시에 호출됨)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=_to_json)
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class CallbackSink(ResultSink):
+    """record dict 를 그대로 함수에 전달 (서버에 붙여 쓸 때)"""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, record):
+        self.callback(record)
+
+
+class TeeSink(ResultSink):
+    """같은 record 를 여러 sink 에 (예: JSONL + 세션 기록기)"""
+
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+
+    def write(self, record):
+        for sink in self.sinks:
+            sink.write(record)
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+class FilterSink(ResultSink):
+    """keep(record) 가 True 인 record 만 전달 (예: JSONL 에는 시선 구간 이벤트만, 기록기에는 프레임별 시선도)"""
+
+    def __init__(self, sink, keep):
+        self.sink = sink
+        self.keep = keep
+
+    def write(self, record):
+        if self.keep(record):
+            self.sink.write(record)
+
+    def close(self):
+        self.sink.close()
+
+
+def is_frame(record, analyzer):
+    """analyzer 의 프레임별 결과 record 인지"""
+    return record.get("type") == "result" and record.get("analyzer") == analyzer
+
+
+def _to_json(value):
+    # 랜드마크 배열 / numpy 스칼라 (감정 점수 등)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+# -------------------------------
+# 전역 sink (없으면 아무 것도 안 함)
+# -------------------------------
+_sink = None
+
+
+def _as_sink(sink):
+    if sink is None or isinstance(sink, ResultSink):
+        return sink
+    if callable(sink):
+        return CallbackSink(sink)
+    return JsonlSink(sink)
+
+
+def set_sink(sink):
+    """None / JSONL 경로 / 콜백 함수 / ResultSink / 이들의 list (여러 개면 TeeSink)"""
+    global _sink
+    if isinstance(sink, (list, tuple)):
+        sinks = [_as_sink(s) for s in sink if s is not None]
+        _sink = TeeSink(sinks) if len(sinks) > 1 else (sinks[0] if sinks else None)
+    else:
+        _sink = _as_sink(sink)
+    return _sink
+
+
+def make_record(analyzer, seq, ts, data, captured=None):
+    """프레임 1장 분석 결과 record (captured: 프레임 캡처 시각 perf_counter → latency_ms)"""
+    record = {"type": "result", "analyzer": analyzer, "seq": seq, "ts": ts}
+    if captured is not None:
+        record["latency_ms"] = (time.perf_counter() - captured) * 1000.0
+    record.update(data)
+    return record
+
+
+def emit(analyzer, seq, ts, data, captured=None):
+    """프레임 1장 분석 결과 → 전역 sink"""
+    if _sink is None:
+        return
+    _sink.write(make_record(analyzer, seq, ts, data, captured))
+
+
+def emit_report(analyzer, report):
+    """세션 종료 리포트 (최종 점수 / 피드백)"""
+    if _sink is None:
+        return
+    record = {"type": "report", "analyzer": analyzer}
+    record.update(report)
+    _sink.write(record)
+
+
+def emit_event(analyzer, event):
+    """구간 이벤트 1개 (시선 정면 / 이탈 / 깜빡임 시작·끝 — gaze_events.event_record)"""
+    if _sink is None:
+        return
+    record = {"type": "event", "analyzer": analyzer}
+    record.update(event)
+    _sink.write(record)
+
+
+def close_sink():
+    global _sink
+    if _sink is not None:
+        _sink.close()
+        _sink = None
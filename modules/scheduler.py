@@ -0,0 +1,170 @@
+# modules/scheduler.py
+
+import threading
+import time
+from collections import deque
+
+
+# =====================================================
+# ⏱ 분석기별 실행 빈도 + 전체 CPU 예산 스케줄러
+# =====================================================
+class RateScheduler:
+    """
+    분석기마다 목표 fps(또는 프레임 간격 stride)를 두고, 그보다 자주 온 프레임은 건너뛴다.
+    또한 최근 1초 동안 분석기들이 쓴 처리 시간 합이 cpu_budget(초/초, 예: 2.0 = 코어 2개)을
+    넘으면 essential 이 아닌 분석기부터 프레임을 건너뛴다.
+
+    → 무거운 그래프(pose/hands/표정)가 시선(gaze) 샘플링을 굶기지 않도록
+
+    처리 시간은 분석 스레드의 경과 시간(busy time)으로 잰다.
+    MediaPipe 추론은 그래프 내부 스레드에서 돌기 때문에 호출 스레드의 thread_time 에는 잡히지 않는다.
+    """
+
+    WINDOW = 1.0  # 예산 집계 구간(초)
+
+    def __init__(self, cpu_budget=None):
+        self.cpu_budget = cpu_budget
+        self.tasks = {}
+        self._lock = threading.Lock()
+        self._costs = deque()  # (monotonic ts, 처리 시간)
+        self._window_cost = 0.0
+
+    def register(self, name, fps=None, stride=None, essential=False):
+        """
+        fps       : 목표 실행 빈도 (None = 들어오는 프레임마다)
+        stride    : N 프레임마다 1번 (fps 와 같이 주면 둘 다 만족해야 실행)
+        essential : True 면 CPU 예산 초과 시에도 건너뛰지 않음
+        """
+        with self._lock:
+            self.tasks[name] = _Task(name, fps, stride, essential)
+
+    def configure(self, name, fps=None, stride=None):
+        with self._lock:
+            task = self.tasks[name]
+            task.interval = 1.0 / fps if fps else None
+            task.stride = stride
+
+    def config(self, name):
+        """register() 에 다시 넘길 수 있는 설정 dict (프로세스 모드 전달용)"""
+        task = self.tasks[name]
+        return {
+            "fps": (1.0 / task.interval) if task.interval else None,
+            "stride": task.stride,
+            "essential": task.essential,
+        }
+
+    def should_run(self, name, seq, ts=None):
+        """이번 프레임(seq, 소스 시각 ts)을 분석할지 결정"""
+        now = time.monotonic()
+        if ts is None:
+            ts = now
+
+        with self._lock:
+            task = self.tasks.get(name)
+            if task is None:
+                return True
+
+            # 1) 프레임 간격
+            if task.stride and task.last_seq is not None and seq - task.last_seq < task.stride:
+                task.skipped_rate += 1
+                return False
+
+            # 2) 목표 fps (프레임 시각 기준, 반 프레임 정도의 흔들림은 허용)
+            if task.interval and task.next_due is not None and ts + task.interval * 0.25 < task.next_due:
+                task.skipped_rate += 1
+                return False
+
+            # 3) 전체 CPU 예산
+            if self.cpu_budget and not task.essential:
+                self._expire(now)
+                if self._window_cost >= self.cpu_budget * self.WINDOW:
+                    task.skipped_budget += 1
+                    return False
+
+            task.last_seq = seq
+            if task.interval:
+                due = (task.next_due or ts) + task.interval
+                # 많이 밀렸으면 따라잡으려 몰아서 돌리지 않음
+                task.next_due = due if due > ts else ts + task.interval
+            if task.first_run is None:
+                task.first_run = now
+            task.last_run = now
+            return True
+
+    def record(self, name, cost):
+        """분석 1회에 쓴 처리 시간(초) 기록"""
+        now = time.monotonic()
+        with self._lock:
+            task = self.tasks.get(name)
+            if task is not None:
+                task.runs += 1
+                task.cost_total += cost
+            self._costs.append((now, cost))
+            self._window_cost += cost
+            self._expire(now)
+
+    def _expire(self, now):
+        while self._costs and now - self._costs[0][0] > self.WINDOW:
+            self._window_cost -= self._costs.popleft()[1]
+
+    def report(self):
+        """분석기별 목표/달성 fps, 건너뛴 프레임 수, 초당 처리 시간"""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            out = {}
+            for name, task in self.tasks.items():
+                elapsed = (now - task.first_run) if task.first_run is not None else 0.0
+                out[name] = {
+                    "target_fps": (1.0 / task.interval) if task.interval else None,
+                    "stride": task.stride,
+                    "achieved_fps": task.runs / elapsed if elapsed > 0 else 0.0,
+                    "runs": task.runs,
+                    "skipped_rate": task.skipped_rate,
+                    "skipped_budget": task.skipped_budget,
+                    "avg_cost_ms": task.cost_total / task.runs * 1000.0 if task.runs else 0.0,
+                    "cost_per_sec": task.cost_total / elapsed if elapsed > 0 else 0.0,
+                }
+            out["_total"] = {
+                "cpu_budget": self.cpu_budget,
+                "window_cost": self._window_cost,
+            }
+            return out
+
+
+class _Task:
+    def __init__(self, name, fps, stride, essential):
+        self.name = name
+        self.interval = 1.0 / fps if fps else None
+        self.stride = stride
+        self.essential = essential
+
+        self.last_seq = None
+        self.next_due = None
+        self.first_run = None
+        self.last_run = None
+
+        self.runs = 0
+        self.skipped_rate = 0
+        self.skipped_budget = 0
+        self.cost_total = 0.0
+
+
+def print_schedule_report(report):
+    print("⏱ [Scheduler] 분석기별 실행 빈도")
+    for name, r in report.items():
+        if name.startswith("_"):
+            continue
+        target = f"{r['target_fps']:.1f}" if r["target_fps"] else "all"
+        print(
+            f"   {name:<10} target {target:>4} fps | achieved {r['achieved_fps']:5.1f} fps | "
+            f"avg {r['avg_cost_ms']:6.1f} ms | skipped rate {r['skipped_rate']} / budget {r['skipped_budget']}"
+        )
+
+
+# 기본 스케줄: 시선은 매 프레임(예산과 무관), 자세/손 5fps, 표정 2fps
+analyzer_scheduler = RateScheduler()
+analyzer_scheduler.register("gaze", essential=True)
+analyzer_scheduler.register("pose", fps=5)
+analyzer_scheduler.register("hands", fps=5)
+analyzer_scheduler.register("expression", fps=2)
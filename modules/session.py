@@ -0,0 +1,378 @@
+# modules/session.py
+"""
+멀티 세션 호스트 — 한 머신에서 면접 여러 개를 동시에 분석
+
+단일 모드(main.py)는 카메라 1개 / 분석 스레드 4개 / 모듈 전역 결과 슬롯 구조라
+면접 1개만 돌릴 수 있다. 여기서는
+
+  Session      : 프레임 소스 + 분석기(자기 MediaPipe 그래프 / 안정화 버퍼 / 시선 누적값)
+                 + 얼굴 ROI + 스케줄러 + 결과 슬롯 + 지연 히스토그램을 세션마다 따로 소유
+  SessionHost  : 세션마다 프레임을 읽는 가벼운 feeder 스레드 1개 +
+                 모든 세션이 같이 쓰는 고정 크기 분석 워커 풀
+
+분석기는 (세션, 분석기) 마다 동시에 1개만 돈다 (MediaPipe 그래프 / 누적 상태는 스레드 안전하지 않음).
+이전 프레임을 아직 처리 중이면
+  - 실시간 소스 (카메라 / fps 지정) : 새 프레임은 그 분석기에서 건너뜀 (busy drop)
+  - 파일 소스 (최대 속도)           : feeder 가 기다림 (lockstep 처럼 드롭 없음)
+→ 풀 대기열 길이는 세션 수 × 분석기 수를 넘지 않는다.
+
+실행: python -m modules.session a.mp4 b.mp4 --workers 4 --sink sessions.jsonl
+"""
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.analyzer_steps import ANALYZERS, STEPS, frame_record
+from modules.camera.frame_source import FrameSource, open_source
+from modules.camera.frame_views import FrameViews
+from modules.face_roi import FaceROITracker
+from modules.gaze.gaze_events import GazeEventLog, GazeEventSegmenter, event_record
+from modules.latency import FrameStamp, LatencyTracker
+from modules.latest_slot import LatestSlot
+from modules.scheduler import RateScheduler
+import modules.result_sink as result_sink
+from modules.recorder import RecorderSink
+
+# 단일 모드 기본 스케줄과 동일: 시선은 매 프레임, 자세/손 5fps, 표정 2fps
+DEFAULT_SCHEDULE = {
+    "gaze": {"essential": True},
+    "pose": {"fps": 5},
+    "hands": {"fps": 5},
+    "expression": {"fps": 2},
+}
+
+# 헤드리스 호스트에는 'c' 키가 없음 → 첫 프레임 후 이만큼 뒤 시선 자동 보정 (안 하면 시선 점수 측정이 시작되지 않음)
+DEFAULT_CALIBRATE_AFTER = 1.0
+
+
+# =====================================================
+# 🎙 면접 세션 1개
+# =====================================================
+class Session:
+    def __init__(self, session_id, source, analyzers=ANALYZERS, emotion_detector=None,
+                 face_roi=True, calibrate_after=None, fps=None, loop=False, schedule=None, sink=None,
+                 gaze_frames=False):
+        """
+        source   : 동영상 경로 / 이미지 폴더 / 카메라 번호 / FrameSource
+        fps      : 이 속도로 읽음 (실시간 스트림 흉내, ts 도 fps 기준). None = 소스 그대로 최대 속도
+        loop     : 파일 소스가 끝나면 처음부터 다시 (부하 테스트용, 경로로 준 소스만)
+        schedule : {분석기: RateScheduler.register() 인자} (기본 DEFAULT_SCHEDULE)
+        sink     : ResultSink — record 에 "session" 필드가 붙음
+        gaze_frames : sink 에 프레임별 시선 전체 결과도 기록 (기본: 시선은 구간 이벤트 + 리포트만)
+        """
+        self.id = session_id
+        self._spec = source
+        self.source = open_source(source)
+        self.fps = fps
+        self.realtime = bool(fps) or self.source.realtime
+        self.loop = loop and not isinstance(source, FrameSource)
+        self.sink = sink
+
+        self.scheduler = RateScheduler()
+        schedule = schedule or DEFAULT_SCHEDULE
+        for name in analyzers:
+            self.scheduler.register(name, **schedule.get(name, {}))
+
+        # gaze 가 찾은 얼굴 박스를 같은 세션의 expression 이 재사용
+        self.face_roi = FaceROITracker()
+        self.face_roi.enabled = face_roi
+        kwargs = {
+            "gaze": {"face_roi": face_roi, "calibrate_after": calibrate_after, "roi": self.face_roi,
+                     "frames": gaze_frames},
+            "expression": {"emotion_detector": emotion_detector, "roi": self.face_roi,
+                           "tmp_path": f"exp_tmp_{session_id}.jpg"},
+        }
+        self.steps = {name: STEPS[name](**kwargs.get(name, {})) for name in analyzers}
+        self.slots = {name: LatestSlot(f"{session_id}/{name}") for name in analyzers}
+        self.latency = LatencyTracker()
+
+        # 시선 구간 이벤트 (정면 / 이탈 / 깜빡임) — 세션마다 따로, sink 로도 보냄
+        self.events = GazeEventLog()
+        self.gaze_segmenter = GazeEventSegmenter()
+        if sink is not None:
+            self.events.subscribe(self._write_event)
+
+        self.frames = 0
+        self.busy_drops = {name: 0 for name in analyzers}
+        self.errors = 0
+        self.finished = False
+        self.report = None
+        self._busy = set()
+        self._cond = threading.Condition()
+
+    # -------------------------------
+    # 프레임 읽기 (feeder 스레드)
+    # -------------------------------
+    def open(self):
+        return self.source.open()
+
+    def read(self):
+        """다음 프레임 (seq, FrameViews). 소스가 끝났으면 None"""
+        while True:
+            ret, frame, ts = self.source.read()
+            captured = time.perf_counter()
+            if ret:
+                break
+            if not self.source.exhausted:
+                continue  # 카메라 일시적 실패 → 재시도
+            if not self.loop:
+                return None
+            self.source.release()
+            self.source = open_source(self._spec)
+            if not self.source.open():
+                return None
+
+        seq = self.frames
+        self.frames += 1
+        if self.fps:
+            ts = seq / self.fps
+        return seq, FrameViews(frame, ts, captured)
+
+    def dispatch(self, name, seq, views, pool):
+        """스케줄상 돌 차례이고 이전 프레임 분석이 끝났으면 풀에 제출"""
+        with self._cond:
+            if not self.realtime:
+                self._cond.wait_for(lambda: name not in self._busy)
+            if not self.scheduler.should_run(name, seq, views.ts):
+                return False
+            if name in self._busy:
+                # 돌 차례였는데 이전 분석이 아직 안 끝남 → 이 프레임은 버림
+                self.busy_drops[name] += 1
+                return False
+            self._busy.add(name)
+        pool.submit(self._run, name, seq, views)
+        return True
+
+    # -------------------------------
+    # 분석 (풀 워커 스레드)
+    # -------------------------------
+    def _run(self, name, seq, views):
+        started = time.perf_counter()
+        try:
+            with self.latency.clock(name, views.captured) as clock:
+                views.rgb  # 색 변환 (같은 프레임의 다른 분석기와 공유)
+                clock.mark("convert")
+                step = self.steps[name]
+                result = step(views)
+                clock.mark("postprocess")
+                self.scheduler.record(name, time.perf_counter() - started)
+
+                self.slots[name].publish(result, FrameStamp(seq, views.ts, views.captured))
+                record = frame_record(step, result) if self.sink is not None else None
+                if record is not None:
+                    record = result_sink.make_record(name, seq, views.ts, record, views.captured)
+                    record["session"] = self.id
+                    self.sink.write(record)
+                if name == "gaze":
+                    self.events.extend(self.gaze_segmenter.update(result, views.ts, views.captured, seq))
+                clock.mark("publish")
+        except Exception as e:
+            self.errors += 1
+            print(f"❌ [{self.id}] {name} error: {e}")
+        finally:
+            with self._cond:
+                self._busy.discard(name)
+                self._cond.notify_all()
+
+    def _write_event(self, event):
+        self.sink.write({"type": "event", "analyzer": "gaze", "session": self.id, **event_record(event)})
+
+    def wait_idle(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._busy, timeout)
+
+    def finish(self, timeout=10.0):
+        """진행 중인 분석이 끝나길 기다린 뒤 소스 해제 + 시선 최종 리포트"""
+        self.wait_idle(timeout)
+        self.source.release()
+        gaze = self.steps.get("gaze")
+        self.report = gaze.finish() if gaze is not None else None
+        self.events.extend(self.gaze_segmenter.close())
+        if gaze is not None and not self.gaze_calibrated:
+            print(f"⚠️ [{self.id}] 시선 보정이 없어 측정이 시작되지 않음 → 시선 점수는 의미 없음 (calibrate_after 지정)")
+        if self.sink is not None and self.report is not None:
+            self.sink.write({"type": "report", "analyzer": "gaze", "session": self.id, **self.report})
+        self.finished = True
+
+        # 세션별 감정 모델 입력 임시 파일 정리
+        expression = self.steps.get("expression")
+        if expression is not None and os.path.exists(expression.analyzer.tmp_path):
+            os.remove(expression.analyzer.tmp_path)
+        return self.report
+
+    @property
+    def gaze_calibrated(self):
+        """시선 보정(= 측정 시작)이 한 번이라도 됐는지"""
+        gaze = self.steps.get("gaze")
+        return gaze is not None and gaze.session.measuring_started
+
+    def stats(self):
+        schedule = self.scheduler.report()
+        latency = self.latency.percentiles()
+        return {
+            "frames": self.frames,
+            "errors": self.errors,
+            "gaze_calibrated": self.gaze_calibrated,
+            "gaze_events": self.events.summary()["kinds"],
+            "analyzers": {
+                name: {
+                    "achieved_fps": schedule[name]["achieved_fps"],
+                    "runs": schedule[name]["runs"],
+                    "busy_drops": self.busy_drops[name],
+                    "total_p95_ms": latency.get(name, {}).get("total", {}).get("p95"),
+                }
+                for name in self.steps
+            },
+        }
+
+
+# =====================================================
+# 🏠 세션 여러 개 + 공유 워커 풀
+# =====================================================
+class SessionHost:
+    def __init__(self, workers=None, max_sessions=None):
+        """
+        workers      : 분석 워커 스레드 수 (기본: CPU 코어 수). MediaPipe 추론은 GIL 밖에서 돈다
+        max_sessions : 동시에 받을 세션 상한 (넘으면 add() 에서 RuntimeError)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_sessions = max_sessions
+        self.sessions = {}
+        self.stop_token = threading.Event()
+        self._pool = None
+        self._feeders = []
+        self.started = None
+        self.elapsed = 0.0
+
+    def add(self, session):
+        if self.max_sessions is not None and len(self.sessions) >= self.max_sessions:
+            raise RuntimeError(f"session limit reached ({self.max_sessions})")
+        if session.id in self.sessions:
+            raise ValueError(f"duplicate session id: {session.id}")
+        self.sessions[session.id] = session
+        return session
+
+    def start(self):
+        self._pool = ThreadPoolExecutor(self.workers, thread_name_prefix="analyzer")
+        self.started = time.perf_counter()
+        for session in self.sessions.values():
+            t = threading.Thread(target=self._feed, args=(session,), name=f"feeder-{session.id}", daemon=True)
+            t.start()
+            self._feeders.append(t)
+        print(f"🏠 SessionHost: {len(self.sessions)} sessions / {self.workers} workers")
+
+    def _feed(self, session):
+        if not session.open():
+            print(f"❌ [{session.id}] cannot open source")
+            session.finish()
+            return
+
+        interval = 1.0 / session.fps if session.fps else 0.0
+        next_due = time.perf_counter()
+        while not self.stop_token.is_set():
+            # 실시간 스트림 흉내: fps 간격으로 읽음 (밀렸으면 기다리지 않고 바로 다음 프레임)
+            if interval:
+                delay = next_due - time.perf_counter()
+                if delay > 0 and self.stop_token.wait(delay):
+                    break
+                next_due = max(next_due + interval, time.perf_counter() - interval)
+
+            item = session.read()
+            if item is None:
+                break
+            seq, views = item
+            for name in session.steps:
+                session.dispatch(name, seq, views, self._pool)
+
+        session.finish()
+
+    def wait(self, duration=None):
+        """모든 feeder 가 끝나거나 duration 초가 지날 때까지"""
+        deadline = None if duration is None else time.perf_counter() + duration
+        for t in self._feeders:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            t.join(remaining)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+    def stop(self, timeout=10.0):
+        self.stop_token.set()
+        for t in self._feeders:
+            t.join(timeout)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+        self.elapsed = time.perf_counter() - self.started if self.started else 0.0
+
+    def run(self, duration=None):
+        self.start()
+        try:
+            self.wait(duration)
+        finally:
+            self.stop()
+        return self.report()
+
+    def report(self):
+        return {
+            "workers": self.workers,
+            "elapsed": self.elapsed,
+            "sessions": {sid: s.stats() for sid, s in self.sessions.items()},
+        }
+
+
+def print_host_report(report):
+    print(f"🏠 [SessionHost] {len(report['sessions'])} sessions / {report['workers']} workers "
+          f"/ {report['elapsed']:.1f}s")
+    for sid, s in report["sessions"].items():
+        parts = []
+        for name, a in s["analyzers"].items():
+            p95 = f"{a['total_p95_ms']:.0f}ms" if a["total_p95_ms"] is not None else "-"
+            parts.append(f"{name} {a['achieved_fps']:4.1f}fps p95 {p95} drop {a['busy_drops']}")
+        calibrated = "" if s["gaze_calibrated"] else " | ⚠️ gaze 미보정"
+        print(f"   {sid:<10} frames {s['frames']:5d} | " + " | ".join(parts) + calibrated)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 면접 영상 / 스트림을 동시에 분석")
+    parser.add_argument("sources", nargs="+", help="동영상 파일 / 이미지 폴더 / 카메라 번호")
+    parser.add_argument("--workers", type=int, default=None, help="분석 워커 수 (기본: CPU 코어 수)")
+    parser.add_argument("--fps", type=float, default=None, help="소스를 이 속도로 읽음 (실시간 스트림처럼)")
+    parser.add_argument("--duration", type=float, default=None, help="실행 시간 제한(초)")
+    parser.add_argument("--calibrate-after", type=float, default=DEFAULT_CALIBRATE_AFTER, metavar="SEC",
+                        help=f"세션마다 첫 프레임 후 SEC 초 뒤 시선 자동 보정 (기본 {DEFAULT_CALIBRATE_AFTER}, 음수 = 끔)")
+    parser.add_argument("--sink", default=None, metavar="PATH", help="세션별 결과 JSONL")
+    parser.add_argument("--record", default=None, metavar="DIR", help="세션별 열 단위 기록 (DIR/<세션 id>/)")
+    parser.add_argument("--gaze-frames", action="store_true",
+                        help="--sink 에 프레임별 시선 결과도 기록 (기본: 시선 구간 이벤트 + 리포트만, --record 에는 항상 기록)")
+    args = parser.parse_args(argv)
+
+    sink = result_sink.JsonlSink(args.sink) if args.sink else None
+    # 프레임별 시선 결과: 기록기(재채점용)에는 항상, JSONL 에는 --gaze-frames 일 때만
+    gaze_frames = args.gaze_frames or bool(args.record)
+    jsonl = sink
+    if sink is not None and gaze_frames and not args.gaze_frames:
+        jsonl = result_sink.FilterSink(sink, lambda r: not result_sink.is_frame(r, "gaze"))
+    calibrate_after = args.calibrate_after if args.calibrate_after >= 0 else None
+    sinks = [sink] if sink is not None else []
+    host = SessionHost(workers=args.workers)
+    for i, source in enumerate(args.sources):
+        session_sink = sink
+        if args.record:
+            recorder = RecorderSink(os.path.join(args.record, f"s{i}"))
+            sinks.append(recorder)
+            session_sink = result_sink.TeeSink([jsonl, recorder]) if jsonl is not None else recorder
+        host.add(Session(f"s{i}", source, fps=args.fps, sink=session_sink, gaze_frames=gaze_frames,
+                         calibrate_after=calibrate_after))
+
+    try:
+        report = host.run(args.duration)
+    finally:
+        for s in sinks:
+            s.close()
+    print_host_report(report)
+
+
+if __name__ == "__main__":
+    main()
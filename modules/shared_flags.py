@@ -1,2 +1,12 @@
 # modules/shared_flags.py
-RUNNING = True
+from modules.lifecycle import Lifecycle
+
+# 모든 워커가 공유하는 종료 토큰 (threading.Event, set 되면 종료)
+# ⚠️ `from modules.shared_flags import RUNNING` 처럼 값을 복사하면 종료를 못 봄
+#    → `import modules.shared_flags as flags` 후 flags.running() / flags.stop_token 사용
+lifecycle = Lifecycle()
+stop_token = lifecycle.stop_token
+
+
+def running():
+    return not stop_token.is_set()
@@ -0,0 +1,111 @@
+# modules/startup.py
+"""
+시작 단계 측정 + 분석기 warm-up
+
+  import 완료 → 분석기별 warm-up (그래프 생성 + 더미 프레임 1장) → 분석기별 첫 결과
+
+를 프로세스 시작 기준 시각으로 기록해 시작 리포트로 출력한다.
+
+MediaPipe 그래프는 처음 process() 할 때 만들어진다. 그대로 두면 카메라 첫 프레임에서
+분석기마다 그래프 생성 + 모델 로드 비용을 치르고 (스레드 모드는 mediapipe import 도 이때),
+lockstep 이면 가장 느린 분석기를 다른 분석기가 기다린다.
+분석 스레드(프로세스)가 프레임을 구독하기 전에 각자 더미 프레임을 한 번 처리해 두면
+그래프 생성이 분석기마다 동시에 진행되고 (카메라 열기와도 겹침),
+실제 첫 프레임은 추론 비용만 든다.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+T0 = time.perf_counter()  # main.py 가 다른 무거운 import 보다 먼저 import → 시작 기준 시각
+
+# 더미 입력: 검은 화면 → 검출이 없어 분석기 상태(안정화 버퍼, 보정값 등)는 그대로
+DUMMY_FRAME = np.zeros((480, 640, 3), np.uint8)
+DUMMY_FRAME.setflags(write=False)
+
+
+class StartupTracker:
+    """
+    mark(stage)            : 시작 단계 시각 기록 (예: "imports", "warm")
+    warm_up(name, build, warm) : build() 로 분석기 생성 → warm(분석기) 로 더미 프레임 처리
+                             → 소요 시간 / 준비 시각 기록 후 분석기 반환 (warm 실패는 경고만)
+    ready(name, seconds)   : 다른 곳(자식 프로세스)에서 잰 warm-up 결과 기록
+    wait_ready(names, timeout) : names 가 모두 준비될 때까지 대기
+    report(slots)          : 단계별 시각 + 분석기별 warm-up / 첫 결과 시각 (슬롯의 first_published)
+
+    enabled=False 면 warm-up 을 건너뛰고 (첫 프레임이 그래프를 만듦) 준비 시각만 기록
+    """
+
+    def __init__(self, t0=T0):
+        self.t0 = t0
+        self.enabled = True
+        self.marks = {}     # 단계 → 시작 기준 초
+        self.warmups = {}   # 분석기 → {"seconds", "ready", "error"}
+        self._cond = threading.Condition()
+
+    def now(self):
+        return time.perf_counter() - self.t0
+
+    def mark(self, stage):
+        self.marks[stage] = self.now()
+
+    def warm_up(self, name, build, warm):
+        started = time.perf_counter()
+        analyzer = build()
+        error = None
+        if self.enabled:
+            try:
+                warm(analyzer)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                print(f"⚠️ {name} warm-up failed: {error}")
+        self.ready(name, time.perf_counter() - started if self.enabled else None, error)
+        return analyzer
+
+    def ready(self, name, seconds=None, error=None):
+        with self._cond:
+            self.warmups[name] = {"seconds": seconds, "ready": self.now(), "error": error}
+            self._cond.notify_all()
+
+    def wait_ready(self, names, timeout=None):
+        """모두 준비되면 True, timeout 이면 False (분석 스레드가 죽어도 영원히 기다리지 않음)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: all(n in self.warmups for n in names), timeout)
+
+    def report(self, slots=None):
+        slots = slots or {}
+        analyzers = {}
+        for name in sorted(set(self.warmups) | set(slots)):
+            warm = self.warmups.get(name, {})
+            first = getattr(slots.get(name), "first_published", None)
+            analyzers[name] = {
+                "warmup_s": warm.get("seconds"),
+                "ready_s": warm.get("ready"),
+                "first_result_s": None if first is None else first - self.t0,
+                "error": warm.get("error"),
+            }
+        return {"warmup": self.enabled, "marks": dict(self.marks), "analyzers": analyzers}
+
+
+# 앱 전체가 공유하는 시작 측정기
+startup = StartupTracker()
+
+
+def _fmt(seconds):
+    return "      -" if seconds is None else f"{seconds:6.2f}s"
+
+
+def print_startup_report(report):
+    """시작 리포트: 단계별 시각 + 분석기별 warm-up 시간 / 준비 시각 / 첫 결과 시각 (초, 시작 기준)"""
+    print("\n=========== 🚦 시작 리포트 ===========")
+    for stage, at in report["marks"].items():
+        print(f"  {stage:<12} {_fmt(at)}")
+    print(f"  {'analyzer':<12} {'warmup':>7} {'ready':>7} {'first':>7}" + ("" if report["warmup"] else "  (warm-up 끔)"))
+    for name, a in report["analyzers"].items():
+        line = f"  {name:<12} {_fmt(a['warmup_s'])} {_fmt(a['ready_s'])} {_fmt(a['first_result_s'])}"
+        if a["error"]:
+            line += f"  ⚠️ {a['error']}"
+        print(line)
+    print("======================================\n")
@@ -1,11 +1,29 @@
 # stt_google.py
 import os
-from google.cloud import speech
-from dotenv import load_dotenv
 
-load_dotenv()
+_env_loaded = False
+
+
+def _load_env():
+    """.env 는 처음 인식할 때 한 번만 읽음 (import 시점에는 파일 / 네트워크 접근 없음)"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _env_loaded = True
+
+
+def prepare():
+    """음성 스레드 시작 시 미리 import / .env 로드 (첫 인식 지연 줄이기)"""
+    from google.cloud import speech  # noqa: F401
+    _load_env()
+
 
 def google_stt(audio_path):
+    # google-cloud-speech 는 무거워서 처음 호출할 때 import
+    from google.cloud import speech
+
+    _load_env()
     os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
     client = speech.SpeechClient()
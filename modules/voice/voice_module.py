@@ -7,57 +7,76 @@ import time
 # ======================================
 # 🎤 1) 말하면 녹음 시작 → 무음이면 종료
 # ======================================
-def record_until_silence(output_path="temp.wav", rate=16000, silence_limit=1.2):
+def record_until_silence(output_path="temp.wav", rate=16000, silence_limit=1.2, stop_token=None):
+    """
+    stop_token (threading.Event) 이 set 되면 녹음을 중단하고 None 반환
+    (청크(약 64ms)마다 확인 → 종료 요청 시 마이크 / PyAudio 가 바로 해제됨)
+    """
 
     CHUNK = 1024
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
 
     p = pyaudio.PyAudio()
+    stream = None
 
     print("🎤 말하면 녹음 시작...")
 
-    # ⭐ device_index 없음 → Windows 기본 마이크 사용
-    stream = p.open(
-        format=FORMAT,
-        channels=CHANNELS,
-        rate=rate,
-        input=True,
-        frames_per_buffer=CHUNK
-    )
-
     frames = []
     triggered = False
     silence_start = None
+    stopped = False
+
+    try:
+        # ⭐ device_index 없음 → Windows 기본 마이크 사용
+        stream = p.open(
+            format=FORMAT,
+            channels=CHANNELS,
+            rate=rate,
+            input=True,
+            frames_per_buffer=CHUNK
+        )
+
+        while True:
+            if stop_token is not None and stop_token.is_set():
+                stopped = True
+                break
+
+            data = stream.read(CHUNK)
+            frames.append(data)
 
-    while True:
-        data = stream.read(CHUNK)
-        frames.append(data)
+            audio = np.frombuffer(data, dtype=np.int16)
+            vol = np.abs(audio).mean()
 
-        audio = np.frombuffer(data, dtype=np.int16)
-        vol = np.abs(audio).mean()
+            # 🔥 목소리 감지
+            if vol > 200:
+                triggered = True
+                silence_start = None
+            else:
+                if triggered and silence_start is None:
+                    silence_start = time.time()
 
-        # 🔥 목소리 감지
-        if vol > 200:
-            triggered = True
-            silence_start = None
-        else:
-            if triggered and silence_start is None:
-                silence_start = time.time()
+            # 🔥 말 멈춤 감지
+            if triggered and silence_start and time.time() - silence_start > silence_limit:
+                print("🛑 말 멈춤 감지 → 녹음 종료")
+                break
 
-        # 🔥 말 멈춤 감지
-        if triggered and silence_start and time.time() - silence_start > silence_limit:
-            print("🛑 말 멈춤 감지 → 녹음 종료")
-            break
+        sample_width = p.get_sample_size(FORMAT)
+    finally:
+        # 정상 종료 / 중단 / 예외 모두 장치 해제
+        if stream is not None:
+            stream.stop_stream()
+            stream.close()
+        p.terminate()
 
-    stream.stop_stream()
-    stream.close()
-    p.terminate()
+    if stopped:
+        print("🛑 종료 요청 → 녹음 중단")
+        return None
 
     # WAV 저장
     wf = wave.open(output_path, "wb")
     wf.setnchannels(CHANNELS)
-    wf.setsampwidth(p.get_sample_size(pyaudio.paInt16))
+    wf.setsampwidth(sample_width)
     wf.setframerate(rate)
     wf.writeframes(b"".join(frames))
     wf.close()
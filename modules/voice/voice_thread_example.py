@@ -1,7 +1,6 @@
 # voice_thread_example.py — DEFAULT MIC VERSION (최종)
 
 import threading
-import queue
 import time
 import numpy as np
 import traceback
@@ -11,30 +10,39 @@ from modules.voice.voice_module import (
     record_until_silence,
     preprocess_audio,
 )
-from modules.voice.stt_google import google_stt
-from modules.shared_flags import RUNNING
+from modules.voice.stt_google import google_stt, prepare as prepare_stt
+import modules.shared_flags as flags
+import modules.result_sink as result_sink
+from modules.latest_slot import LatestSlot
+from modules.latency import latency_tracker
+from modules.startup import startup
 
-voice_result_queue = queue.Queue(maxsize=5)
+voice_result_slot = LatestSlot("voice")
 
 
 # ======================================
 # 🎤 Voice Thread Worker
 # ======================================
 def voice_worker(rate=16000):
+    # STT 클라이언트 라이브러리 import / .env 로드를 첫 녹음 전에 (실패하면 첫 인식 때 다시 시도)
+    startup.warm_up("voice", lambda: None, lambda _: prepare_stt())
     print("🎧 Voice Thread Started")
     print("🎤 기본 마이크(Default Input Device) 사용")
 
-    while RUNNING:
+    while flags.running():
         try:
             print("\n🎤 말하면 녹음 시작...")
 
             audio_path = record_until_silence(
                 output_path="temp.wav",
                 rate=rate,
-                silence_limit=1.2
+                silence_limit=1.2,
+                stop_token=flags.stop_token
             )
 
             if audio_path is None:
+                if not flags.running():
+                    break
                 print("❌ 녹음 실패 — 다음 반복")
                 continue
 
@@ -47,7 +55,9 @@ def voice_worker(rate=16000):
 
             # STT
             print("⏳ STT 처리 중...")
+            started = time.perf_counter()
             text = google_stt(audio_path) or "(음성 없음)"
+            latency_tracker.record("voice", "stt", time.perf_counter() - started)  # STT 왕복 시간
 
             print(f"\n[🎤 Voice Recognized]\n>> {text}")
 
@@ -57,10 +67,8 @@ def voice_worker(rate=16000):
                 "timestamp": time.time()
             }
 
-            if voice_result_queue.full():
-                voice_result_queue.get_nowait()
-
-            voice_result_queue.put(result)
+            voice_result_slot.publish(result)
+            result_sink.emit("voice", None, result["timestamp"], result)
 
         except Exception as e:
             print("❌ Voice Thread Error:", e)
@@ -73,5 +81,6 @@ def voice_worker(rate=16000):
 def start_voice_thread():
     t = threading.Thread(target=voice_worker, daemon=True)
     t.start()
+    flags.lifecycle.add_thread("voice", t)  # 종료 시 타임아웃 join
     print("🚀 voice_thread_example 실행됨!")
     return t